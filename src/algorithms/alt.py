@@ -0,0 +1,207 @@
+import heapq
+import json
+import random
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+from src.algorithms.dijkstra import dijkstra, _trace_path
+
+INF = float('inf')
+SELECTIONS = ("farthest", "avoid")
+
+
+class LandmarkTable:
+    """
+    Precomputed ALT data: for every landmark L, forward[i][v] = d(L, v) and
+    backward[i][v] = d(v, L), indexed by vertex (index 0 unused).
+    """
+
+    def __init__(self, num_vertices: int, landmarks: List[int],
+                 forward: List[Sequence[float]], backward: List[Sequence[float]]):
+        self.num_vertices = num_vertices
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+
+    def lower_bound(self, v: int, t: int) -> float:
+        # Triangle inequality bounds on d(v, t); INF means v cannot reach t
+        best = 0
+        for fwd, bwd in zip(self.forward, self.backward):
+            from_l_to_t, from_l_to_v = fwd[t], fwd[v]
+            if from_l_to_t != INF:
+                if from_l_to_v != INF and from_l_to_t - from_l_to_v > best:
+                    best = from_l_to_t - from_l_to_v
+            elif from_l_to_v != INF:
+                return INF  # L reaches v but not t, so v cannot reach t
+
+            from_v_to_l, from_t_to_l = bwd[v], bwd[t]
+            if from_t_to_l != INF:
+                if from_v_to_l == INF:
+                    return INF  # t reaches L but v does not, so v cannot reach t
+                if from_v_to_l - from_t_to_l > best:
+                    best = from_v_to_l - from_t_to_l
+        return best
+
+
+def preprocess_landmarks(graph, k: int = 8, selection: str = "farthest",
+                         seed: Optional[int] = None) -> LandmarkTable:
+    """
+    Pick k landmarks and store Dijkstra distances from and to each of them.
+
+    selection="farthest" repeatedly adds the vertex farthest from the chosen
+    landmarks; selection="avoid" grows a shortest-path tree from a random root
+    and walks into the subtree whose distances the current landmarks bound
+    worst (Goldberg-Werneck). Weights must be non-negative.
+    """
+    if selection not in SELECTIONS:
+        raise ValueError(f"Unknown landmark selection: {selection!r} (expected one of {SELECTIONS})")
+
+    n = graph.num_vertices
+    rng = random.Random(seed)
+    reverse = graph.reversed()
+    table = LandmarkTable(n, [], [], [])
+
+    for _ in range(min(k, n)):
+        if selection == "avoid" and table.landmarks:
+            landmark = _avoid_landmark(graph, table, rng)
+        else:
+            landmark = _farthest_landmark(graph, table, rng)
+        if landmark is None:
+            break
+        table.landmarks.append(landmark)
+        table.forward.append(_distance_array(dijkstra(graph, landmark)[0], n))
+        table.backward.append(_distance_array(dijkstra(reverse, landmark)[0], n))
+
+    return table
+
+
+def alt_query(graph, table: LandmarkTable, source: int, target: int) -> Tuple[float, List[int], int]:
+    """
+    A* search guided by the landmark lower bounds.
+
+    Returns (distance, path, settled) like dijkstra.shortest_path.
+    """
+    if source == target:
+        return 0, [source], 0
+
+    start_bound = table.lower_bound(source, target)
+    if start_bound == INF:
+        return INF, [], 0
+
+    distances = {source: 0}
+    parents = {source: None}
+    bounds = {source: start_bound}
+    pq = [(start_bound, source)]
+    settled = set()
+
+    while pq:
+        _, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        settled.add(u)
+
+        if u == target:
+            return distances[u], _trace_path(parents, target), len(settled)
+
+        current_dist = distances[u]
+        for v, weight in graph.neighbors(u):
+            new_dist = current_dist + weight
+            if v not in settled and new_dist < distances.get(v, INF):
+                if v not in bounds:
+                    bounds[v] = table.lower_bound(v, target)
+                if bounds[v] == INF:
+                    continue
+                distances[v] = new_dist
+                parents[v] = u
+                heapq.heappush(pq, (new_dist + bounds[v], v))
+
+    return INF, [], len(settled)
+
+
+def save_landmarks(table: LandmarkTable, filename: str) -> None:
+    # One JSON header line, then the forward and backward float64 arrays
+    with open(filename, 'wb') as f:
+        header = {"num_vertices": table.num_vertices, "landmarks": table.landmarks}
+        f.write(json.dumps(header).encode() + b"\n")
+        for distances in table.forward + table.backward:
+            array('d', distances).tofile(f)
+
+
+def load_landmarks(filename: str) -> LandmarkTable:
+    with open(filename, 'rb') as f:
+        header = json.loads(f.readline())
+        n = header["num_vertices"]
+        landmarks = header["landmarks"]
+        arrays = []
+        for _ in range(2 * len(landmarks)):
+            distances = array('d')
+            distances.fromfile(f, n + 1)
+            arrays.append(distances)
+
+    return LandmarkTable(n, landmarks, arrays[:len(landmarks)], arrays[len(landmarks):])
+
+
+def _distance_array(distances: dict, n: int) -> array:
+    values = array('d', [INF]) * (n + 1)
+    for v, d in distances.items():
+        values[v] = d
+    return values
+
+
+def _farthest_landmark(graph, table: LandmarkTable, rng: random.Random) -> Optional[int]:
+    n = graph.num_vertices
+    if not table.landmarks:
+        # Start from the vertex farthest from a random one
+        start = rng.randint(1, n)
+        distances, _ = dijkstra(graph, start)
+        reachable = [v for v in graph.vertices if distances[v] != INF]
+        return max(reachable, key=lambda v: distances[v])
+
+    chosen = set(table.landmarks)
+    best, best_score = None, -1
+    for v in graph.vertices:
+        if v in chosen:
+            continue
+        # Vertices no landmark reaches score INF and are picked first
+        score = min(min(fwd[v], bwd[v]) for fwd, bwd in zip(table.forward, table.backward))
+        if score > best_score:
+            best, best_score = v, score
+    return best
+
+
+def _avoid_landmark(graph, table: LandmarkTable, rng: random.Random) -> Optional[int]:
+    root = rng.randint(1, graph.num_vertices)
+    distances, _ = dijkstra(graph, root)
+
+    # Shortest-path tree recovered from the distances: u is a parent of v
+    # when the edge (u, v) is tight
+    children = {}
+    has_parent = {root}
+    for u, v, weight in graph.edges:
+        if v not in has_parent and distances[u] != INF and distances[u] + weight == distances[v]:
+            has_parent.add(v)
+            children.setdefault(u, []).append(v)
+
+    order = [root]
+    for u in order:
+        order.extend(children.get(u, ()))
+
+    # size(v): sum of (distance - landmark lower bound) over v's subtree, or 0
+    # if the subtree already contains a landmark
+    landmarks = set(table.landmarks)
+    size = {}
+    covered = set()
+    for v in reversed(order):
+        kids = children.get(v, ())
+        if v in landmarks or any(c in covered for c in kids):
+            covered.add(v)
+            size[v] = 0
+            continue
+        size[v] = distances[v] - table.lower_bound(root, v) + sum(size[c] for c in kids)
+
+    vertex = max(order, key=lambda v: size[v])
+    if size[vertex] <= 0:
+        return _farthest_landmark(graph, table, rng)
+    while children.get(vertex):
+        vertex = max(children[vertex], key=lambda c: size[c])
+    return vertex
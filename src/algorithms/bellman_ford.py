@@ -1,19 +1,45 @@
-from typing import Dict, Tuple
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.graph_utils import CompactGraph, edge_arrays
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only strategy="numpy" needs it
+    np = None
 
 INF = float('inf')
+STRATEGIES = ("classic", "spfa", "yen", "numpy")
 
 
-def bellman_ford(graph, source: int) -> Tuple[Dict[int, float], int, bool]:
+def bellman_ford(graph, source: int, strategy: str = "classic") -> Tuple[Dict[int, float], int, bool]:
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown Bellman-Ford strategy: {strategy!r} (expected one of {STRATEGIES})")
+    if strategy == "numpy":
+        return _bellman_ford_numpy(graph, source)
+    if strategy != "classic":
+        dist = [INF] * (graph.num_vertices + 1)
+        dist[source] = 0
+        relax = spfa_relax if strategy == "spfa" else yen_relax
+        relaxations, has_negative_cycle = relax(graph, dist, [source])
+        return {v: dist[v] for v in graph.vertices}, relaxations, has_negative_cycle
+    
+    if isinstance(graph, CompactGraph):
+        return _bellman_ford_csr(graph, source)
+    
     distances = {i: INF for i in graph.vertices}
     distances[source] = 0
     relaxations = 0
     
-    # Relax edges V-1 times
+    # Relax edges V-1 times, or until a pass changes nothing
     for _ in range(graph.num_vertices - 1):
+        changed = False
         for u, v, weight in graph.edges:
             if distances[u] != INF and distances[u] + weight < distances[v]:
                 distances[v] = distances[u] + weight
                 relaxations += 1
+                changed = True
+        if not changed:
+            break
     
     # Check for negative cycles
     has_negative_cycle = False
@@ -25,6 +51,239 @@ def bellman_ford(graph, source: int) -> Tuple[Dict[int, float], int, bool]:
     return distances, relaxations, has_negative_cycle
 
 
+def _bellman_ford_csr(graph, source: int) -> Tuple[Dict[int, float], int, bool]:
+    # Same passes as bellman_ford, but edges are scanned per source vertex
+    # so unreachable vertices skip their whole out-edge range.
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * (graph.num_vertices + 1)
+    dist[source] = 0
+    relaxations = 0
+    
+    for _ in range(graph.num_vertices - 1):
+        changed = False
+        for u in graph.vertices:
+            du = dist[u]
+            if du == INF:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if du + weights[i] < dist[v]:
+                    dist[v] = du + weights[i]
+                    relaxations += 1
+                    changed = True
+        if not changed:
+            break
+    
+    has_negative_cycle = False
+    for u in graph.vertices:
+        du = dist[u]
+        if du == INF:
+            continue
+        for i in range(offsets[u], offsets[u + 1]):
+            if du + weights[i] < dist[targets[i]]:
+                has_negative_cycle = True
+                break
+        if has_negative_cycle:
+            break
+    
+    distances = {v: dist[v] for v in graph.vertices}
+    return distances, relaxations, has_negative_cycle
+
+
+def _bellman_ford_numpy(graph, source: int) -> Tuple[Dict[int, float], int, bool]:
+    # Each pass is one gather (dist[src] + w) and one segmented min over the
+    # edges grouped by target, instead of a Python loop over edge tuples.
+    # Passes use the previous pass's distances (Jacobi style), which still
+    # converges within V-1 passes. Relaxations count improved vertices per pass.
+    if np is None:
+        raise ImportError("NumPy is required for the numpy Bellman-Ford strategy")
+    
+    src, targets, weights, starts = graph.cached('edge_arrays_by_target', lambda: _group_by_target(graph))
+    dist = np.full(graph.num_vertices + 1, INF)
+    dist[source] = 0
+    relaxations = 0
+    has_negative_cycle = False
+    
+    if len(src):
+        # The extra pass plays the role of the negative-cycle check
+        for pass_number in range(graph.num_vertices):
+            candidate = np.minimum.reduceat(dist[src] + weights, starts)
+            improved = candidate < dist[targets]
+            count = int(np.count_nonzero(improved))
+            if count == 0:
+                break
+            if pass_number == graph.num_vertices - 1:
+                has_negative_cycle = True
+                break
+            dist[targets[improved]] = candidate[improved]
+            relaxations += count
+    
+    values = dist.tolist()
+    return {v: values[v] for v in graph.vertices}, relaxations, has_negative_cycle
+
+
+def _group_by_target(graph) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+    # Edges sorted by target, plus the distinct targets and where each
+    # target's run starts (the segments for np.minimum.reduceat)
+    src, dst, weights = edge_arrays(graph)
+    order = np.argsort(dst, kind='stable')
+    dst_sorted = dst[order]
+    starts = np.flatnonzero(np.r_[True, dst_sorted[1:] != dst_sorted[:-1]]) if len(dst) else dst_sorted
+    return src[order], dst_sorted[starts], weights[order], starts
+
+
+def spfa_relax(graph, dist: List[float], sources: Iterable[int]) -> Tuple[int, bool]:
+    """
+    Queue-driven Bellman-Ford (SPFA) that improves dist in place.
+    
+    Only vertices whose distance changed are queued, and the run ends as soon
+    as the queue drains. A vertex reached by a path of num_vertices edges
+    proves a negative cycle. Seeding several sources (e.g. every vertex at 0)
+    simulates a virtual super-source. Returns (relaxations, has_negative_cycle).
+    """
+    n = graph.num_vertices
+    queue = deque(sources)
+    in_queue = bytearray(n + 1)
+    path_edges = [0] * (n + 1)
+    for u in queue:
+        in_queue[u] = 1
+    relaxations = 0
+    
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        du = dist[u]
+        for v, weight in graph.neighbors(u):
+            if du + weight < dist[v]:
+                dist[v] = du + weight
+                relaxations += 1
+                path_edges[v] = path_edges[u] + 1
+                if path_edges[v] >= n:
+                    return relaxations, True
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    queue.append(v)
+    
+    return relaxations, False
+
+
+def yen_relax(graph, dist: List[float], sources: Iterable[int]) -> Tuple[int, bool]:
+    """
+    Bellman-Ford with Yen's ordering, improving dist in place.
+    
+    Each pass sweeps vertices upwards relaxing edges u -> v with v >= u, then
+    downwards relaxing v < u, and only scans vertices whose distance changed
+    since their last scan. ceil(V/2) passes settle every simple path, so a
+    change in the pass after that proves a negative cycle; the run stops at the
+    first pass without relaxations. Returns (relaxations, has_negative_cycle).
+    """
+    n = graph.num_vertices
+    pending_up = bytearray(n + 1)
+    pending_down = bytearray(n + 1)
+    for u in sources:
+        pending_up[u] = pending_down[u] = 1
+    relaxations = 0
+    max_passes = (n + 1) // 2
+    
+    for pass_number in range(max_passes + 1):
+        before = relaxations
+        for u in range(1, n + 1):
+            if pending_up[u]:
+                pending_up[u] = 0
+                du = dist[u]
+                for v, weight in graph.neighbors(u):
+                    if v >= u and du + weight < dist[v]:
+                        dist[v] = du + weight
+                        relaxations += 1
+                        pending_up[v] = pending_down[v] = 1
+        for u in range(n, 0, -1):
+            if pending_down[u]:
+                pending_down[u] = 0
+                du = dist[u]
+                for v, weight in graph.neighbors(u):
+                    if v < u and du + weight < dist[v]:
+                        dist[v] = du + weight
+                        relaxations += 1
+                        pending_up[v] = pending_down[v] = 1
+        if relaxations == before:
+            return relaxations, False
+    
+    return relaxations, True
+
+
+def find_negative_cycle(graph) -> Optional[List[int]]:
+    """
+    Negative cycle anywhere in graph, or None if there is none.
+    
+    Every vertex starts at distance 0, as if a virtual super-source had an
+    edge to each, and SPFA relaxes from there. The parent pointers are kept
+    as a tree in preorder (Tarjan's subtree disassembly): when dist[v]
+    drops, v's old subtree is cut out and its vertices skip their next
+    scan, since their labels are stale until v is rescanned. If the edge
+    u -> v that lowers v starts inside v's subtree, the tree path v .. u
+    closes a negative cycle and the search stops there. Returns the cycle
+    as [c0, c1, ..., ck] with edges c0 -> c1 -> ... -> ck -> c0.
+    """
+    n = graph.num_vertices
+    dist = [0] * (n + 1)
+    parent = [0] * (n + 1)  # 0 is the virtual source
+    # Tree in preorder as a doubly linked list rooted at 0, with depths
+    nxt = list(range(1, n + 2))
+    nxt[n] = 0
+    prv = [n] + list(range(n))
+    depth = [1] * (n + 1)
+    depth[0] = 0
+    in_tree = bytearray(b'\x01') * (n + 1)
+    in_queue = bytearray(b'\x01') * (n + 1)
+    queue = deque(range(1, n + 1))
+    
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        if not in_tree[u]:
+            continue
+        du = dist[u]
+        for v, weight in graph.neighbors(u):
+            if du + weight >= dist[v]:
+                continue
+            dist[v] = du + weight
+            
+            if in_tree[v]:
+                # Cut v's subtree; finding u in it closes a cycle through v
+                if v == u:
+                    return [v]
+                d = depth[v]
+                x = nxt[v]
+                while depth[x] > d:
+                    if x == u:
+                        cycle = [u]
+                        while cycle[-1] != v:
+                            cycle.append(parent[cycle[-1]])
+                        cycle.reverse()
+                        return cycle
+                    in_tree[x] = 0
+                    x = nxt[x]
+                after = x
+                before = prv[v]
+                nxt[before] = after
+                prv[after] = before
+            
+            # Hang v directly below u
+            parent[v] = u
+            depth[v] = depth[u] + 1
+            in_tree[v] = 1
+            after = nxt[u]
+            nxt[u] = v
+            prv[v] = u
+            nxt[v] = after
+            prv[after] = v
+            if not in_queue[v]:
+                in_queue[v] = 1
+                queue.append(v)
+    
+    return None
+
+
 def print_distances(distances: Dict[int, float], source: int, has_negative_cycle: bool = False) -> None:
     print(f"\nShortest Paths from Source {source} (Bellman-Ford):")
     
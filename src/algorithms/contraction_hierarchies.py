@@ -0,0 +1,216 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+INF = float('inf')
+
+
+class ContractionHierarchy:
+    """
+    Result of contracting a graph: a rank per vertex plus the upward edges.
+
+    up_out[u] holds (v, weight) for edges u -> v with rank[v] > rank[u] and
+    up_in[v] holds (u, weight) for edges u -> v with rank[u] > rank[v]; both
+    include shortcuts. middle[(u, v)] is the contracted vertex a shortcut
+    u -> v bypasses, used to unpack paths.
+    """
+
+    def __init__(self, num_vertices: int):
+        self.num_vertices = num_vertices
+        self.rank = [0] * (num_vertices + 1)
+        self.up_out: List[List[Tuple[int, float]]] = [[] for _ in range(num_vertices + 1)]
+        self.up_in: List[List[Tuple[int, float]]] = [[] for _ in range(num_vertices + 1)]
+        self.middle: Dict[Tuple[int, int], int] = {}
+        self.shortcuts = 0
+
+
+def build_contraction_hierarchy(graph, witness_settle_limit: int = 60) -> ContractionHierarchy:
+    """
+    Contract every vertex in edge-difference order (with lazy updates).
+
+    A shortcut u -> w is added when contracting v unless a witness search
+    from u, limited to witness_settle_limit settled vertices, finds a path no
+    longer than u -> v -> w. A smaller limit preprocesses faster but adds
+    more shortcuts; queries stay exact either way. Weights must be
+    non-negative.
+    """
+    n = graph.num_vertices
+    out: List[Dict[int, float]] = [{} for _ in range(n + 1)]
+    inn: List[Dict[int, float]] = [{} for _ in range(n + 1)]
+    for u, v, weight in graph.edges:
+        if weight < 0:
+            raise ValueError("Contraction hierarchies require non-negative edge weights")
+        if u != v and weight < out[u].get(v, INF):
+            out[u][v] = weight
+            inn[v][u] = weight
+
+    hierarchy = ContractionHierarchy(n)
+    contracted = [False] * (n + 1)
+    deleted_neighbors = [0] * (n + 1)
+
+    def priority(v: int, shortcuts: list) -> int:
+        return len(shortcuts) - len(out[v]) - len(inn[v]) + deleted_neighbors[v]
+
+    queue = []
+    for v in graph.vertices:
+        queue.append((priority(v, _needed_shortcuts(v, out, inn, witness_settle_limit)), v))
+    heapq.heapify(queue)
+
+    order = 0
+    while queue:
+        _, v = heapq.heappop(queue)
+        if contracted[v]:
+            continue
+
+        # Lazy update: re-evaluate and put back if no longer the minimum
+        shortcuts = _needed_shortcuts(v, out, inn, witness_settle_limit)
+        current = priority(v, shortcuts)
+        if queue and current > queue[0][0]:
+            heapq.heappush(queue, (current, v))
+            continue
+
+        order += 1
+        hierarchy.rank[v] = order
+        contracted[v] = True
+        hierarchy.up_out[v] = list(out[v].items())
+        hierarchy.up_in[v] = list(inn[v].items())
+
+        for u, w, weight in shortcuts:
+            if weight < out[u].get(w, INF):
+                out[u][w] = weight
+                inn[w][u] = weight
+                hierarchy.middle[(u, w)] = v
+                hierarchy.shortcuts += 1
+
+        # Remove v from the remaining overlay graph
+        for w in out[v]:
+            del inn[w][v]
+            deleted_neighbors[w] += 1
+        for u in inn[v]:
+            del out[u][v]
+            deleted_neighbors[u] += 1
+        out[v] = {}
+        inn[v] = {}
+
+    return hierarchy
+
+
+def ch_query(hierarchy: ContractionHierarchy, source: int, target: int) -> Tuple[float, List[int], int]:
+    """
+    Upward bidirectional Dijkstra over the hierarchy.
+
+    Returns (distance, path, settled) like dijkstra.shortest_path, with
+    shortcuts unpacked back into original edges.
+    """
+    if source == target:
+        return 0, [source], 0
+
+    edges = (hierarchy.up_out, hierarchy.up_in)
+    distances = ({source: 0}, {target: 0})
+    parents = ({source: None}, {target: None})
+    queues = ([(0, source)], [(0, target)])
+    settled = (set(), set())
+    best = INF
+    meeting = None
+
+    while queues[0] or queues[1]:
+        for side in (0, 1):
+            queue = queues[side]
+            if not queue:
+                continue
+            # A direction stops once its minimum cannot improve the best meeting
+            if queue[0][0] >= best:
+                queue.clear()
+                continue
+            current_dist, u = heapq.heappop(queue)
+            if u in settled[side]:
+                continue
+            settled[side].add(u)
+
+            other = distances[1 - side].get(u)
+            if other is not None and current_dist + other < best:
+                best = current_dist + other
+                meeting = u
+
+            for v, weight in edges[side][u]:
+                new_dist = current_dist + weight
+                if new_dist < distances[side].get(v, INF):
+                    distances[side][v] = new_dist
+                    parents[side][v] = u
+                    heapq.heappush(queue, (new_dist, v))
+
+    count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return INF, [], count
+
+    forward = _parent_chain(parents[0], meeting)[::-1]
+    backward = _parent_chain(parents[1], meeting)
+    path = [source]
+    for u, v in zip(forward, forward[1:]):
+        path.extend(_unpack(hierarchy, u, v))
+    for u, v in zip(backward, backward[1:]):
+        path.extend(_unpack(hierarchy, u, v))
+    return best, path, count
+
+
+def _needed_shortcuts(v: int, out: List[Dict[int, float]], inn: List[Dict[int, float]],
+                      settle_limit: int) -> List[Tuple[int, int, float]]:
+    # Shortcuts (u, w, weight) that contracting v would require
+    shortcuts = []
+    if not out[v]:
+        return shortcuts
+    max_out = max(out[v].values())
+
+    for u, weight_in in inn[v].items():
+        targets = {w: weight_in + weight_out for w, weight_out in out[v].items() if w != u}
+        if not targets:
+            continue
+        witness = _witness_search(u, v, out, weight_in + max_out, set(targets), settle_limit)
+        for w, via_v in targets.items():
+            if witness.get(w, INF) > via_v:
+                shortcuts.append((u, w, via_v))
+
+    return shortcuts
+
+
+def _witness_search(source: int, avoid: int, out: List[Dict[int, float]], limit: float,
+                    targets: set, settle_limit: int) -> Dict[int, float]:
+    # Bounded Dijkstra from source that never enters avoid
+    distances = {source: 0}
+    pq = [(0, source)]
+    settled = set()
+    remaining = len(targets)
+
+    while pq and len(settled) < settle_limit:
+        current_dist, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        if current_dist > limit:
+            break
+        settled.add(u)
+        if u in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+        for v, weight in out[u].items():
+            new_dist = current_dist + weight
+            if v != avoid and new_dist < distances.get(v, INF):
+                distances[v] = new_dist
+                heapq.heappush(pq, (new_dist, v))
+
+    return distances
+
+
+def _parent_chain(parents: Dict[int, Optional[int]], vertex: int) -> List[int]:
+    chain = []
+    while vertex is not None:
+        chain.append(vertex)
+        vertex = parents[vertex]
+    return chain
+
+
+def _unpack(hierarchy: ContractionHierarchy, u: int, v: int) -> List[int]:
+    # Vertices after u on the original path of edge u -> v
+    middle = hierarchy.middle.get((u, v))
+    if middle is None:
+        return [v]
+    return _unpack(hierarchy, u, middle) + _unpack(hierarchy, middle, v)
@@ -0,0 +1,177 @@
+import heapq
+from typing import Dict, Optional, Tuple
+
+from src.graph_utils import edge_arrays
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it the pure-Python engine runs
+    np = None
+
+INF = float('inf')
+
+
+def choose_delta(graph) -> float:
+    """
+    Bucket width heuristic: the largest edge weight divided by the average
+    out-degree (Meyer & Sanders' Delta = Theta(1/d) for weights in [0, 1]),
+    but never below the smallest positive weight.
+    """
+    weights = [w for _, _, w in graph.edges]
+    positive = [w for w in weights if w > 0]
+    if not positive:
+        return 1.0
+    average_degree = max(1.0, len(weights) / max(1, graph.num_vertices))
+    return max(min(positive), max(positive) / average_degree)
+
+
+def delta_stepping(graph, source: int, delta: Optional[float] = None,
+                   engine: Optional[str] = None) -> Tuple[Dict[int, float], int]:
+    """
+    Delta-stepping single-source shortest paths.
+
+    Tentative distances are kept in buckets of width delta. A bucket is
+    emptied by repeatedly relaxing the light edges (w <= delta) of its
+    vertices as one batch; once it stays empty, the heavy edges of everything
+    it held are relaxed once. With engine="numpy" (the default when NumPy is
+    installed) each batch is a vectorized gather over CSR arrays followed by a
+    scatter-min; engine="python" is the plain loop. delta defaults to
+    choose_delta(graph). Weights must be non-negative.
+
+    Returns (distances, relaxations) like dijkstra.
+    """
+    if engine is None:
+        engine = "numpy" if np is not None else "python"
+    if engine not in ("numpy", "python"):
+        raise ValueError(f"Unknown delta-stepping engine: {engine!r}")
+    if delta is None:
+        delta = choose_delta(graph)
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+
+    if engine == "numpy":
+        return _delta_stepping_numpy(graph, source, delta)
+    return _delta_stepping_python(graph, source, delta)
+
+
+def _delta_stepping_python(graph, source: int, delta: float) -> Tuple[Dict[int, float], int]:
+    n = graph.num_vertices
+    dist = [INF] * (n + 1)
+    dist[source] = 0
+    buckets = {0: {source}}
+    order = [0]
+    relaxations = 0
+
+    def relax(v: int, new_dist: float) -> None:
+        nonlocal relaxations
+        old = dist[v]
+        if new_dist < old:
+            if old != INF:
+                buckets.get(int(old // delta), set()).discard(v)
+            index = int(new_dist // delta)
+            if index not in buckets:
+                buckets[index] = set()
+                heapq.heappush(order, index)
+            buckets[index].add(v)
+            dist[v] = new_dist
+            relaxations += 1
+
+    while order:
+        i = heapq.heappop(order)
+        bucket = buckets.pop(i, set())
+        removed = set()
+        while bucket:
+            active = bucket
+            buckets[i] = bucket = set()
+            removed |= active
+            for u in active:
+                for v, weight in graph.neighbors(u):
+                    if weight < 0:
+                        raise ValueError("Delta-stepping requires non-negative edge weights")
+                    if weight <= delta:
+                        relax(v, dist[u] + weight)
+            bucket = buckets.get(i, set())
+        buckets.pop(i, None)
+        for u in removed:
+            for v, weight in graph.neighbors(u):
+                if weight > delta:
+                    relax(v, dist[u] + weight)
+
+    return {v: dist[v] for v in graph.vertices}, relaxations
+
+
+def _delta_stepping_numpy(graph, source: int, delta: float) -> Tuple[Dict[int, float], int]:
+    light, heavy = graph.cached(('delta_stepping_csr', delta), lambda: _split_csr(graph, delta))
+    n = graph.num_vertices
+    dist = np.full(n + 1, INF)
+    dist[source] = 0
+    settled = np.zeros(n + 1, dtype=bool)
+    buckets = {0: [np.array([source], dtype=np.int64)]}
+    order = [0]
+    relaxations = 0
+
+    def relax(csr, frontier):
+        # Relax every edge of csr leaving frontier; returns improved vertices
+        nonlocal relaxations
+        offsets, targets, weights = csr
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return frontier[:0]
+        ends = np.cumsum(counts)
+        edge_index = np.repeat(starts - ends + counts, counts) + np.arange(total)
+        dst = targets[edge_index]
+        candidate = np.repeat(dist[frontier], counts) + weights[edge_index]
+        better = candidate < dist[dst]
+        dst, candidate = dst[better], candidate[better]
+        np.minimum.at(dist, dst, candidate)
+        improved = np.unique(dst)
+        relaxations += len(improved)
+        return improved
+
+    def file_into_buckets(vertices, current):
+        # Queue improved vertices outside the current bucket by bucket index
+        index = (dist[vertices] // delta).astype(np.int64)
+        later = index != current
+        for b in np.unique(index[later]).tolist():
+            if b not in buckets:
+                buckets[b] = []
+                heapq.heappush(order, b)
+            buckets[b].append(vertices[index == b])
+        return vertices[~later]
+
+    while order:
+        i = heapq.heappop(order)
+        candidates = np.unique(np.concatenate(buckets.pop(i)))
+        # Drop entries that settled already or moved to an earlier bucket
+        active = candidates[~settled[candidates] & ((dist[candidates] // delta) == i)]
+        removed = [active]
+        while len(active):
+            improved = relax(light, active)
+            active = file_into_buckets(improved, i)
+            removed.append(active)
+        removed = np.unique(np.concatenate(removed))
+        settled[removed] = True
+        file_into_buckets(relax(heavy, removed), i)
+
+    values = dist.tolist()
+    return {v: values[v] for v in graph.vertices}, relaxations
+
+
+def _split_csr(graph, delta: float):
+    # Light (w <= delta) and heavy CSR arrays, each as (offsets, targets, weights)
+    src, dst, weights = edge_arrays(graph)
+    if len(weights) and weights.min() < 0:
+        raise ValueError("Delta-stepping requires non-negative edge weights")
+    order = np.argsort(src, kind='stable')
+    src, dst, weights = src[order], dst[order], weights[order]
+    n = graph.num_vertices
+
+    parts = []
+    for mask in (weights <= delta, weights > delta):
+        counts = np.bincount(src[mask], minlength=n + 1)
+        offsets = np.zeros(n + 2, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        parts.append((offsets, dst[mask], weights[mask]))
+    return parts
@@ -1,11 +1,21 @@
 import heapq
-from typing import Dict, Tuple, List
+from typing import Dict, Optional, Sequence, Tuple, List
 from collections import defaultdict
+from src.algorithms.priority_queues import make_queue
 
 INF = float('inf')
+DIAL_MAX_WEIGHT = 1000  # largest integer edge weight routed to the bucket queue
 
 
-def dijkstra(graph, source: int) -> Tuple[Dict[int, float], int]:
+def dijkstra(graph, source: int, queue=None) -> Tuple[Dict[int, float], int]:
+    if queue is not None:
+        return dijkstra_with_queue(graph, source, queue)
+    
+    # Small non-negative integer weights: Dial's bucket queue instead of a heap
+    max_weight = small_integer_weight_bound(graph)
+    if max_weight is not None:
+        return _dijkstra_dial(graph, source, max_weight)
+    
     distances = {i: INF for i in graph.vertices}
     distances[source] = 0
     
@@ -24,20 +34,207 @@ def dijkstra(graph, source: int) -> Tuple[Dict[int, float], int]:
         visited.add(u)
         
         # Check all neighbors
-        if u in graph.adj_list:
-            for v, weight in graph.adj_list[u]:
-                if v not in visited:
-                    new_dist = current_dist + weight
-                    
-                    # Relax edge
-                    if new_dist < distances[v]:
-                        distances[v] = new_dist
-                        relaxations += 1
-                        heapq.heappush(pq, (new_dist, v))
+        for v, weight in graph.neighbors(u):
+            if v not in visited:
+                new_dist = current_dist + weight
+                
+                # Relax edge
+                if new_dist < distances[v]:
+                    distances[v] = new_dist
+                    relaxations += 1
+                    heapq.heappush(pq, (new_dist, v))
     
     return distances, relaxations
 
 
+def small_integer_weight_bound(graph) -> Optional[int]:
+    # Largest edge weight if every weight is a non-negative integer no larger
+    # than DIAL_MAX_WEIGHT, else None; cached on the graph
+    def bound():
+        weights = getattr(graph, 'weights', None)
+        if weights is None or getattr(weights, 'typecode', None) != 'q':
+            weights = [w for _, _, w in graph.edges]
+            if not all(isinstance(w, int) or (isinstance(w, float) and w.is_integer()) for w in weights):
+                return None
+        if len(weights) == 0 or min(weights) < 0 or max(weights) > DIAL_MAX_WEIGHT:
+            return None
+        return int(max(weights))
+    
+    return graph.cached('dial_weight_bound', bound)
+
+
+def _dijkstra_dial(graph, source: int, max_weight: int) -> Tuple[Dict[int, float], int]:
+    # Dial's algorithm: max_weight + 1 circular buckets indexed by distance.
+    # All tentative distances lie within max_weight of the current one, so the
+    # buckets never alias. Outdated entries are skipped when popped. A small
+    # heap of the distances whose bucket is non-empty lets the scan jump over
+    # empty buckets, so long paths of heavy edges stay O(E log W), not O(V*W).
+    n = graph.num_vertices
+    width = max_weight + 1
+    buckets = [[] for _ in range(width)]
+    dist = [INF] * (n + 1)
+    dist[source] = 0
+    settled = bytearray(n + 1)
+    relaxations = 0
+    
+    buckets[0].append(source)
+    keys = [0]
+    
+    while keys:
+        current = heapq.heappop(keys)
+        bucket = buckets[current % width]
+        while bucket:
+            u = bucket.pop()
+            if settled[u] or dist[u] != current:
+                continue
+            settled[u] = 1
+            
+            for v, weight in graph.neighbors(u):
+                new_dist = current + weight
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    relaxations += 1
+                    target = buckets[int(new_dist) % width]
+                    if not target:
+                        heapq.heappush(keys, int(new_dist))
+                    target.append(v)
+    
+    return {v: dist[v] for v in graph.vertices}, relaxations
+
+
+def dijkstra_with_queue(graph, source: int, queue,
+                        h: Optional[Sequence[float]] = None) -> Tuple[Dict[int, float], int]:
+    """
+    Dijkstra over a pluggable priority queue.
+    
+    queue is a queue name from priority_queues.QUEUES ("heapq", "dary") or an
+    empty instance exposing push(key, item) (insert or decrease-key), pop()
+    and len(); pass an instance to read its counters afterwards. With
+    potentials h the edges are re-weighted as in Johnson's algorithm.
+    """
+    n = graph.num_vertices
+    queue = make_queue(queue, n + 1)
+    dist = [INF] * (n + 1)
+    dist[source] = 0
+    settled = bytearray(n + 1)
+    relaxations = 0
+    queue.push(0, source)
+    
+    while len(queue):
+        current_dist, u = queue.pop()
+        settled[u] = 1
+        
+        for v, weight in graph.neighbors(u):
+            if not settled[v]:
+                if h is not None:
+                    weight = weight + h[u] - h[v]
+                new_dist = current_dist + weight
+                
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    relaxations += 1
+                    queue.push(new_dist, v)
+    
+    return {v: dist[v] for v in graph.vertices}, relaxations
+
+
+def shortest_path(graph, source: int, target: int,
+                  bidirectional: bool = False) -> Tuple[float, List[int], int]:
+    """
+    Single-pair Dijkstra query.
+    
+    Stops as soon as target is settled instead of sweeping the whole graph.
+    With bidirectional=True a forward search from source and a backward search
+    from target (over graph.reversed()) run alternately until the best
+    meeting distance can no longer improve.
+    
+    Returns (distance, path, settled): the path lists vertices from source to
+    target ([] and INF if unreachable) and settled counts vertices settled by
+    the search(es).
+    """
+    if source == target:
+        return 0, [source], 0
+    if bidirectional:
+        return _bidirectional_path(graph, source, target)
+    
+    distances = {source: 0}
+    parents = {source: None}
+    pq = [(0, source)]
+    settled = set()
+    
+    while pq:
+        current_dist, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        settled.add(u)
+        
+        if u == target:
+            return current_dist, _trace_path(parents, target), len(settled)
+        
+        for v, weight in graph.neighbors(u):
+            new_dist = current_dist + weight
+            if v not in settled and new_dist < distances.get(v, INF):
+                distances[v] = new_dist
+                parents[v] = u
+                heapq.heappush(pq, (new_dist, v))
+    
+    return INF, [], len(settled)
+
+
+def _bidirectional_path(graph, source: int, target: int) -> Tuple[float, List[int], int]:
+    # Index 0 is the forward search over graph, 1 the backward search over
+    # the reversed graph. best is the shortest source-target path seen so far
+    # through a scanned edge; once the two queue minima add up to at least
+    # best, no undiscovered path can be shorter.
+    graphs = (graph, graph.reversed())
+    distances = ({source: 0}, {target: 0})
+    parents = ({source: None}, {target: None})
+    queues = ([(0, source)], [(0, target)])
+    settled = (set(), set())
+    best = INF
+    meeting = None
+    
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        
+        # Expand the side with the smaller frontier
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        other = 1 - side
+        current_dist, u = heapq.heappop(queues[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        
+        for v, weight in graphs[side].neighbors(u):
+            new_dist = current_dist + weight
+            if v not in settled[side] and new_dist < distances[side].get(v, INF):
+                distances[side][v] = new_dist
+                parents[side][v] = u
+                heapq.heappush(queues[side], (new_dist, v))
+            if v in distances[other] and new_dist + distances[other][v] < best:
+                best = new_dist + distances[other][v]
+                meeting = (u, v) if side == 0 else (v, u)
+    
+    count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return INF, [], count
+    
+    # meeting is the edge (a, b) joining the forward tree at a to the
+    # backward tree at b
+    a, b = meeting
+    path = _trace_path(parents[0], a) + _trace_path(parents[1], b)[::-1]
+    return best, path, count
+
+
+def _trace_path(parents: Dict[int, Optional[int]], vertex: int) -> List[int]:
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parents[vertex]
+    return path[::-1]
+
+
 def print_distances(distances: Dict[int, float], source: int) -> None:
     print(f"\nShortest Paths from Source {source}:")
     print(f"{'Vertex':<10} {'Distance':<15}")
@@ -0,0 +1,146 @@
+import heapq
+from typing import Dict, List, Optional, Set
+
+INF = float('inf')
+
+
+class DynamicSSSP:
+    """
+    Shortest-path tree from one source, repaired in place as edges change.
+
+    dist[v] and parent[v] describe the tree (parent is None for the source
+    and for unreachable vertices). Updates go through add_edge, update_edge
+    and remove_edge, which change the graph and then repair only what the
+    change can affect: a cheaper edge runs Dijkstra outward from its head;
+    a dearer or deleted tree edge uses Ramalingam-Reps repair. That repair
+    first finds the vertices below the edge that lose every shortest path,
+    then recomputes those vertices from their unaffected in-neighbours.
+    Each update returns the number of vertices whose distance changed.
+    Weights must be non-negative.
+    """
+
+    def __init__(self, graph, source: int):
+        self.graph = graph
+        self.source = source
+        n = graph.num_vertices
+        # Cheapest weight of every edge into v: incoming[v][u]
+        self.incoming: List[Dict[int, float]] = [{} for _ in range(n + 1)]
+        for u, v, weight in graph.edges:
+            self._check_weight(weight)
+            if weight < self.incoming[v].get(u, INF):
+                self.incoming[v][u] = weight
+
+        self.dist: List[float] = [INF] * (n + 1)
+        self.parent: List[Optional[int]] = [None] * (n + 1)
+        self.children: List[Set[int]] = [set() for _ in range(n + 1)]
+        self._before: Dict[int, float] = {}  # old distances touched by the current update
+        self.dist[source] = 0
+        self._propagate([(0, source)])
+
+    def distances(self) -> Dict[int, float]:
+        # Same shape as dijkstra's result
+        return {v: self.dist[v] for v in self.graph.vertices}
+
+    def add_edge(self, u: int, v: int, weight: float) -> int:
+        self._check_weight(weight)
+        self.graph.add_edge(u, v, weight)
+        return self._repair_edge(u, v)
+
+    def update_edge(self, u: int, v: int, weight: float) -> int:
+        self._check_weight(weight)
+        self.graph.update_edge(u, v, weight)
+        return self._repair_edge(u, v)
+
+    def remove_edge(self, u: int, v: int) -> int:
+        self.graph.remove_edge(u, v)
+        return self._repair_edge(u, v)
+
+    def _repair_edge(self, u: int, v: int) -> int:
+        self._before = {}
+        self._edge_changed(u, v)
+        if not self.graph.directed and u != v:
+            self._edge_changed(v, u)
+        return sum(1 for x, d in self._before.items() if self.dist[x] != d)
+
+    def _check_weight(self, weight: float) -> None:
+        if weight < 0:
+            raise ValueError("Dynamic SSSP requires non-negative edge weights")
+
+    def _edge_changed(self, u: int, v: int) -> None:
+        # Re-read the cheapest u -> v weight from the graph and repair
+        old = self.incoming[v].get(u, INF)
+        new = self.graph.edge_weight(u, v)
+        if new == INF:
+            self.incoming[v].pop(u, None)
+        else:
+            self.incoming[v][u] = new
+
+        if new < old and self.dist[u] + new < self.dist[v]:
+            self._set_parent(v, u, self.dist[u] + new)
+            self._propagate([(self.dist[v], v)])
+        elif new > old and self.parent[v] == u and self.dist[u] + new != self.dist[v]:
+            self._repair(v)
+
+    def _set_parent(self, v: int, u: Optional[int], distance: float) -> None:
+        self._before.setdefault(v, self.dist[v])
+        old = self.parent[v]
+        if old is not None:
+            self.children[old].discard(v)
+        self.parent[v] = u
+        if u is not None:
+            self.children[u].add(v)
+        self.dist[v] = distance
+
+    def _propagate(self, pq: list) -> None:
+        # Dijkstra from the given (distance, vertex) entries
+        dist = self.dist
+        heapq.heapify(pq)
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            for v, weight in self.graph.neighbors(u):
+                if d + weight < dist[v]:
+                    self._set_parent(v, u, d + weight)
+                    heapq.heappush(pq, (dist[v], v))
+
+    def _repair(self, root: int) -> None:
+        dist, incoming = self.dist, self.incoming
+
+        # Phase 1: in order of old distance, a vertex below root keeps its
+        # distance if some in-neighbour already known to be unaffected
+        # offers a tight edge; otherwise it is affected and so are the
+        # children that hang off it. A tight zero-weight edge does not count:
+        # its tail may sit further down the same subtree, undecided.
+        affected = set()
+        pending = {root}
+        pq = [(dist[root], root)]
+        while pq:
+            d, x = heapq.heappop(pq)
+            pending.discard(x)
+            alternative = None
+            for p, weight in incoming[x].items():
+                if weight > 0 and p not in affected and p not in pending and dist[p] + weight == d:
+                    alternative = p
+                    break
+            if alternative is not None:
+                self._set_parent(x, alternative, d)
+                continue
+            affected.add(x)
+            for child in self.children[x]:
+                if child not in pending:
+                    pending.add(child)
+                    heapq.heappush(pq, (dist[child], child))
+
+        # Phase 2: seed each affected vertex from its unaffected in-neighbours
+        # and settle the affected set with Dijkstra
+        pq = []
+        for x in affected:
+            best, best_parent = INF, None
+            for p, weight in incoming[x].items():
+                if p not in affected and dist[p] + weight < best:
+                    best, best_parent = dist[p] + weight, p
+            self._set_parent(x, best_parent, best)
+            if best != INF:
+                pq.append((best, x))
+        self._propagate(pq)
@@ -1,9 +1,34 @@
-from typing import List, Tuple
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator, List, Optional, Tuple
+from src.graph_utils import edge_arrays
+from src.distance_matrix import DistanceMatrix, choose_typecode
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only engine="numpy" needs it
+    np = None
 
 INF = float('inf')
+ENGINES = ("python", "numpy", "blocked")
+_BAND_CELLS = 1 << 16  # cells per row band in the numpy engine (~512 KB)
 
 
-def floyd_warshall(graph) -> Tuple[List[List[float]], int, bool]:
+def floyd_warshall(graph, engine: str = "python", compact: bool = False,
+                   filename: Optional[str] = None) -> Tuple[List[List[float]], int, bool]:
+    # compact=True (or a filename to spill to) returns a DistanceMatrix
+    # instead of the (n+1)x(n+1) list or array
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown Floyd-Warshall engine: {engine!r} (expected one of {ENGINES})")
+    if compact or filename is not None:
+        return _floyd_warshall_compact(graph, engine, filename)
+    if engine == "numpy":
+        return _floyd_warshall_numpy(graph)
+    if engine == "blocked":
+        return blocked_floyd_warshall(graph)
+    
     n = graph.num_vertices
     dist = graph.get_adjacency_matrix()
     relaxations = 0
@@ -28,6 +53,265 @@ def floyd_warshall(graph) -> Tuple[List[List[float]], int, bool]:
     return dist, relaxations, has_negative_cycle
 
 
+def floyd_warshall_rows(graph, engine: str = "python") -> Iterator[Tuple[int, List[float]]]:
+    """
+    Yield (source, row) like johnson_rows. Floyd-Warshall only finishes a
+    row after the last k, so the matrix is still built in full; the list
+    engine drops each row once it has been yielded. Raises ValueError on a
+    negative cycle.
+    """
+    dist, _, has_negative_cycle = floyd_warshall(graph, engine)
+    if has_negative_cycle:
+        raise ValueError("Graph contains a negative cycle")
+    
+    for i in range(1, graph.num_vertices + 1):
+        if isinstance(dist, list):
+            row, dist[i] = dist[i], None
+        else:
+            row = dist[i].tolist()
+        yield i, row
+
+
+def numpy_adjacency_matrix(graph) -> 'np.ndarray':
+    # Same layout as Graph.get_adjacency_matrix(): (n+1)x(n+1) float64,
+    # 0 on the diagonal, INF where there is no edge, minimum over duplicates.
+    if np is None:
+        raise ImportError("NumPy is required for the numpy Floyd-Warshall engine")
+    
+    n = graph.num_vertices
+    src, dst, weights = edge_arrays(graph)
+    
+    dist = np.full((n + 1, n + 1), INF)
+    np.fill_diagonal(dist, 0)
+    np.minimum.at(dist, (src, dst), weights)
+    return dist
+
+
+def _floyd_warshall_numpy(graph) -> Tuple['np.ndarray', int, bool]:
+    dist = numpy_adjacency_matrix(graph)
+    relaxations = _relax_bands(dist, 1)
+    
+    # Check for negative cycles (diagonal elements < 0)
+    has_negative_cycle = bool((np.diagonal(dist)[1:] < 0).any())
+    
+    return dist, relaxations, has_negative_cycle
+
+
+def _relax_bands(dist: 'np.ndarray', first: int, sentinel: float = INF) -> int:
+    # One broadcast min-plus update per k instead of the inner i/j loops,
+    # over rows and columns first.. of dist, in place. Row and column k are
+    # copied before dist is written, which matches the Python loop exactly
+    # when there is no negative cycle, so the relaxation count is the same
+    # too. Rows are updated in cache-sized bands to keep the temporaries
+    # small. Integer cells hold sentinel for INF: sums are taken in int64,
+    # only kept where neither term is the sentinel and clamped to the cell
+    # type's minimum. A negative cycle makes integer distances fall without
+    # bound, so those stop at the first k that leaves a negative diagonal.
+    size = len(dist)
+    integral = sentinel != INF
+    relaxations = 0
+    
+    band = max(1, _BAND_CELLS // max(size, 1))
+    candidate = np.empty((band, size), dtype=np.int64 if integral else np.float64)
+    lowest = np.iinfo(dist.dtype).min if integral else -INF
+    improved = np.empty((band, size), dtype=bool)
+    
+    for k in range(first, size):
+        row_k = dist[k].copy()
+        col_k = dist[:, k].copy()
+        if integral:
+            row_ok = row_k != sentinel
+            col_ok = col_k != sentinel
+        for start in range(first, size, band):
+            block = dist[start:start + band]
+            cand = candidate[:len(block)]
+            mask = improved[:len(block)]
+            np.add(col_k[start:start + band, None], row_k, out=cand)
+            np.less(cand, block, out=mask)
+            if integral:
+                mask &= col_ok[start:start + band, None]
+                mask &= row_ok
+                relaxations += int(np.count_nonzero(mask))
+                np.maximum(cand, lowest, out=cand)
+                np.copyto(block, cand, casting='unsafe', where=mask)
+            else:
+                relaxations += int(np.count_nonzero(mask))
+                np.minimum(block, cand, out=block)
+        if integral and (np.diagonal(dist)[first:] < 0).any():
+            break
+    
+    return relaxations
+
+
+def _floyd_warshall_compact(graph, engine: str, filename: Optional[str]) -> Tuple[DistanceMatrix, int, bool]:
+    # Floyd-Warshall run in place on a DistanceMatrix (file-backed with
+    # filename), so no list or array copy of the matrix is ever built. The
+    # numpy and blocked engines share the banded loop on to_numpy(); the
+    # python engine relaxes one buffer row at a time.
+    n = graph.num_vertices
+    matrix = DistanceMatrix(n, choose_typecode(graph), filename)
+    
+    if engine != "python":
+        if np is None:
+            raise ImportError(f"NumPy is required for the {engine} Floyd-Warshall engine")
+        dist = matrix.to_numpy()
+        src, dst, weights = edge_arrays(graph)
+        np.fill_diagonal(dist, 0)
+        np.minimum.at(dist, (src - 1, dst - 1), weights.astype(dist.dtype))
+        relaxations = _relax_bands(dist, 0, matrix.sentinel)
+        has_negative_cycle = bool((np.diagonal(dist) < 0).any())
+        del dist
+        return matrix, relaxations, has_negative_cycle
+    
+    for i in range(1, n + 1):
+        matrix[i][i] = 0
+    for u, v, weight in graph.edges:
+        if weight < matrix[u][v]:
+            matrix[u][v] = weight
+    
+    # Integer cells stop at the first negative diagonal, as in _relax_bands
+    buffer = matrix.buffer
+    sentinel = matrix.sentinel
+    lowest = -sentinel - 1 if sentinel != INF else -INF
+    relaxations = 0
+    for k in range(n):
+        row_k = buffer[k * n:(k + 1) * n].tolist()
+        for i in range(n):
+            row_i = buffer[i * n:(i + 1) * n].tolist()
+            d_ik = row_i[k]
+            if d_ik == sentinel:
+                continue
+            changed = relaxations
+            for j in range(n):
+                d_kj = row_k[j]
+                if d_kj != sentinel:
+                    new_dist = d_ik + d_kj
+                    if new_dist < row_i[j]:
+                        row_i[j] = new_dist
+                        relaxations += 1
+            # Write the row back as soon as it is finished for this k
+            if relaxations != changed:
+                if sentinel != INF and min(row_i) < lowest:
+                    row_i = [max(d, lowest) for d in row_i]
+                buffer[i * n:(i + 1) * n] = array(matrix.typecode, row_i)
+                if sentinel != INF and row_i[i] < 0:
+                    return matrix, relaxations, True
+    
+    has_negative_cycle = any(buffer[i * n + i] < 0 for i in range(n))
+    return matrix, relaxations, has_negative_cycle
+
+
+def blocked_floyd_warshall(graph, block_size: int = 256,
+                           workers: Optional[int] = None) -> Tuple['np.ndarray', int, bool]:
+    """
+    Tiled Floyd-Warshall that spreads independent tiles over worker processes.
+    
+    For every diagonal block the three classic phases run in order: the
+    diagonal tile itself, then the tiles in its row and column, then all
+    remaining tiles. Tiles within phases 2 and 3 only read the tiles finished
+    in earlier phases, so they run in parallel on a distance matrix kept in
+    shared memory. block_size sets the tile edge (pick it so three tiles fit
+    in cache); workers defaults to os.cpu_count(), and workers=1 runs
+    everything in-process.
+    
+    Distances equal floyd_warshall's for integer weights (floating-point sums
+    may be associated differently). The relaxation count is the number of
+    cell improvements in tile order, so it can differ from the classic loop.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for blocked Floyd-Warshall")
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+    
+    n = graph.num_vertices
+    workers = workers or os.cpu_count() or 1
+    blocks = [(start, min(start + block_size, n + 1)) for start in range(1, n + 1, block_size)]
+    
+    if workers <= 1 or len(blocks) == 1:
+        dist = numpy_adjacency_matrix(graph)
+        relaxations = 0
+        for k0, k1 in blocks:
+            for tile in _block_phases(blocks, k0, k1):
+                relaxations += sum(_relax_tile(dist, *bounds) for bounds in tile)
+        return dist, relaxations, bool((np.diagonal(dist)[1:] < 0).any())
+    
+    matrix = numpy_adjacency_matrix(graph)
+    shm = shared_memory.SharedMemory(create=True, size=matrix.nbytes)
+    try:
+        dist = np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)
+        dist[:] = matrix
+        del matrix
+        relaxations = 0
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_matrix,
+                                 initargs=(shm.name, dist.shape)) as pool:
+            for k0, k1 in blocks:
+                diagonal, cross, rest = _block_phases(blocks, k0, k1)
+                # The single diagonal tile is cheaper to do here than to ship
+                relaxations += _relax_tile(dist, *diagonal[0])
+                for phase in (cross, rest):
+                    chunksize = max(1, len(phase) // (workers * 4))
+                    relaxations += sum(pool.map(_shared_tile_task, phase, chunksize=chunksize))
+        
+        result = dist.copy()
+        has_negative_cycle = bool((np.diagonal(result)[1:] < 0).any())
+        del dist
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    return result, relaxations, has_negative_cycle
+
+
+def _block_phases(blocks: List[Tuple[int, int]], k0: int, k1: int) -> Tuple[list, list, list]:
+    # Tile bounds (i0, i1, j0, j1, k0, k1) for the three phases of one round
+    diagonal = [(k0, k1, k0, k1, k0, k1)]
+    cross = []
+    rest = []
+    for b0, b1 in blocks:
+        if b0 == k0:
+            continue
+        cross.append((k0, k1, b0, b1, k0, k1))
+        cross.append((b0, b1, k0, k1, k0, k1))
+        for c0, c1 in blocks:
+            if c0 != k0:
+                rest.append((b0, b1, c0, c1, k0, k1))
+    return diagonal, cross, rest
+
+
+def _relax_tile(dist: 'np.ndarray', i0: int, i1: int, j0: int, j1: int, k0: int, k1: int) -> int:
+    # Sequential k over one tile; row/column k are copied first because in
+    # phases 1 and 2 they live inside the tile being written.
+    tile = dist[i0:i1, j0:j1]
+    candidate = np.empty(tile.shape)
+    improved = np.empty(tile.shape, dtype=bool)
+    relaxations = 0
+    
+    for k in range(k0, k1):
+        row_k = dist[k, j0:j1].copy()
+        col_k = dist[i0:i1, k].copy()
+        np.add(col_k[:, None], row_k, out=candidate)
+        np.less(candidate, tile, out=improved)
+        relaxations += int(np.count_nonzero(improved))
+        np.minimum(tile, candidate, out=tile)
+    
+    return relaxations
+
+
+_shared_matrix = {}
+
+
+def _attach_shared_matrix(name: str, shape: Tuple[int, int]) -> None:
+    # Pool initializer: map the parent's distance matrix once per worker
+    shm = shared_memory.SharedMemory(name=name)
+    _shared_matrix['shm'] = shm
+    _shared_matrix['dist'] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+
+def _shared_tile_task(bounds: Tuple[int, int, int, int, int, int]) -> int:
+    return _relax_tile(_shared_matrix['dist'], *bounds)
+
+
 def print_distance_matrix(dist: List[List[float]], num_vertices: int, has_negative_cycle: bool = False) -> None:
     print(f"\nAll-Pairs Shortest Paths (Floyd-Warshall):")
     
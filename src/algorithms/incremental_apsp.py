@@ -0,0 +1,80 @@
+from typing import List
+from src.algorithms.floyd_warshall import floyd_warshall
+from src.algorithms.johnson import johnson
+
+INF = float('inf')
+ENGINES = ("johnson", "floyd_warshall")
+
+
+class IncrementalAPSP:
+    """
+    All-pairs distances kept current while edges are added or made cheaper.
+    
+    The matrix is computed once with engine, then each update through
+    add_edge/decrease_edge changes both the graph and dist[i][j] in at most
+    O(V^2) via dist[i][j] = min(dist[i][j], dist[i][u] + w + dist[v][j]),
+    visiting only the rows that reach u more cheaply through the new edge
+    and the columns v reaches. An update that would close a negative cycle
+    raises ValueError and leaves the graph and matrix untouched.
+    """
+    
+    def __init__(self, graph, engine: str = "johnson"):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown APSP engine: {engine!r} (expected one of {ENGINES})")
+        compute = johnson if engine == "johnson" else floyd_warshall
+        dist, _, has_negative_cycle = compute(graph)
+        if has_negative_cycle:
+            raise ValueError("Graph contains a negative cycle")
+        self.graph = graph
+        self.dist: List[List[float]] = dist
+    
+    def add_edge(self, u: int, v: int, weight: float) -> int:
+        # Insert u -> v and return the number of distances that improved
+        self._check_cycle(u, v, weight)
+        self.graph.add_edge(u, v, weight)
+        return self._apply(u, v, weight)
+    
+    def decrease_edge(self, u: int, v: int, weight: float) -> int:
+        # Lower the weight of the existing edge u -> v (see Graph.update_edge)
+        if weight > self.graph.edge_weight(u, v):
+            raise ValueError(f"edge {u} -> {v} weighs less than {weight}; increases are not incremental")
+        self._check_cycle(u, v, weight)
+        self.graph.update_edge(u, v, weight)
+        return self._apply(u, v, weight)
+    
+    def _check_cycle(self, u: int, v: int, weight: float) -> None:
+        # A negative cycle through the new edge is v ~> u -> v; in an
+        # undirected graph a negative edge is one by itself
+        if self.dist[v][u] + weight < 0 or (not self.graph.directed and weight < 0):
+            raise ValueError(f"edge {u} -> {v} with weight {weight} closes a negative cycle")
+    
+    def _apply(self, u: int, v: int, weight: float) -> int:
+        updated = self._relax_through(u, v, weight)
+        if not self.graph.directed and u != v:
+            updated += self._relax_through(v, u, weight)
+        return updated
+    
+    def _relax_through(self, u: int, v: int, weight: float) -> int:
+        dist = self.dist
+        n = self.graph.num_vertices
+        if weight >= dist[u][v]:
+            return 0
+        
+        # Column u and row v cannot change without a negative cycle, so they
+        # are read once up front
+        row_v = dist[v]
+        rows = [(i, dist[i][u] + weight) for i in range(1, n + 1)
+                if dist[i][u] != INF and dist[i][u] + weight < dist[i][v]]
+        row_u = dist[u]
+        cols = [(j, row_v[j]) for j in range(1, n + 1)
+                if row_v[j] != INF and weight + row_v[j] < row_u[j]]
+        
+        updated = 0
+        for i, to_v in rows:
+            row_i = dist[i]
+            for j, from_v in cols:
+                candidate = to_v + from_v
+                if candidate < row_i[j]:
+                    row_i[j] = candidate
+                    updated += 1
+        return updated
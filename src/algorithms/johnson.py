@@ -1,29 +1,30 @@
 import heapq
-from typing import Dict, List, Tuple
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from src.graph_utils import CompactGraph
+from src.distance_matrix import DistanceMatrix, SENTINELS, choose_typecode
+from src.algorithms.bellman_ford import spfa_relax
+from src.algorithms.dijkstra import dijkstra_with_queue
 
 INF = float('inf')
 
 
 def bellman_ford_johnson(graph, source: int) -> Tuple[Dict[int, float], bool]:
-    distances = {i: INF for i in graph.vertices}
+    distances = [INF] * (graph.num_vertices + 1)
     distances[source] = 0
     
-    for _ in range(graph.num_vertices - 1):
-        for u, v, weight in graph.edges:
-            if distances[u] != INF and distances[u] + weight < distances[v]:
-                distances[v] = distances[u] + weight
-    
-    # Check for negative cycles
-    has_negative_cycle = False
-    for u, v, weight in graph.edges:
-        if distances[u] != INF and distances[u] + weight < distances[v]:
-            has_negative_cycle = True
-            break
+    _, has_negative_cycle = spfa_relax(graph, distances, [source])
     
-    return distances, has_negative_cycle
+    return {i: distances[i] for i in graph.vertices}, has_negative_cycle
 
 
-def dijkstra_johnson(graph, source: int, h: Dict[int, float]) -> Tuple[Dict[int, float], int]:
+def dijkstra_johnson(graph, source: int, h: Sequence[float], queue=None) -> Tuple[Dict[int, float], int]:
+    if queue is not None:
+        return dijkstra_with_queue(graph, source, queue, h)
+    
     distances = {i: INF for i in graph.vertices}
     distances[source] = 0
     
@@ -39,72 +40,335 @@ def dijkstra_johnson(graph, source: int, h: Dict[int, float]) -> Tuple[Dict[int,
         
         visited.add(u)
         
-        if u in graph.adj_list:
-            for v, weight in graph.adj_list[u]:
-                if v not in visited:
-                    # Re-weighted edge: w'(u,v) = w(u,v) + h(u) - h(v)
-                    adjusted_weight = weight + h[u] - h[v]
-                    new_dist = current_dist + adjusted_weight
-                    
-                    if new_dist < distances[v]:
-                        distances[v] = new_dist
-                        relaxations += 1
-                        heapq.heappush(pq, (new_dist, v))
+        for v, weight in graph.neighbors(u):
+            if v not in visited:
+                # Re-weighted edge: w'(u,v) = w(u,v) + h(u) - h(v)
+                adjusted_weight = weight + h[u] - h[v]
+                new_dist = current_dist + adjusted_weight
+                
+                if new_dist < distances[v]:
+                    distances[v] = new_dist
+                    relaxations += 1
+                    heapq.heappush(pq, (new_dist, v))
     
     return distances, relaxations
 
 
-def johnson(graph) -> Tuple[List[List[float]], int, bool]:
-    n = graph.num_vertices
-    relaxations = 0
+def compute_potentials(graph) -> Tuple[List[float], bool]:
+    """
+    Johnson vertex potentials h, indexed by vertex, and a negative-cycle flag.
     
-    # Step 1: Add auxiliary vertex (vertex 0) with edges to all vertices
-    # with weight 0
-    original_edges = graph.edges.copy()
-    original_adj = dict(graph.adj_list)
+    Equivalent to Bellman-Ford from an auxiliary vertex 0 with a 0-weight edge
+    to every vertex, but the input graph is never modified. The result is
+    cached on the graph until its next add_edge, and when no edge is negative
+    the Bellman-Ford phase is skipped (h = 0 already gives w' = w >= 0).
+    The returned list is shared with the cache and must not be modified.
+    """
+    return graph.cached('johnson_potentials', lambda: _virtual_source_potentials(graph))
+
+
+def _virtual_source_potentials(graph) -> Tuple[List[float], bool]:
+    # The auxiliary 0-weight edges are relaxed up front (h[v] = 0)
+    h = [0] * (graph.num_vertices + 1)
     
-    for v in graph.vertices:
-        graph.add_edge(0, v, 0)
-    graph.num_vertices += 1
-    graph.vertices.insert(0, 0)
+    if all(weight >= 0 for _, _, weight in graph.edges):
+        return h, False
     
-    # Step 2: Run Bellman-Ford from auxiliary vertex
-    h, has_negative_cycle = bellman_ford_johnson(graph, 0)
+    # Queue-based Bellman-Ford with every vertex as an initial source
+    _, has_negative_cycle = spfa_relax(graph, h, graph.vertices)
+    
+    return h, has_negative_cycle
+
+
+def johnson(graph, workers: int = 1, compact: bool = False,
+            filename: Optional[str] = None) -> Tuple[List[List[float]], int, bool]:
+    # compact=True (or a filename to spill to) fills a DistanceMatrix row by
+    # row instead of building the (n+1)x(n+1) list
+    n = graph.num_vertices
+    relaxations = 0
+    
+    # Step 1-2: Potentials from a virtual source joined to every vertex
+    h, has_negative_cycle = compute_potentials(graph)
     
     if has_negative_cycle:
-        # Restore original graph state before returning
-        graph.num_vertices -= 1
-        graph.vertices = graph.vertices[1:]
-        graph.edges = original_edges
-        graph.adj_list = original_adj
         return None, relaxations, True
     
     # Step 3: No need to mutate edges; we'll apply re-weighting on the fly in Dijkstra
-    graph.edges = original_edges
     
     # Step 4: Run Dijkstra from each vertex
+    matrix = DistanceMatrix.for_graph(graph, filename) if compact or filename is not None else None
+    if workers > 1 and n > 1:
+        dist_matrix, relaxations = _johnson_parallel(graph, h, workers, matrix)
+        return dist_matrix, relaxations, False
+    
+    if matrix is not None:
+        row = [INF] * (n + 1)
+        for s in graph.vertices:
+            relaxations += _johnson_row(graph, s, h, row)
+            matrix.set_row(s, row[1:])
+        return matrix, relaxations, False
+    
     dist_matrix = [[INF] * (n + 1) for _ in range(n + 1)]
     
-    for s in graph.vertices[1:]:  # Skip auxiliary vertex
-        dijkstra_dist, rel = dijkstra_johnson(graph, s, h)
+    for s in graph.vertices:
+        relaxations += _johnson_row(graph, s, h, dist_matrix[s])
+    
+    return dist_matrix, relaxations, False
+
+
+def johnson_rows(graph) -> Iterator[Tuple[int, List[float]]]:
+    """
+    Yield (source, row) for every source as soon as its Dijkstra finishes.
+    
+    row[v] is the distance from source to v (index 0 unused), as in the rows
+    of johnson()'s matrix, but only one row is alive at a time unless the
+    consumer keeps them. Raises ValueError on a negative cycle.
+    """
+    h, has_negative_cycle = compute_potentials(graph)
+    if has_negative_cycle:
+        raise ValueError("Graph contains a negative cycle")
+    
+    n = graph.num_vertices
+    for s in graph.vertices:
+        row = [INF] * (n + 1)
+        _johnson_row(graph, s, h, row)
+        yield s, row
+
+
+def _johnson_row(graph, s: int, h: Sequence[float], row) -> int:
+    # Fill row with the original-weight distances from s and return the
+    # number of relaxations Dijkstra needed.
+    dijkstra_dist, rel = dijkstra_johnson(graph, s, h)
+    
+    # Restore original distances
+    for v in graph.vertices:
+        if dijkstra_dist[v] != INF:
+            row[v] = dijkstra_dist[v] + h[v] - h[s]
+        else:
+            row[v] = INF
+    row[s] = 0
+    
+    return rel
+
+
+def _johnson_parallel(graph, h: Sequence[float], workers: int,
+                      matrix: Optional[DistanceMatrix] = None) -> Tuple[List[List[float]], int]:
+    # The CSR arrays, the potentials and the output matrix live in shared
+    # memory; each worker attaches once and tasks only carry source ranges.
+    # Rows are copied into matrix when one is given.
+    n = graph.num_vertices
+    width = n + 1
+    compact = graph.freeze()
+    weights = compact.weights
+    weight_type = getattr(weights, 'typecode', None) or getattr(weights, 'format', 'd')
+    # Integer weights give integer cells, as in the serial path; INF is stored
+    # as the int64 sentinel and turned back into INF below
+    out_type = 'd' if choose_typecode(compact) == 'd' else 'q'
+    sentinel = SENTINELS[out_type]
+    
+    segments = {}
+    try:
+        # Inputs are copied straight from the CSR buffers; the output is
+        # allocated in shared memory and filled with INF in place, so the
+        # parent never holds a private (n+1)^2 copy
+        specs = {}
+        for key, values, typecode in (('offsets', compact.offsets, 'q'),
+                                      ('targets', compact.targets, 'q'),
+                                      ('weights', weights, weight_type),
+                                      ('h', array(weight_type, h), weight_type)):
+            segments[key] = _share_array(values)
+            specs[key] = (segments[key].name, typecode, len(values))
+        del values
         
-        # Restore original distances
-        for v in graph.vertices[1:]:
-            if dijkstra_dist[v] != INF:
-                dist_matrix[s][v] = dijkstra_dist[v] + h[v] - h[s]
-            else:
-                dist_matrix[s][v] = INF
-        dist_matrix[s][s] = 0
+        segments['out'] = shared_memory.SharedMemory(create=True, size=width * width * array(out_type).itemsize)
+        specs['out'] = (segments['out'].name, out_type, width * width)
+        out = _view(segments['out'], out_type, width * width)
+        empty = array(out_type, [sentinel]) * width
+        for i in range(width):
+            out[i * width:(i + 1) * width] = empty
+        out.release()
+        
+        chunk = max(1, n // (workers * 8))
+        ranges = [(start, min(start + chunk, n + 1)) for start in range(1, n + 1, chunk)]
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_graph,
+                                 initargs=(n, compact.directed, specs)) as pool:
+            relaxations = sum(pool.map(_johnson_rows_task, ranges))
         
-        relaxations += rel
+        out = _view(segments['out'], out_type, width * width)
+        
+        def row(i: int, start: int = 0) -> List[float]:
+            values = out[i * width + start:(i + 1) * width].tolist()
+            if sentinel != INF:
+                values = [INF if d == sentinel else d for d in values]
+            return values
+        
+        if matrix is None:
+            dist_matrix = [row(i) for i in range(width)]
+            for i in graph.vertices:
+                dist_matrix[i][i] = 0  # int 0, as _johnson_row writes it
+        else:
+            for i in graph.vertices:
+                matrix.set_row(i, row(i, 1))
+            dist_matrix = matrix
+        out.release()
+    finally:
+        for shm in segments.values():
+            shm.close()
+            shm.unlink()
+    
+    return dist_matrix, relaxations
+
+
+def _share_array(values) -> shared_memory.SharedMemory:
+    # New segment holding a copy of values (array or memoryview), made
+    # through a byte view rather than an intermediate bytes object
+    source = memoryview(values).cast('B')
+    shm = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+    shm.buf[:source.nbytes] = source
+    source.release()
+    return shm
+
+
+def _view(shm: shared_memory.SharedMemory, typecode: str, length: int) -> memoryview:
+    return shm.buf[:length * array(typecode).itemsize].cast(typecode)
+
+
+_shared_graph = {}
+
+
+def _attach_shared_graph(n: int, directed: bool, specs: Dict[str, Tuple[str, str, int]]) -> None:
+    # Pool initializer: map every shared array and rebuild the CSR graph
+    views = {}
+    for key, (name, typecode, length) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _shared_graph.setdefault('segments', []).append(shm)
+        views[key] = _view(shm, typecode, length)
     
-    # Restore original graph state
-    graph.num_vertices -= 1
-    graph.vertices = graph.vertices[1:]
-    graph.edges = original_edges
-    graph.adj_list = original_adj
+    _shared_graph['graph'] = CompactGraph(n, views['offsets'], views['targets'], views['weights'], directed)
+    _shared_graph['h'] = views['h']
+    _shared_graph['out'] = views['out']
+
+
+def _johnson_rows_task(source_range: Tuple[int, int]) -> int:
+    graph, h, out = _shared_graph['graph'], _shared_graph['h'], _shared_graph['out']
+    width = graph.num_vertices + 1
+    relaxations = 0
     
-    return dist_matrix, relaxations, False
+    typecode = out.format
+    sentinel = SENTINELS[typecode]
+    row = [INF] * width
+    for s in range(*source_range):
+        relaxations += _johnson_row(graph, s, h, row)
+        if sentinel != INF:
+            out[s * width:(s + 1) * width] = array(typecode, [sentinel if d == INF else d for d in row])
+        else:
+            out[s * width:(s + 1) * width] = array(typecode, row)
+    
+    return relaxations
+
+
+class LazyDistanceMatrix:
+    """
+    All-pairs distances computed one source row at a time, on first use.
+    
+    D[s][t] runs Dijkstra from s over the Johnson-reweighted graph the first
+    time row s is read. Rows are float64 arrays indexed by vertex (index 0
+    unused) kept in an LRU cache of at most memory_budget bytes (always at
+    least one row). The potentials are computed once up front, so the graph
+    must not change while the matrix is in use. Raises ValueError if the
+    graph has a negative cycle.
+    """
+    
+    def __init__(self, graph, memory_budget: int = 64 << 20):
+        h, has_negative_cycle = compute_potentials(graph)
+        if has_negative_cycle:
+            raise ValueError("Graph contains a negative cycle")
+        self.graph = graph
+        self.h = h
+        self.row_bytes = (graph.num_vertices + 1) * array('d').itemsize
+        self.capacity = max(1, memory_budget // self.row_bytes)
+        self._rows: 'OrderedDict[int, array]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.relaxations = 0
+    
+    def __getitem__(self, source: int) -> array:
+        row = self._rows.get(source)
+        if row is not None:
+            self.hits += 1
+            self._rows.move_to_end(source)
+            return row
+        if not 1 <= source <= self.graph.num_vertices:
+            raise IndexError(f"vertex {source} out of range 1..{self.graph.num_vertices}")
+        self.misses += 1
+        row = [INF] * (self.graph.num_vertices + 1)
+        self.relaxations += _johnson_row(self.graph, source, self.h, row)
+        return self._store(source, array('d', row))
+    
+    def __contains__(self, source: int) -> bool:
+        return source in self._rows
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def prefetch(self, sources: Iterable[int], workers: int = 1) -> None:
+        """
+        Compute the rows of sources that are not cached yet. With workers > 1
+        they are computed in a process pool. Only the most recent capacity
+        rows survive if the batch is larger than the cache.
+        """
+        missing = list(dict.fromkeys(s for s in sources if s not in self._rows))
+        for s in missing:
+            if not 1 <= s <= self.graph.num_vertices:
+                raise IndexError(f"vertex {s} out of range 1..{self.graph.num_vertices}")
+        missing = missing[-self.capacity:]
+        if workers <= 1 or len(missing) <= 1:
+            for s in missing:
+                self[s]
+            return
+        
+        chunksize = max(1, len(missing) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_lazy_graph,
+                                 initargs=(self.graph, self.h)) as pool:
+            for s, (data, relaxations) in zip(missing, pool.map(_lazy_row_task, missing, chunksize=chunksize)):
+                self.misses += 1
+                self.relaxations += relaxations
+                row = array('d')
+                row.frombytes(data)
+                self._store(s, row)
+    
+    def clear(self) -> None:
+        self._rows.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "rows": len(self._rows), "capacity": self.capacity,
+                "bytes": len(self._rows) * self.row_bytes}
+    
+    def _store(self, source: int, row: array) -> array:
+        self._rows[source] = row
+        if len(self._rows) > self.capacity:
+            self._rows.popitem(last=False)
+            self.evictions += 1
+        return row
+
+
+_lazy_graph = {}
+
+
+def _attach_lazy_graph(graph, h: Sequence[float]) -> None:
+    # Pool initializer for LazyDistanceMatrix.prefetch
+    _lazy_graph['graph'] = graph
+    _lazy_graph['h'] = h
+
+
+def _lazy_row_task(source: int) -> Tuple[bytes, int]:
+    graph = _lazy_graph['graph']
+    row = [INF] * (graph.num_vertices + 1)
+    relaxations = _johnson_row(graph, source, _lazy_graph['h'], row)
+    return array('d', row).tobytes(), relaxations
 
 
 def print_distance_matrix(dist: List[List[float]], num_vertices: int, has_negative_cycle: bool = False) -> None:
@@ -0,0 +1,163 @@
+import heapq
+from typing import Dict, Tuple
+
+INF = float('inf')
+
+
+class HeapqQueue:
+    """
+    Binary heap on top of heapq with lazy deletion.
+
+    push() on an item already queued adds a duplicate entry; the outdated one
+    is skipped when it reaches the top (counted as a stale pop).
+    """
+
+    def __init__(self, capacity: int = 0):
+        self._heap = []
+        self._keys: Dict[int, float] = {}
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.decrease_keys = 0
+        self.max_size = 0
+
+    def push(self, key: float, item: int) -> None:
+        # Insert item, or lower its key if it is already queued
+        current = self._keys.get(item)
+        if current is not None:
+            if key >= current:
+                return
+            self.decrease_keys += 1
+        self._keys[item] = key
+        heapq.heappush(self._heap, (key, item))
+        self.pushes += 1
+        if len(self._heap) > self.max_size:
+            self.max_size = len(self._heap)
+
+    def pop(self) -> Tuple[float, int]:
+        while True:
+            key, item = heapq.heappop(self._heap)
+            if self._keys.get(item) == key:
+                del self._keys[item]
+                self.pops += 1
+                return key, item
+            self.stale_pops += 1
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def stats(self) -> Dict[str, int]:
+        return {"pushes": self.pushes, "pops": self.pops, "stale_pops": self.stale_pops,
+                "decrease_keys": self.decrease_keys, "max_size": self.max_size}
+
+
+class IndexedDaryHeap:
+    """
+    Array-backed d-ary min-heap over items 0..capacity-1 with true decrease-key.
+
+    position[item] is the item's slot in the heap (-1 when absent), so every
+    item is stored at most once and the heap never exceeds the number of
+    queued items.
+    """
+
+    def __init__(self, capacity: int, d: int = 4):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self._items = []
+        self._keys = []
+        self._position = [-1] * capacity
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.decrease_keys = 0
+        self.max_size = 0
+
+    def push(self, key: float, item: int) -> None:
+        # Insert item, or lower its key if it is already queued
+        slot = self._position[item]
+        if slot >= 0:
+            if key >= self._keys[slot]:
+                return
+            self.decrease_keys += 1
+            self._sift_up(slot, key, item)
+            return
+        self._items.append(item)
+        self._keys.append(key)
+        self.pushes += 1
+        if len(self._items) > self.max_size:
+            self.max_size = len(self._items)
+        self._sift_up(len(self._items) - 1, key, item)
+
+    def pop(self) -> Tuple[float, int]:
+        items, keys = self._items, self._keys
+        top_key, top_item = keys[0], items[0]
+        self._position[top_item] = -1
+        last_item = items.pop()
+        last_key = keys.pop()
+        if items:
+            self._sift_down(0, last_key, last_item)
+        self.pops += 1
+        return top_key, top_item
+
+    def __contains__(self, item: int) -> bool:
+        return self._position[item] >= 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> Dict[str, int]:
+        return {"pushes": self.pushes, "pops": self.pops, "stale_pops": self.stale_pops,
+                "decrease_keys": self.decrease_keys, "max_size": self.max_size}
+
+    def _sift_up(self, slot: int, key: float, item: int) -> None:
+        items, keys, position, d = self._items, self._keys, self._position, self.d
+        while slot > 0:
+            parent = (slot - 1) // d
+            if keys[parent] <= key:
+                break
+            items[slot] = items[parent]
+            keys[slot] = keys[parent]
+            position[items[slot]] = slot
+            slot = parent
+        items[slot] = item
+        keys[slot] = key
+        position[item] = slot
+
+    def _sift_down(self, slot: int, key: float, item: int) -> None:
+        items, keys, position, d = self._items, self._keys, self._position, self.d
+        size = len(items)
+        while True:
+            first = slot * d + 1
+            if first >= size:
+                break
+            last = min(first + d, size)
+            child = first
+            child_key = keys[first]
+            for c in range(first + 1, last):
+                if keys[c] < child_key:
+                    child, child_key = c, keys[c]
+            if child_key >= key:
+                break
+            items[slot] = items[child]
+            keys[slot] = child_key
+            position[items[slot]] = slot
+            slot = child
+        items[slot] = item
+        keys[slot] = key
+        position[item] = slot
+
+
+QUEUES = {
+    "heapq": HeapqQueue,
+    "dary": IndexedDaryHeap,
+}
+
+
+def make_queue(queue, capacity: int):
+    # Accept a queue instance or the name of one of QUEUES
+    if isinstance(queue, str):
+        if queue not in QUEUES:
+            raise ValueError(f"Unknown priority queue: {queue!r} (expected one of {tuple(QUEUES)})")
+        return QUEUES[queue](capacity)
+    return queue
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from src.algorithms.dijkstra import dijkstra
+from src.algorithms.bellman_ford import bellman_ford
+from src.algorithms.delta_stepping import delta_stepping
+from src.algorithms.floyd_warshall import floyd_warshall
+from src.algorithms.johnson import johnson
+
+# Single-source algorithms take (graph, source, **options), all-pairs ones
+# (graph, **options)
+SINGLE_SOURCE: Dict[str, Callable[..., Any]] = {
+    "dijkstra": dijkstra,
+    "bellman_ford": bellman_ford,
+    "delta_stepping": delta_stepping,
+}
+ALL_PAIRS: Dict[str, Callable[..., Any]] = {
+    "floyd_warshall": floyd_warshall,
+    "johnson": johnson,
+}
+
+# Option values that can be part of a cache key: compared by value, never
+# by identity, so equal options from different callers share an entry
+_KEY_TYPES = (type(None), bool, int, float, str)
+
+
+def _options_key(options: Dict[str, Any]) -> tuple:
+    for name, value in options.items():
+        values = value if isinstance(value, tuple) else (value,)
+        if not all(isinstance(v, _KEY_TYPES) for v in values):
+            raise ValueError(f"option {name}={value!r} cannot be cached: only None, bool, int, float, "
+                             f"str and tuples of them are allowed; call the algorithm directly instead")
+    return tuple(sorted(options.items()))
+
+
+class ResultCache:
+    """
+    LRU cache of shortest-path results keyed by (graph version, algorithm,
+    source, options).
+
+    Every Graph mutation bumps graph.version, so results computed before a
+    change are never returned after it; they simply age out of the LRU.
+    Cached results are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def query(self, graph, algorithm: str, source: Optional[int] = None, **options) -> Any:
+        """
+        Result of algorithm on graph, exactly as the algorithm returns it,
+        computed on the first request for this graph version. Raises
+        ValueError for options that cannot be part of the key, such as a
+        queue instance or a list.
+        """
+        if algorithm in SINGLE_SOURCE:
+            if source is None:
+                raise ValueError(f"{algorithm} needs a source vertex")
+            compute = lambda: SINGLE_SOURCE[algorithm](graph, source, **options)
+        elif algorithm in ALL_PAIRS:
+            source = None
+            compute = lambda: ALL_PAIRS[algorithm](graph, **options)
+        else:
+            known = tuple(SINGLE_SOURCE) + tuple(ALL_PAIRS)
+            raise ValueError(f"Unknown algorithm: {algorithm!r} (expected one of {known})")
+
+        key = (graph.version, algorithm, source, _options_key(options))
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self._entries), "max_entries": self.max_entries}
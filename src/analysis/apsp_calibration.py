@@ -0,0 +1,248 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from src.algorithms.floyd_warshall import floyd_warshall
+from src.algorithms.johnson import johnson
+from src.analysis.benchmark import BENCHMARK_SEED, benchmark_algorithm
+from src.analysis.graph_generator import generate_random_graph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it only the python engine is calibrated
+    np = None
+
+PROFILE_VERSION = 1
+DEFAULT_PROFILE = "results/apsp_profile.json"
+
+# Calibration grid: vertex counts and edge densities E / (V(V-1)), both geometric
+CALIBRATION_SIZES = (32, 64, 128, 256, 512)
+CALIBRATION_DENSITIES = (0.01, 0.03, 0.1, 0.3, 1.0)
+CALIBRATION_BUDGET = 120.0   # seconds for the whole grid
+CALIBRATION_MAX_RUN = 2.0    # seconds for a single run
+
+# Crossover density per Floyd-Warshall engine when there is no profile, from
+# a typical x86-64 host: NumPy Floyd-Warshall beats Johnson above about one
+# percent density, pure-Python Floyd-Warshall practically never does
+DEFAULT_CROSSOVER: Dict[str, Optional[float]] = {"numpy": 0.01, "blocked": 0.01, "python": None}
+
+
+def floyd_warshall_engines() -> Tuple[str, ...]:
+    # Engines that can run here; numpy and blocked need NumPy
+    return ("python", "numpy", "blocked") if np is not None else ("python",)
+
+
+def graph_density(graph) -> float:
+    n = graph.num_vertices
+    if n < 2:
+        return 1.0
+    pairs = n * (n - 1)
+    edges = len(graph.edges)
+    return min(edges / pairs, 1.0)
+
+
+def calibrate_apsp(sizes: Sequence[int] = CALIBRATION_SIZES, densities: Sequence[float] = CALIBRATION_DENSITIES,
+                   time_budget: float = CALIBRATION_BUDGET, max_run_time: float = CALIBRATION_MAX_RUN,
+                   repeats: int = 3, seed: int = BENCHMARK_SEED, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Time Johnson and every available Floyd-Warshall engine on seeded random
+    graphs over the sizes x densities grid and return the APSP profile.
+    
+    Sizes run in increasing order. A candidate is dropped from a density
+    once its next size, assuming cubic growth, would exceed max_run_time;
+    the grid stops when time_budget is spent. For every size, the profile
+    records the fastest Floyd-Warshall engine and the crossover density
+    above which it beats Johnson, interpolated in log space between the
+    grid densities where the winner changes (see crossover_density).
+    """
+    log = print if verbose else (lambda *args: None)
+    candidates = [("johnson", None)] + [("floyd_warshall", engine) for engine in floyd_warshall_engines()]
+    deadline = time.perf_counter() + time_budget
+    dropped = set()
+    last_time: Dict[Tuple[str, Optional[str], float], Tuple[int, float]] = {}
+    measurements = []
+    
+    for num_vertices in sorted(sizes):
+        if time.perf_counter() >= deadline:
+            break
+        for density in densities:
+            if time.perf_counter() >= deadline:
+                break
+            random.seed(f"{seed}:apsp:{num_vertices}:{density}")
+            num_edges = max(round(density * num_vertices * (num_vertices - 1)), 1)
+            graph = generate_random_graph(num_vertices, num_edges)
+            actual = graph_density(graph)
+            log(f"  {num_vertices} vertices, density {actual:.3g} ({len(graph.edges)} edges)")
+            
+            for algorithm, engine in candidates:
+                key = (algorithm, engine, density)
+                if key in dropped:
+                    continue
+                if key in last_time:
+                    last_vertices, elapsed = last_time[key]
+                    if elapsed * (num_vertices / last_vertices) ** 3 > max_run_time:
+                        dropped.add(key)
+                        continue
+                options = {"engine": engine} if engine else {}
+                result = benchmark_algorithm(algorithm, graph, repeats=repeats, warmup=0, memory=False, **options)
+                if not result.success:
+                    dropped.add(key)
+                    continue
+                last_time[key] = (num_vertices, result.execution_time)
+                measurements.append({"vertices": num_vertices, "density": actual, "edges": len(graph.edges),
+                                     "algorithm": algorithm, "engine": engine, "time": result.execution_time})
+    
+    profile = {
+        "version": PROFILE_VERSION,
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "numpy": np.__version__ if np is not None else None,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "seed": seed,
+        "repeats": repeats,
+        "measurements": measurements,
+        "crossover": crossover_surface(measurements),
+    }
+    return profile
+
+
+def crossover_surface(measurements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Per vertex count with both algorithms timed: the fastest Floyd-Warshall
+    engine overall ("fw_engine") and "density", the crossover density
+    above which that engine beats Johnson. density is 0.0 when it wins
+    everywhere measured and None when Johnson always wins.
+    """
+    surface = []
+    for num_vertices in sorted({m["vertices"] for m in measurements}):
+        rows = [m for m in measurements if m["vertices"] == num_vertices]
+        johnson_times = {m["density"]: m["time"] for m in rows if m["algorithm"] == "johnson"}
+        fw_rows = [m for m in rows if m["algorithm"] == "floyd_warshall" and m["density"] in johnson_times]
+        if not fw_rows:
+            continue
+        
+        # The engine that is fastest at most measured densities
+        wins: Dict[str, int] = {}
+        for density in {m["density"] for m in fw_rows}:
+            best = min((m for m in fw_rows if m["density"] == density), key=lambda m: m["time"])
+            wins[best["engine"]] = wins.get(best["engine"], 0) + 1
+        engine = max(sorted(wins), key=wins.get)
+        
+        points = sorted((m["density"], m["time"] / johnson_times[m["density"]])
+                        for m in fw_rows if m["engine"] == engine)
+        surface.append({"vertices": num_vertices, "fw_engine": engine, "density": crossover_density(points)})
+    return surface
+
+
+def crossover_density(points: List[Tuple[float, float]]) -> Optional[float]:
+    """
+    Density where the Floyd-Warshall / Johnson time ratio falls to 1, from
+    (density, ratio) points sorted by density: the first density from which
+    Floyd-Warshall wins at every larger one, log-interpolated against the
+    point below it.
+    """
+    first_win = len(points)
+    while first_win > 0 and points[first_win - 1][1] < 1:
+        first_win -= 1
+    if first_win == len(points):
+        return None
+    if first_win == 0:
+        return 0.0
+    (d0, r0), (d1, r1) = points[first_win - 1], points[first_win]
+    t = math.log(r0) / (math.log(r0) - math.log(r1))
+    return math.exp(math.log(d0) + t * (math.log(d1) - math.log(d0)))
+
+
+def save_profile(profile: Dict[str, Any], filename: str = DEFAULT_PROFILE) -> None:
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, 'w') as f:
+        json.dump(profile, f, indent=2)
+        f.write("\n")
+
+
+def load_profile(filename: str = DEFAULT_PROFILE) -> Dict[str, Any]:
+    with open(filename) as f:
+        profile = json.load(f)
+    if profile.get("version") != PROFILE_VERSION:
+        raise ValueError(f"{filename}: unsupported APSP profile version {profile.get('version')!r}")
+    return profile
+
+
+def choose_apsp_algorithm(graph, profile: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    (algorithm, options) of the APSP engine expected to be fastest on graph,
+    e.g. ("floyd_warshall", {"engine": "numpy"}) or ("johnson", {}).
+    
+    Uses the profile entry with the vertex count nearest to graph's (in log
+    scale): Floyd-Warshall with that entry's engine when the graph's density
+    is at least the crossover density, Johnson otherwise. Without a usable
+    profile entry, or when the entry's engine cannot run here, the fastest
+    available engine and its DEFAULT_CROSSOVER are used instead.
+    """
+    n = max(graph.num_vertices, 1)
+    entries = profile["crossover"] if profile else []
+    engines = floyd_warshall_engines()
+    entry = min(entries, key=lambda e: abs(math.log(e["vertices"]) - math.log(n))) if entries else None
+    if entry is not None and entry["fw_engine"] in engines:
+        crossover, engine = entry["density"], entry["fw_engine"]
+    else:
+        engine = "numpy" if "numpy" in engines else "python"
+        crossover = DEFAULT_CROSSOVER[engine]
+    
+    if crossover is None or graph_density(graph) < crossover:
+        return "johnson", {}
+    return "floyd_warshall", {"engine": engine}
+
+
+def all_pairs_shortest_paths(graph, profile: Optional[Dict[str, Any]] = None):
+    # Run the APSP algorithm choose_apsp_algorithm picks; returns its result
+    algorithm, options = choose_apsp_algorithm(graph, profile)
+    if algorithm == "johnson":
+        return johnson(graph, **options)
+    return floyd_warshall(graph, **options)
+
+
+def describe_crossover(entry: Dict[str, Any]) -> str:
+    density = entry["density"]
+    if density is None:
+        return "never"
+    return "always" if density == 0 else f"above density {density:.3g}"
+
+
+def print_profile(profile: Dict[str, Any]) -> None:
+    print("\nFloyd-Warshall vs Johnson crossover")
+    print(f"{'Vertices':<10} {'FW engine':<10} {'FW faster':<24}")
+    for entry in profile["crossover"]:
+        print(f"{entry['vertices']:<10} {entry['fw_engine']:<10} {describe_crossover(entry):<24}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Calibrate the Floyd-Warshall / Johnson crossover on this host.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(CALIBRATION_SIZES))
+    parser.add_argument("--densities", type=float, nargs="+", default=list(CALIBRATION_DENSITIES))
+    parser.add_argument("--budget", type=float, default=CALIBRATION_BUDGET, help="seconds for the whole grid")
+    parser.add_argument("--max-run", type=float, default=CALIBRATION_MAX_RUN, help="seconds for one run")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--output", "-o", default=DEFAULT_PROFILE)
+    args = parser.parse_args(argv)
+    
+    profile = calibrate_apsp(args.sizes, sorted(args.densities), args.budget, args.max_run, args.repeats, args.seed)
+    print_profile(profile)
+    save_profile(profile, args.output)
+    print(f"\nProfile saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,43 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
 import time
 import tracemalloc
-from typing import Callable, Dict, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from src.graph_utils import Graph
 from src.algorithms.dijkstra import dijkstra
 from src.algorithms.bellman_ford import bellman_ford
 from src.algorithms.floyd_warshall import floyd_warshall
 from src.algorithms.johnson import johnson
+from src.analysis.graph_generator import (
+    generate_sparse_graph,
+    generate_dense_graph,
+    generate_mixed_graph
+)
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then skipped
+    resource = None
+
+BENCHMARK_SEED = 42
+BENCHMARK_REPEATS = 5
+BENCHMARK_WARMUP = 1
+REGRESSION_THRESHOLD = 0.10
+
+# Graph families of the default suite, generated per size with a pinned seed
+SUITE_GENERATORS: Dict[str, Callable[[int], Graph]] = {
+    "Sparse": generate_sparse_graph,
+    "Dense": generate_dense_graph,
+    "Mixed": generate_mixed_graph,
+}
+SUITE_SIZES = (25, 50)
 
 
 class BenchmarkResult:
@@ -13,42 +45,165 @@ class BenchmarkResult:
     
     def __init__(self, algorithm_name: str):
         self.algorithm_name = algorithm_name
-        self.execution_time = 0.0
+        self.execution_time = 0.0  # median of times
+        self.times: List[float] = []
         self.relaxations = 0
-        self.memory_usage = 0
+        self.memory_usage: Optional[float] = None  # tracemalloc peak, KB; None when not measured
+        self.peak_rss: Optional[float] = None  # max RSS of an isolated run, KB
         self.success = False
         self.error_message = None
     
+    @property
+    def min_time(self) -> float:
+        return min(self.times, default=self.execution_time)
+    
+    @property
+    def quartiles(self) -> Tuple[float, float]:
+        return _quartiles(self.times) if self.times else (self.execution_time, self.execution_time)
+    
+    @property
+    def iqr(self) -> float:
+        q1, q3 = self.quartiles
+        return q3 - q1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        q1, q3 = self.quartiles
+        return {
+            "algorithm": self.algorithm_name,
+            "success": self.success,
+            "error": self.error_message,
+            "repeats": len(self.times),
+            "median": self.execution_time,
+            "min": self.min_time,
+            "q1": q1,
+            "q3": q3,
+            "iqr": q3 - q1,
+            "times": self.times,
+            "relaxations": self.relaxations,
+            "memory_kb": self.memory_usage,
+            "peak_rss_kb": self.peak_rss,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BenchmarkResult':
+        result = cls(data["algorithm"])
+        result.success = data["success"]
+        result.error_message = data["error"]
+        result.execution_time = data["median"]
+        result.times = list(data["times"])
+        result.relaxations = data["relaxations"]
+        result.memory_usage = data["memory_kb"]
+        result.peak_rss = data["peak_rss_kb"]
+        return result
+    
     def __str__(self):
         result = f"\n{self.algorithm_name}:\n"
-        result += f"  Execution Time: {self.execution_time:.6f} seconds\n"
+        result += f"  Execution Time: {self.execution_time:.6f} seconds"
+        if len(self.times) > 1:
+            result += f" (median of {len(self.times)}, IQR {self.iqr:.6f}, min {self.min_time:.6f})"
+        result += "\n"
         result += f"  Relaxations: {self.relaxations}\n"
-        result += f"  Memory Usage: {self.memory_usage:.2f} KB\n"
+        if self.memory_usage is not None:
+            result += f"  Memory Usage: {self.memory_usage:.2f} KB\n"
+        if self.peak_rss is not None:
+            result += f"  Peak RSS: {self.peak_rss:.0f} KB\n"
         result += f"  Success: {self.success}\n"
         if self.error_message:
             result += f"  Error: {self.error_message}\n"
         return result
 
 
-def benchmark_dijkstra(graph: Graph, source: int = 1) -> BenchmarkResult:
-    """Benchmark Dijkstra's algorithm."""
-    result = BenchmarkResult("Dijkstra's Algorithm")
+def _quartiles(times: List[float]) -> Tuple[float, float]:
+    if len(times) < 2:
+        return times[0], times[0]
+    q1, _, q3 = statistics.quantiles(times, n=4, method='inclusive')
+    return q1, q3
+
+
+# Each runner takes (graph, source, **options) and returns
+# (relaxations, error message or None)
+
+def _run_dijkstra(graph: Graph, source: int, **options) -> Tuple[int, Optional[str]]:
+    _, relaxations = dijkstra(graph, source, **options)
+    return relaxations, None
+
+
+def _run_bellman_ford(graph: Graph, source: int, **options) -> Tuple[int, Optional[str]]:
+    _, relaxations, has_negative_cycle = bellman_ford(graph, source, **options)
+    return relaxations, "Negative cycle detected" if has_negative_cycle else None
+
+
+def _run_floyd_warshall(graph: Graph, source: int, **options) -> Tuple[int, Optional[str]]:
+    _, relaxations, has_negative_cycle = floyd_warshall(graph, **options)
+    return relaxations, "Negative cycle detected" if has_negative_cycle else None
+
+
+def _run_johnson(graph: Graph, source: int, **options) -> Tuple[int, Optional[str]]:
+    _, relaxations, has_negative_cycle = johnson(graph, **options)
+    return relaxations, "Negative cycle detected" if has_negative_cycle else None
+
+
+ALGORITHMS: Dict[str, Tuple[str, Callable[..., Tuple[int, Optional[str]]]]] = {
+    'dijkstra': ("Dijkstra's Algorithm", _run_dijkstra),
+    'bellman_ford': ("Bellman-Ford Algorithm", _run_bellman_ford),
+    'floyd_warshall': ("Floyd-Warshall Algorithm", _run_floyd_warshall),
+    'johnson': ("Johnson's Algorithm", _run_johnson),
+}
+
+
+def benchmark_algorithm(algorithm: str, graph: Graph, source: int = 1, repeats: int = BENCHMARK_REPEATS,
+                        warmup: int = BENCHMARK_WARMUP, rss: bool = False, memory: bool = True,
+                        **options) -> BenchmarkResult:
+    """
+    Benchmark one algorithm from ALGORITHMS.
+    
+    After warmup untimed runs, the algorithm is timed repeats times with the
+    garbage collector paused; execution_time is the median of those times.
+    Memory is measured in a separate run under tracemalloc (skipped with
+    memory=False, leaving memory_usage None), which slows Python code too much to share a run with
+    timing, and with rss=True the max RSS of one more run in a fresh
+    subprocess is recorded as well.
+    options are passed through to the algorithm (e.g. engine="numpy").
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm!r} (expected one of {tuple(ALGORITHMS)})")
+    if repeats < 1:
+        raise ValueError("repeats must be positive")
+    name, run = ALGORITHMS[algorithm]
+    result = BenchmarkResult(name)
     
     try:
-        tracemalloc.start()
-        start_time = time.perf_counter()
+        for _ in range(warmup):
+            run(graph, source, **options)
         
-        distances, relaxations = dijkstra(graph, source)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                relaxations, error = run(graph, source, **options)
+                result.times.append(time.perf_counter() - start_time)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
-        end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        if memory:
+            tracemalloc.start()
+            try:
+                run(graph, source, **options)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            result.memory_usage = peak / 1024  # Convert to KB
         
-        result.execution_time = end_time - start_time
+        result.execution_time = statistics.median(result.times)
         result.relaxations = relaxations
-        result.memory_usage = peak / 1024  # Convert to KB
-        result.success = True
+        result.success = error is None
+        result.error_message = error
         
+        if rss:
+            result.peak_rss = measure_peak_rss(algorithm, graph, source, **options)
+    
     except Exception as e:
         result.error_message = str(e)
         result.success = False
@@ -56,94 +211,48 @@ def benchmark_dijkstra(graph: Graph, source: int = 1) -> BenchmarkResult:
     return result
 
 
-def benchmark_bellman_ford(graph: Graph, source: int = 1) -> BenchmarkResult:
+def measure_peak_rss(algorithm: str, graph: Graph, source: int = 1, **options) -> Optional[float]:
+    """
+    Max resident set size, in KB, of a fresh interpreter that receives graph
+    and runs algorithm once; None where the resource module is unavailable.
+    The figure includes the interpreter and the graph itself.
+    """
+    if resource is None:
+        return None
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(_peak_rss_task, algorithm, graph, source, options).result()
+
+
+def _peak_rss_task(algorithm: str, graph: Graph, source: int, options: Dict[str, Any]) -> float:
+    ALGORITHMS[algorithm][1](graph, source, **options)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KB elsewhere
+    return peak / 1024 if sys.platform == 'darwin' else float(peak)
+
+
+def benchmark_dijkstra(graph: Graph, source: int = 1, **kwargs) -> BenchmarkResult:
+    """Benchmark Dijkstra's algorithm."""
+    return benchmark_algorithm('dijkstra', graph, source, **kwargs)
+
+
+def benchmark_bellman_ford(graph: Graph, source: int = 1, **kwargs) -> BenchmarkResult:
     """Benchmark Bellman-Ford algorithm."""
-    result = BenchmarkResult("Bellman-Ford Algorithm")
-    
-    try:
-        tracemalloc.start()
-        start_time = time.perf_counter()
-        
-        distances, relaxations, has_negative_cycle = bellman_ford(graph, source)
-        
-        end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        
-        result.execution_time = end_time - start_time
-        result.relaxations = relaxations
-        result.memory_usage = peak / 1024  # Convert to KB
-        result.success = not has_negative_cycle
-        
-        if has_negative_cycle:
-            result.error_message = "Negative cycle detected"
-        
-    except Exception as e:
-        result.error_message = str(e)
-        result.success = False
-    
-    return result
+    return benchmark_algorithm('bellman_ford', graph, source, **kwargs)
 
 
-def benchmark_floyd_warshall(graph: Graph) -> BenchmarkResult:
+def benchmark_floyd_warshall(graph: Graph, engine: str = "python", **kwargs) -> BenchmarkResult:
     """Benchmark Floyd-Warshall algorithm."""
-    result = BenchmarkResult("Floyd-Warshall Algorithm")
-    
-    try:
-        tracemalloc.start()
-        start_time = time.perf_counter()
-        
-        dist_matrix, relaxations, has_negative_cycle = floyd_warshall(graph)
-        
-        end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        
-        result.execution_time = end_time - start_time
-        result.relaxations = relaxations
-        result.memory_usage = peak / 1024  # Convert to KB
-        result.success = not has_negative_cycle
-        
-        if has_negative_cycle:
-            result.error_message = "Negative cycle detected"
-        
-    except Exception as e:
-        result.error_message = str(e)
-        result.success = False
-    
-    return result
+    return benchmark_algorithm('floyd_warshall', graph, engine=engine, **kwargs)
 
 
-def benchmark_johnson(graph: Graph) -> BenchmarkResult:
+def benchmark_johnson(graph: Graph, **kwargs) -> BenchmarkResult:
     """Benchmark Johnson's algorithm."""
-    result = BenchmarkResult("Johnson's Algorithm")
-    
-    try:
-        tracemalloc.start()
-        start_time = time.perf_counter()
-        
-        dist_matrix, relaxations, has_negative_cycle = johnson(graph)
-        
-        end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        
-        result.execution_time = end_time - start_time
-        result.relaxations = relaxations
-        result.memory_usage = peak / 1024  # Convert to KB
-        result.success = not has_negative_cycle
-        
-        if has_negative_cycle:
-            result.error_message = "Negative cycle detected"
-        
-    except Exception as e:
-        result.error_message = str(e)
-        result.success = False
-    
-    return result
+    return benchmark_algorithm('johnson', graph, **kwargs)
 
 
-def benchmark_all(graph: Graph, test_name: str = "Test", source: int = 1) -> Dict[str, BenchmarkResult]:
+def benchmark_all(graph: Graph, test_name: str = "Test", source: int = 1, repeats: int = BENCHMARK_REPEATS,
+                  warmup: int = BENCHMARK_WARMUP, rss: bool = False, memory: bool = True,
+                  verbose: bool = True) -> Dict[str, BenchmarkResult]:
     """
     Benchmark all algorithms on a graph.
     
@@ -151,56 +260,205 @@ def benchmark_all(graph: Graph, test_name: str = "Test", source: int = 1) -> Dic
         graph: Graph to test
         test_name: Name of the test
         source: Source vertex for single-source algorithms
-        
+        repeats: Timed runs per algorithm
+        warmup: Untimed runs before timing
+        rss: Also measure max RSS in a subprocess
+        memory: Measure tracemalloc peak memory in an extra run
+        verbose: Print progress and results
+    
     Returns:
         Dictionary of algorithm names to benchmark results
     """
-    print(f"\n{'='*60}")
-    print(f"Benchmarking on: {test_name}")
-    print(f"Graph: {graph.num_vertices} vertices, {len(graph.edges)} edges")
-    print(f"{'='*60}")
+    log = print if verbose else (lambda *args: None)
+    log(f"\n{'='*60}")
+    log(f"Benchmarking on: {test_name}")
+    log(f"Graph: {graph.num_vertices} vertices, {len(graph.edges)} edges")
+    log(f"{'='*60}")
     
     results = {}
-    
-    # Single-source algorithms
-    print("\nRunning Dijkstra's Algorithm...")
-    results['dijkstra'] = benchmark_dijkstra(graph, source)
-    
-    print("Running Bellman-Ford Algorithm...")
-    results['bellman_ford'] = benchmark_bellman_ford(graph, source)
-    
-    # All-pairs algorithms
-    print("Running Floyd-Warshall Algorithm...")
-    results['floyd_warshall'] = benchmark_floyd_warshall(graph)
-    
-    print("Running Johnson's Algorithm...")
-    results['johnson'] = benchmark_johnson(graph)
+    for algorithm, (name, _) in ALGORITHMS.items():
+        log(f"Running {name}...")
+        results[algorithm] = benchmark_algorithm(algorithm, graph, source, repeats=repeats, warmup=warmup,
+                                                 rss=rss, memory=memory)
     
     # Print results
     for name, result in results.items():
-        print(result)
+        log(result)
     
     return results
 
 
+def run_benchmark_suite(sizes: Tuple[int, ...] = SUITE_SIZES, seed: int = BENCHMARK_SEED,
+                        repeats: int = BENCHMARK_REPEATS, warmup: int = BENCHMARK_WARMUP, rss: bool = False,
+                        verbose: bool = True) -> Dict[str, Dict[str, BenchmarkResult]]:
+    """
+    benchmark_all over every SUITE_GENERATORS family and size. Each graph is
+    generated right after seeding random from (seed, test name), so a test
+    sees the same graph on every run whatever sizes are selected.
+    """
+    results = {}
+    for family, generate in SUITE_GENERATORS.items():
+        for num_vertices in sizes:
+            test_name = f"{family}_{num_vertices}V"
+            random.seed(f"{seed}:{test_name}")
+            graph = generate(num_vertices)
+            results[test_name] = benchmark_all(graph, test_name, repeats=repeats, warmup=warmup, rss=rss,
+                                               verbose=verbose)
+    return results
+
+
+def results_to_json(results_dict: Dict[str, Dict[str, BenchmarkResult]], **meta) -> Dict[str, Any]:
+    """
+    JSON-ready report of benchmark results, as produced by benchmark_all per
+    test, with the host and any extra meta (seed, repeats, ...) recorded.
+    """
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    host = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": numpy_version,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return {
+        "meta": dict(host, **meta),
+        "results": {test_name: {algo: result.to_dict() for algo, result in results.items()}
+                    for test_name, results in results_dict.items()},
+    }
+
+
+def results_from_json(report: Dict[str, Any]) -> Dict[str, Dict[str, BenchmarkResult]]:
+    return {test_name: {algo: BenchmarkResult.from_dict(data) for algo, data in results.items()}
+            for test_name, results in report["results"].items()}
+
+
+def save_results(report: Dict[str, Any], filename: str) -> None:
+    with open(filename, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    with open(filename) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Regressions of report against a saved baseline report.
+    
+    A test/algorithm pair present in both regresses on time when its median
+    is more than threshold (a fraction) above the baseline median and its
+    lower quartile is above the baseline's upper quartile, so run-to-run
+    noise alone does not trigger it. Memory regresses when the tracemalloc
+    peak grows by more than threshold. A pair that succeeded in the baseline
+    but fails now is also reported.
+    """
+    regressions = []
+    for test_name, results in report["results"].items():
+        for algo, current in results.items():
+            old = baseline["results"].get(test_name, {}).get(algo)
+            if old is None or not old["success"]:
+                continue
+            if not current["success"]:
+                regressions.append({"test": test_name, "algorithm": algo, "metric": "success",
+                                    "baseline": True, "current": False, "ratio": None})
+                continue
+            if current["median"] > old["median"] * (1 + threshold) and current["q1"] > old["q3"]:
+                regressions.append({"test": test_name, "algorithm": algo, "metric": "median",
+                                    "baseline": old["median"], "current": current["median"],
+                                    "ratio": current["median"] / old["median"] if old["median"] else None})
+            if current["memory_kb"] is None or old["memory_kb"] is None:
+                continue
+            if current["memory_kb"] > old["memory_kb"] * (1 + threshold):
+                regressions.append({"test": test_name, "algorithm": algo, "metric": "memory_kb",
+                                    "baseline": old["memory_kb"], "current": current["memory_kb"],
+                                    "ratio": current["memory_kb"] / old["memory_kb"] if old["memory_kb"] else None})
+    return regressions
+
+
+def print_regressions(regressions: List[Dict[str, Any]]) -> None:
+    if not regressions:
+        print("\nNo regressions against baseline.")
+        return
+    print(f"\n{len(regressions)} regression(s) against baseline:")
+    for r in regressions:
+        if r["metric"] == "success":
+            print(f"  {r['test']:<20} {r['algorithm']:<16} now fails")
+        else:
+            ratio = f"{r['ratio']:.2f}x" if r["ratio"] is not None else "new cost"
+            print(f"  {r['test']:<20} {r['algorithm']:<16} {r['metric']:<10} "
+                  f"{r['baseline']:.6g} -> {r['current']:.6g} ({ratio})")
+
+
 def create_comparison_table(results_dict: Dict[str, Dict[str, BenchmarkResult]]) -> None:
     """
     Create a comparison table from multiple benchmark runs.
     
     Args:
         results_dict: Dictionary mapping test names to benchmark results
+    
+    The Memory column is left out when no result measured memory.
     """
     print(f"\n{'='*100}")
     print("BENCHMARK COMPARISON TABLE")
     print(f"{'='*100}\n")
     
+    show_memory = any(result.memory_usage is not None
+                      for results in results_dict.values() for result in results.values())
+    
     # Create header
-    print(f"{'Test Name':<20} {'Algorithm':<20} {'Time (s)':<15} {'Relaxations':<15} {'Memory (KB)':<15}")
+    header = f"{'Test Name':<20} {'Algorithm':<20} {'Time (s)':<15} {'Relaxations':<15}"
+    if show_memory:
+        header += f" {'Memory (KB)':<15}"
+    print(header)
     print("-" * 100)
     
     for test_name, results in sorted(results_dict.items()):
         for algo_name, result in sorted(results.items()):
             if result.success:
-                print(f"{test_name:<20} {result.algorithm_name:<20} {result.execution_time:<15.6f} {result.relaxations:<15} {result.memory_usage:<15.2f}")
+                row = f"{test_name:<20} {result.algorithm_name:<20} {result.execution_time:<15.6f} {result.relaxations:<15}"
+                if show_memory:
+                    memory = f"{result.memory_usage:.2f}" if result.memory_usage is not None else "-"
+                    row += f" {memory:<15}"
+                print(row)
             else:
                 print(f"{test_name:<20} {result.algorithm_name:<20} {'FAILED':<15} {result.error_message:<15}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shortest-path algorithms on seeded graphs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SUITE_SIZES), help="vertex counts")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS)
+    parser.add_argument("--warmup", type=int, default=BENCHMARK_WARMUP)
+    parser.add_argument("--no-rss", action="store_true", help="skip the subprocess max-RSS runs")
+    parser.add_argument("--output", "-o", help="write the JSON report here")
+    parser.add_argument("--baseline", help="compare against this saved JSON report")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative slowdown that counts as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmark_suite(tuple(args.sizes), args.seed, args.repeats, args.warmup,
+                                  rss=not args.no_rss, verbose=False)
+    create_comparison_table(results)
+    report = results_to_json(results, seed=args.seed, repeats=args.repeats, warmup=args.warmup,
+                             sizes=args.sizes)
+    if args.output:
+        save_results(report, args.output)
+        print(f"\nResults saved to {args.output}")
+    if args.baseline:
+        regressions = compare_to_baseline(report, load_results(args.baseline), args.threshold)
+        print_regressions(regressions)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
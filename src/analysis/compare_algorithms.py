@@ -1,13 +1,42 @@
-from typing import Dict, List
+import math
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from src.analysis.graph_generator import (
     generate_sparse_graph,
     generate_dense_graph,
     generate_mixed_graph,
-    generate_complete_graph
+    generate_complete_graph,
+    generate_random_graph
 )
-from src.analysis.benchmark import benchmark_all, create_comparison_table
+from src.analysis.benchmark import BENCHMARK_SEED, benchmark_algorithm, benchmark_all, create_comparison_table
+from src.analysis.apsp_calibration import DEFAULT_PROFILE, describe_crossover, load_profile
 from src.graph_utils import Graph
 
+# Theoretical time as (big-O, exponent of V, exponent of E) with log factors
+# dropped; at a fixed average degree E grows like V, so the exponent of V
+# alone is their sum. Johnson's pair assumes E >= V log V.
+COMPLEXITY: Dict[str, Tuple[str, float, float]] = {
+    'dijkstra': ("O((V+E) log V)", 0, 1),
+    'bellman_ford': ("O(VE)", 1, 1),
+    'floyd_warshall': ("O(V^3)", 3, 0),
+    'johnson': ("O(V^2 log V + VE)", 1, 1),
+}
+
+# Scaling sweep: V = start, start*growth, ... at each average out-degree
+SCALING_DEGREES = (2, 8, 32)
+SCALING_START = 16
+SCALING_GROWTH = 2
+SCALING_BUDGET = 60.0    # seconds for the whole sweep
+SCALING_MAX_RUN = 2.0    # seconds for a single run
+SCALING_MIN_TIME = 1e-3  # faster points are mostly overhead and left out of fits
+
+# benchmark_all settings for the sparse/dense/mixed/large comparisons: one
+# timed run plus the separate memory run; benchmark.py keeps the careful defaults
+COMPARISON_RUN: Dict[str, Any] = {"repeats": 1, "warmup": 0, "memory": True}
+
 
 class AlgorithmComparison:
     """Compare shortest path algorithms."""
@@ -15,6 +44,8 @@ class AlgorithmComparison:
     def __init__(self):
         self.results = {}
         self.summary = {}
+        self.scaling: Dict[str, List[Dict[str, Any]]] = {}
+        self.apsp_profile: Optional[Dict[str, Any]] = None  # from apsp_calibration
     
     def compare_sparse_graphs(self) -> None:
         """Compare algorithms on sparse graphs."""
@@ -25,7 +56,7 @@ class AlgorithmComparison:
         for num_vertices in [10, 25, 50]:
             graph = generate_sparse_graph(num_vertices)
             test_name = f"Sparse_{num_vertices}V"
-            results = benchmark_all(graph, test_name, source=1)
+            results = benchmark_all(graph, test_name, source=1, **COMPARISON_RUN)
             self.results[test_name] = results
     
     def compare_dense_graphs(self) -> None:
@@ -37,7 +68,7 @@ class AlgorithmComparison:
         for num_vertices in [10, 25, 50]:
             graph = generate_dense_graph(num_vertices)
             test_name = f"Dense_{num_vertices}V"
-            results = benchmark_all(graph, test_name, source=1)
+            results = benchmark_all(graph, test_name, source=1, **COMPARISON_RUN)
             self.results[test_name] = results
     
     def compare_mixed_graphs(self) -> None:
@@ -49,9 +80,90 @@ class AlgorithmComparison:
         for num_vertices in [10, 25, 50]:
             graph = generate_mixed_graph(num_vertices, include_negatives=True)
             test_name = f"Mixed_{num_vertices}V"
-            results = benchmark_all(graph, test_name, source=1)
+            results = benchmark_all(graph, test_name, source=1, **COMPARISON_RUN)
             self.results[test_name] = results
     
+    def compare_scaling(self, time_budget: float = SCALING_BUDGET, max_run_time: float = SCALING_MAX_RUN,
+                        degrees: Sequence[int] = SCALING_DEGREES, start: int = SCALING_START,
+                        growth: float = SCALING_GROWTH, repeats: int = 3, seed: int = BENCHMARK_SEED,
+                        algorithms: Sequence[str] = tuple(COMPLEXITY)) -> None:
+        """
+        Time each algorithm on seeded random graphs whose vertex count grows
+        geometrically at each average out-degree in degrees. An algorithm
+        leaves a series once its next size, extrapolated from the slope so
+        far, would take longer than max_run_time or than what is left of the
+        series' share of time_budget. Points go to self.scaling[algorithm].
+        """
+        print("\n" + "="*80)
+        print(f"SCALING SWEEP (degrees {tuple(degrees)}, budget {time_budget:.0f}s)")
+        print("="*80)
+        
+        for algorithm in algorithms:
+            self.scaling.setdefault(algorithm, [])
+        series_budget = time_budget / len(degrees)
+        
+        for degree in degrees:
+            series_end = time.perf_counter() + series_budget
+            active = list(algorithms)
+            previous: Dict[str, Tuple[int, float]] = {}
+            num_vertices = start
+            # Below about 2 * degree vertices the graph is nearly complete and E
+            # grows like V^2, which would skew the fixed-degree slope
+            while num_vertices <= 2 * degree:
+                num_vertices = int(num_vertices * growth)
+            
+            while active and time.perf_counter() < series_end:
+                random.seed(f"{seed}:scaling:{degree}:{num_vertices}")
+                graph = generate_random_graph(num_vertices, degree * num_vertices)
+                print(f"  degree {degree}: {num_vertices} vertices, {len(graph.edges)} edges")
+                # Vertex 1 can be a dead end in a sparse random graph; start
+                # single-source runs from the best-connected vertex instead
+                source = max(graph.vertices, key=lambda u: len(graph.adj_list[u]) if u in graph.adj_list else 0)
+                
+                for algorithm in list(active):
+                    result = benchmark_algorithm(algorithm, graph, source, repeats=repeats, warmup=0, memory=False)
+                    if not result.success:
+                        active.remove(algorithm)
+                        continue
+                    elapsed = result.execution_time
+                    self.scaling[algorithm].append({"vertices": num_vertices, "edges": len(graph.edges),
+                                                    "degree": degree, "time": elapsed})
+                    
+                    if algorithm in previous and elapsed >= SCALING_MIN_TIME:
+                        last_vertices, last_time = previous[algorithm]
+                        slope = math.log(elapsed / last_time) / math.log(num_vertices / last_vertices)
+                    else:
+                        _, v_exp, e_exp = COMPLEXITY[algorithm]
+                        slope = v_exp + e_exp
+                    previous[algorithm] = (num_vertices, elapsed)
+                    predicted = elapsed * growth ** max(slope, 1)
+                    remaining = series_end - time.perf_counter()
+                    if predicted > max_run_time or predicted * repeats > remaining:
+                        active.remove(algorithm)
+                
+                num_vertices = int(num_vertices * growth)
+    
+    def scaling_fit(self, algorithm: str) -> Dict[str, Any]:
+        """
+        Log-log fits of self.scaling[algorithm]: "fixed_degree" maps each
+        degree to the slope of time against V, and "v"/"e" are the exponents
+        of time ~ V^v * E^e fitted over all points (None without enough
+        data). "max_vertices" is the largest V timed within the budget.
+        """
+        points = [p for p in self.scaling.get(algorithm, []) if p["time"] >= SCALING_MIN_TIME]
+        fixed_degree = {}
+        for degree in sorted({p["degree"] for p in points}):
+            series = [p for p in points if p["degree"] == degree]
+            fixed_degree[degree] = fit_loglog_slope([p["vertices"] for p in series], [p["time"] for p in series])
+        joint = fit_loglog_plane([p["vertices"] for p in points], [p["edges"] for p in points],
+                                 [p["time"] for p in points])
+        return {
+            "fixed_degree": fixed_degree,
+            "v": joint[0] if joint else None,
+            "e": joint[1] if joint else None,
+            "max_vertices": max((p["vertices"] for p in self.scaling.get(algorithm, [])), default=None),
+        }
+    
     def generate_analysis_report(self) -> str:
         report = "\n" + "="*80 + "\n"
         report += "ALGORITHM COMPARISON ANALYSIS\n"
@@ -99,23 +211,71 @@ class AlgorithmComparison:
         report += "Dijkstra:\n"
         report += "  - Best for: Non-negative weights, single-source\n"
         report += "  - Time: O((V+E)log V) with heap\n"
+        report += self._measured_scaling('dijkstra')
         report += "  - Space: O(V)\n\n"
         
         report += "Bellman-Ford:\n"
         report += "  - Best for: Negative weights, single-source\n"
         report += "  - Time: O(VE)\n"
+        report += self._measured_scaling('bellman_ford')
         report += "  - Can detect negative cycles\n\n"
         
         report += "Floyd-Warshall:\n"
         report += "  - Best for: All-pairs, small dense graphs\n"
         report += "  - Time: O(V^3)\n"
+        report += self._measured_scaling('floyd_warshall')
         report += "  - Space: O(V^2)\n\n"
         
         report += "Johnson:\n"
         report += "  - Best for: All-pairs sparse graphs\n"
         report += "  - Time: O(V^2 log V + VE)\n"
-        report += "  - Better than Floyd-Warshall for sparse\n"
+        report += self._measured_scaling('johnson')
+        if self.apsp_profile and self.apsp_profile["crossover"]:
+            report += "  - Floyd-Warshall is faster on this host (calibrated):\n"
+            for entry in self.apsp_profile["crossover"]:
+                report += f"      V={entry['vertices']}: {entry['fw_engine']} engine {describe_crossover(entry)}\n"
+        else:
+            report += "  - Better than Floyd-Warshall for sparse\n"
         
+        if any(self.scaling.values()):
+            report += self._scaling_report()
+        
+        return report
+    
+    def _measured_scaling(self, algorithm: str) -> str:
+        # One report line with the measured exponents, empty without a sweep
+        if not self.scaling.get(algorithm):
+            return ""
+        fit = self.scaling_fit(algorithm)
+        _, v_exp, e_exp = COMPLEXITY[algorithm]
+        slopes = [s for s in fit["fixed_degree"].values() if s is not None]
+        line = "  - Measured: "
+        if slopes:
+            line += f"time ~ V^{sum(slopes) / len(slopes):.2f} at fixed degree (theory V^{v_exp + e_exp:g})"
+        else:
+            line += "too few timed sizes for a fit"
+        if fit["v"] is not None:
+            line += f", V^{fit['v']:.2f} E^{fit['e']:.2f} overall (theory V^{v_exp:g} E^{e_exp:g})"
+        return line + "\n"
+    
+    def _scaling_report(self) -> str:
+        report = "\n### EMPIRICAL SCALING ###\n"
+        report += "-" * 40 + "\n"
+        report += "Log-log slope of time against V per average out-degree,\n"
+        report += f"from runs of at least {SCALING_MIN_TIME * 1000:g} ms.\n\n"
+        report += f"{'Algorithm':<16} {'Degree':<8} {'V range':<16} {'Slope':<8} {'Theory':<8}\n"
+        for algorithm, points in sorted(self.scaling.items()):
+            if not points:
+                continue
+            fit = self.scaling_fit(algorithm)
+            _, v_exp, e_exp = COMPLEXITY[algorithm]
+            for degree in sorted({p["degree"] for p in points}):
+                sizes = [p["vertices"] for p in points if p["degree"] == degree]
+                slope = fit["fixed_degree"].get(degree)
+                slope_text = f"{slope:.2f}" if slope is not None else "-"
+                report += (f"{algorithm:<16} {degree:<8} {f'{min(sizes)}-{max(sizes)}':<16} "
+                           f"{slope_text:<8} {v_exp + e_exp:<8g}\n")
+            report += f"{'':<16} largest V within budget: {fit['max_vertices']}\n"
         return report
     
     def save_report(self, filename: str) -> None:
@@ -132,8 +292,51 @@ class AlgorithmComparison:
         print(self.generate_analysis_report())
 
 
-def run_full_comparison(mode: str = "quick") -> None:
+def fit_loglog_slope(xs: Sequence[float], ys: Sequence[float]) -> Optional[float]:
+    # Least-squares slope of log(y) against log(x); None for fewer than two distinct x
+    if len(set(xs)) < 2:
+        return None
+    lx = [math.log(x) for x in xs]
+    ly = [math.log(y) for y in ys]
+    mx, my = sum(lx) / len(lx), sum(ly) / len(ly)
+    sxx = sum((x - mx) ** 2 for x in lx)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(lx, ly))
+    return sxy / sxx
+
+
+def fit_loglog_plane(xs: Sequence[float], zs: Sequence[float],
+                     ys: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """
+    Exponents (a, b) of the least-squares fit y ~ c * x^a * z^b in log
+    space, or None when the points cannot separate x from z (fewer than
+    three, or log z a linear function of log x, as in a single series).
+    """
+    if len(xs) < 3:
+        return None
+    lx = [math.log(x) for x in xs]
+    lz = [math.log(z) for z in zs]
+    ly = [math.log(y) for y in ys]
+    mx, mz, my = sum(lx) / len(lx), sum(lz) / len(lz), sum(ly) / len(ly)
+    sxx = sum((x - mx) ** 2 for x in lx)
+    szz = sum((z - mz) ** 2 for z in lz)
+    sxz = sum((x - mx) * (z - mz) for x, z in zip(lx, lz))
+    sxy = sum((x - mx) * (y - my) for x, y in zip(lx, ly))
+    szy = sum((z - mz) * (y - my) for z, y in zip(lz, ly))
+    det = sxx * szz - sxz * sxz
+    if det <= 1e-9 * max(sxx * szz, 1e-300):
+        return None
+    return (szz * sxy - sxz * szy) / det, (sxx * szy - sxz * sxy) / det
+
+
+def run_full_comparison(mode: str = "quick", time_budget: float = SCALING_BUDGET) -> None:
     comparison = AlgorithmComparison()
+    if os.path.exists(DEFAULT_PROFILE):
+        comparison.apsp_profile = load_profile(DEFAULT_PROFILE)
+    
+    if mode == "scaling":
+        comparison.compare_scaling(time_budget=time_budget)
+        comparison.print_summary()
+        return comparison
     
     # Run all comparisons (quick set)
     comparison.compare_sparse_graphs()
@@ -149,7 +352,7 @@ def run_full_comparison(mode: str = "quick") -> None:
             from src.analysis.graph_generator import generate_dense_graph
             graph = generate_dense_graph(num_vertices)
             test_name = f"Dense_{num_vertices}V_Large"
-            results = benchmark_all(graph, test_name, source=1)
+            results = benchmark_all(graph, test_name, source=1, **COMPARISON_RUN)
             comparison.results[test_name] = results
     
     comparison.print_summary()
@@ -159,4 +362,5 @@ def run_full_comparison(mode: str = "quick") -> None:
 
 
 if __name__ == "__main__":
-    run_full_comparison()
+    # python -m src.analysis.compare_algorithms [quick|large|scaling [budget seconds]]
+    run_full_comparison(*(sys.argv[1:2] + [float(x) for x in sys.argv[2:3]]))
@@ -72,6 +72,35 @@ def generate_complete_graph(num_vertices: int, directed: bool = True) -> Graph:
     return graph
 
 
+def generate_random_graph(num_vertices: int, num_edges: int, directed: bool = True) -> Graph:
+    # num_edges distinct edges u -> v (u != v), weights 1..100, capped at a complete graph
+    graph = Graph(num_vertices, directed=directed)
+    possible = num_vertices * (num_vertices - 1)
+    if not directed:
+        possible //= 2
+    num_edges = min(num_edges, possible)
+    
+    if num_edges * 2 > possible:
+        # Dense: sample from every pair instead of rejecting duplicates
+        pairs = [(u, v) for u in range(1, num_vertices + 1) for v in range(1, num_vertices + 1)
+                 if u != v and (directed or u < v)]
+        chosen = random.sample(pairs, num_edges)
+    else:
+        seen = set()
+        rand = random.random
+        while len(seen) < num_edges:
+            # int(rand() * n) is several times faster than randint here
+            u = int(rand() * num_vertices) + 1
+            v = int(rand() * num_vertices) + 1
+            if u != v:
+                seen.add((u, v) if directed or u < v else (v, u))
+        chosen = list(seen)
+    
+    rand = random.random
+    graph.add_edges((u, v, int(rand() * 100) + 1) for u, v in chosen)
+    return graph
+
+
 def generate_bipartite_graph(num_vertices_per_side: int) -> Graph:
     graph = Graph(num_vertices_per_side * 2, directed=True)
     
@@ -0,0 +1,245 @@
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+import csv
+import mmap
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only from_numpy/to_numpy need it
+    np = None
+
+INF = float('inf')
+
+# Stored value that stands for INF in each supported cell type
+SENTINELS = {
+    'i': 2 ** 31 - 1,  # int32
+    'q': 2 ** 63 - 1,  # int64
+    'f': INF,          # float32
+    'd': INF,          # float64
+}
+
+
+class DistanceMatrix:
+    """
+    All-pairs distances for vertices 1..n in one contiguous typed buffer.
+
+    Cells are stored row-major without the unused row and column 0 of the
+    list-of-lists matrices, but indexing is the same: dist[i][j] reads (and
+    writes) the distance from i to j, with INF for unreachable pairs whatever
+    the cell type. typecode is one of SENTINELS; integer types store INF as
+    their largest value. With filename the buffer is a memory-mapped file
+    instead of process memory, so results larger than RAM spill to disk.
+    """
+
+    def __init__(self, num_vertices: int, typecode: str = 'd', filename: Optional[str] = None):
+        if typecode not in SENTINELS:
+            raise ValueError(f"Unknown distance typecode: {typecode!r} (expected one of {tuple(SENTINELS)})")
+        self.num_vertices = num_vertices
+        self.typecode = typecode
+        self.sentinel = SENTINELS[typecode]
+        self.filename = filename
+        self._mmap = None
+
+        cells = num_vertices * num_vertices
+        row = array(typecode, [self.sentinel]) * num_vertices
+        if filename is None:
+            self.buffer = row * num_vertices
+        else:
+            with open(filename, 'wb+') as f:
+                f.truncate(max(cells * row.itemsize, 1))
+                self._mmap = mmap.mmap(f.fileno(), 0)
+            self.buffer = memoryview(self._mmap)[:cells * row.itemsize].cast(typecode)
+            for i in range(num_vertices):
+                self.buffer[i * num_vertices:(i + 1) * num_vertices] = row
+
+    @classmethod
+    def open(cls, filename: str, num_vertices: int, typecode: str = 'd') -> 'DistanceMatrix':
+        """Map an existing file of row-major cells (a spilled matrix or write_rows_binary output)."""
+        matrix = cls(0, typecode)
+        itemsize = matrix.buffer.itemsize
+        expected = num_vertices * num_vertices * itemsize
+        if os.path.getsize(filename) != expected:
+            raise ValueError(f"{filename}: expected {expected} bytes for {num_vertices} vertices")
+        with open(filename, 'r+b') as f:
+            matrix._mmap = mmap.mmap(f.fileno(), 0)
+        matrix.num_vertices = num_vertices
+        matrix.filename = filename
+        matrix.buffer = memoryview(matrix._mmap)[:expected].cast(typecode)
+        return matrix
+
+    @classmethod
+    def for_graph(cls, graph, filename: Optional[str] = None) -> 'DistanceMatrix':
+        """Matrix with the cell type choose_typecode() picks for graph."""
+        return cls(graph.num_vertices, choose_typecode(graph), filename)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[float]], num_vertices: int, typecode: str = 'd',
+                  filename: Optional[str] = None) -> 'DistanceMatrix':
+        """Copy an (n+1)x(n+1) list matrix or NumPy array (row/column 0 ignored)."""
+        matrix = cls(num_vertices, typecode, filename)
+        if np is not None and isinstance(rows, np.ndarray):
+            view = matrix.to_numpy()
+            for i in range(num_vertices):
+                values = rows[i + 1, 1:]
+                view[i] = np.where(np.isinf(values), matrix.sentinel, values)
+            return matrix
+
+        for i in range(1, num_vertices + 1):
+            matrix.set_row(i, rows[i][1:])
+        return matrix
+
+    @property
+    def nbytes(self) -> int:
+        return self.num_vertices * self.num_vertices * self.buffer.itemsize
+
+    def __getitem__(self, i: int) -> '_MatrixRow':
+        if not 1 <= i <= self.num_vertices:
+            raise IndexError(f"vertex {i} out of range 1..{self.num_vertices}")
+        return _MatrixRow(self, (i - 1) * self.num_vertices)
+
+    def row(self, i: int) -> List[float]:
+        # Distances from i to 1..n as a list
+        start = (i - 1) * self.num_vertices
+        values = self.buffer[start:start + self.num_vertices].tolist()
+        if self.sentinel != INF:
+            values = [INF if d == self.sentinel else d for d in values]
+        return values
+
+    def set_row(self, i: int, values: Iterable[float]) -> None:
+        # Store distances from i to 1..n
+        start = (i - 1) * self.num_vertices
+        sentinel = self.sentinel
+        if sentinel == INF:
+            cells = array(self.typecode, values)
+        else:
+            cells = array(self.typecode, [sentinel if d == INF else int(d) for d in values])
+        if len(cells) != self.num_vertices:
+            raise ValueError(f"row needs {self.num_vertices} values, got {len(cells)}")
+        self.buffer[start:start + self.num_vertices] = cells
+
+    def to_list(self) -> List[List[float]]:
+        # The (n+1)x(n+1) list-of-lists layout the algorithms used to return
+        n = self.num_vertices
+        matrix = [[INF] * (n + 1)]
+        for i in range(1, n + 1):
+            matrix.append([INF] + self.row(i))
+        return matrix
+
+    def to_numpy(self) -> 'np.ndarray':
+        # Zero-copy (n, n) view; unreachable cells hold the raw sentinel
+        if np is None:
+            raise ImportError("NumPy is required for to_numpy()")
+        n = self.num_vertices
+        return np.frombuffer(self.buffer, dtype=self.typecode).reshape(n, n)
+
+    def flush(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        # Release a file-backed buffer; the file itself is kept
+        if self._mmap is not None:
+            self.buffer.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'DistanceMatrix':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _MatrixRow:
+    """Row i of a DistanceMatrix, indexed by target vertex 1..n."""
+
+    def __init__(self, matrix: DistanceMatrix, start: int):
+        self._matrix = matrix
+        self._start = start
+
+    def _index(self, j: int) -> int:
+        if not 1 <= j <= self._matrix.num_vertices:
+            raise IndexError(f"vertex {j} out of range 1..{self._matrix.num_vertices}")
+        return self._start + j - 1
+
+    def __getitem__(self, j: int) -> float:
+        value = self._matrix.buffer[self._index(j)]
+        return INF if value == self._matrix.sentinel else value
+
+    def __setitem__(self, j: int, value: float) -> None:
+        matrix = self._matrix
+        if matrix.sentinel != INF:
+            value = matrix.sentinel if value == INF else int(value)
+        matrix.buffer[self._index(j)] = value
+
+    def __len__(self) -> int:
+        return self._matrix.num_vertices
+
+
+def choose_typecode(graph) -> str:
+    """
+    Cell type for graph's distances: int32 when every weight is an integer
+    and no simple path can exceed int32, int64 for larger integer bounds,
+    float64 otherwise (float32 is only used when asked for explicitly).
+    """
+    weights = [w for _, _, w in graph.edges]
+    if not all(isinstance(w, int) for w in weights):
+        return 'd'
+    bound = max((abs(w) for w in weights), default=0) * max(graph.num_vertices - 1, 1)
+    if bound < SENTINELS['i']:
+        return 'i'
+    if bound < SENTINELS['q']:
+        return 'q'
+    return 'd'
+
+
+
+def write_rows_csv(rows: Iterable[Tuple[int, Sequence[float]]], filename: str, num_vertices: int) -> int:
+    """
+    Stream (source, row) pairs, as yielded by johnson_rows, to CSV.
+
+    The header is "source,1,..,n" and unreachable cells are written as INF.
+    filename "-" writes to stdout. Returns the number of rows written.
+    """
+    f = sys.stdout if filename == '-' else open(filename, 'w', newline='')
+    try:
+        writer = csv.writer(f)
+        writer.writerow(['source'] + list(range(1, num_vertices + 1)))
+        count = 0
+        for source, row in rows:
+            writer.writerow([source] + ['INF' if d == INF else d for d in row[1:num_vertices + 1]])
+            count += 1
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    return count
+
+
+def write_rows_binary(rows: Iterable[Tuple[int, Sequence[float]]], filename: str, num_vertices: int,
+                      typecode: str = 'd') -> int:
+    """
+    Stream (source, row) pairs into a file laid out like a spilled
+    DistanceMatrix, so DistanceMatrix.open() can map the result. Sources
+    that never arrive stay INF. Returns the number of rows written.
+    """
+    if typecode not in SENTINELS:
+        raise ValueError(f"Unknown distance typecode: {typecode!r} (expected one of {tuple(SENTINELS)})")
+    sentinel = SENTINELS[typecode]
+    integral = sentinel != INF
+    empty = array(typecode, [sentinel]) * num_vertices
+    row_bytes = num_vertices * empty.itemsize
+
+    with open(filename, 'wb') as f:
+        for _ in range(num_vertices):
+            f.write(empty)
+        count = 0
+        for source, row in rows:
+            values = row[1:num_vertices + 1]
+            if integral:
+                values = [sentinel if d == INF else int(d) for d in values]
+            f.seek((source - 1) * row_bytes)
+            f.write(array(typecode, values))
+            count += 1
+    return count
@@ -1,9 +1,38 @@
+from array import array
 from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple, Optional, Iterable, Sequence, Union
+import gzip
+import io
+import mmap
+import struct
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized engines need it
+    np = None
+
 INF = float('inf')
 
+# Bytes of edge-list text parsed per batch by read_graph_from_file
+GRAPH_CHUNK_SIZE = 1 << 22
+# Row type of an edge line for np.loadtxt; int64 vertices reject ids like "1.0"
+_EDGE_DTYPE = [('u', 'i8'), ('v', 'i8'), ('w', 'f8')]
+
+# Binary CSR file: header, then int64 offsets (n + 2), int64 targets (m) and
+# int64 or float64 weights (m), all in native byte order.
+BINARY_MAGIC = b'GRAPHCSR'
+_BINARY_HEADER = struct.Struct('<8sQQQ')  # magic, num_vertices, num_edges, flags
+_FLAG_DIRECTED = 1
+_FLAG_FLOAT_WEIGHTS = 2
+_FLAG_BIG_ENDIAN = 4
+
+# Process-wide source of graph versions, so a version number identifies one
+# state of one graph
+_versions = count(1)
+
 
 class Graph:
        
@@ -13,15 +42,123 @@ class Graph:
         self.adj_list = defaultdict(list)  # adjacency list
         self.edges = []  # list of all edges (u, v, weight)
         self.vertices = list(range(1, num_vertices + 1))
+        self._cache = {}  # derived data (e.g. Johnson potentials), reset on change
+        self.version = next(_versions)  # changes on every mutation
+        self._edge_positions = None  # (u, v) -> indices into edges, built on first update
+    
+    def _changed(self) -> None:
+        # Every mutating method calls this first
+        self._cache.clear()
+        self.version = next(_versions)
     
     def add_edge(self, u: int, v: int, weight: float) -> None:
+        self._changed()
+        if self._edge_positions is not None:
+            self._edge_positions.setdefault((u, v), []).append(len(self.edges))
         self.adj_list[u].append((v, weight))
         self.edges.append((u, v, weight))
         
         if not self.directed:
+            if self._edge_positions is not None:
+                self._edge_positions.setdefault((v, u), []).append(len(self.edges))
             self.adj_list[v].append((u, weight))
             self.edges.append((v, u, weight))
     
+    def add_edges(self, edges: Iterable[Tuple[int, int, float]]) -> None:
+        # Bulk add_edge for loaders; same result as adding one at a time
+        self._changed()
+        self._edge_positions = None
+        adj_list, all_edges = self.adj_list, self.edges
+        for u, v, weight in edges:
+            adj_list[u].append((v, weight))
+            all_edges.append((u, v, weight))
+            if not self.directed:
+                adj_list[v].append((u, weight))
+                all_edges.append((v, u, weight))
+    
+    def edge_weight(self, u: int, v: int) -> float:
+        # Smallest weight over the parallel edges u -> v, INF if there is none
+        return min((w for t, w in self.adj_list.get(u, ()) if t == v), default=INF)
+    
+    def update_edge(self, u: int, v: int, weight: float) -> None:
+        """
+        Set the weight of edge u -> v (every parallel copy, and v -> u too in
+        an undirected graph). Costs O(deg(u)) once the edge index exists.
+        Raises ValueError if there is no such edge.
+        """
+        positions = self._edge_index().get((u, v))
+        if not positions:
+            raise ValueError(f"no edge {u} -> {v}")
+        self._changed()
+        self._set_weight(u, v, weight, positions)
+        if not self.directed and u != v:
+            self._set_weight(v, u, weight, self._edge_positions[(v, u)])
+    
+    def remove_edge(self, u: int, v: int) -> None:
+        """
+        Delete edge u -> v (every parallel copy, and v -> u too in an
+        undirected graph). The last entries of edges move into the freed
+        slots, so edge order is not preserved. Costs O(deg(u)) once the edge
+        index exists. Raises ValueError if there is no such edge.
+        """
+        if not self._edge_index().get((u, v)):
+            raise ValueError(f"no edge {u} -> {v}")
+        self._changed()
+        self._drop_edge(u, v)
+        if not self.directed and u != v:
+            self._drop_edge(v, u)
+    
+    def _drop_edge(self, u: int, v: int) -> None:
+        positions = self._edge_positions
+        for p in sorted(positions.pop((u, v)), reverse=True):
+            last = self.edges.pop()
+            if p < len(self.edges):
+                self.edges[p] = last
+                moved = positions[(last[0], last[1])]
+                moved[moved.index(len(self.edges))] = p
+        self.adj_list[u] = [(t, w) for t, w in self.adj_list[u] if t != v]
+    
+    def _set_weight(self, u: int, v: int, weight: float, positions: List[int]) -> None:
+        for p in positions:
+            self.edges[p] = (u, v, weight)
+        self.adj_list[u] = [(t, weight if t == v else w) for t, w in self.adj_list[u]]
+    
+    def _edge_index(self) -> Dict[Tuple[int, int], List[int]]:
+        # Built once in O(E); add_edge and the update methods keep it current
+        if self._edge_positions is None:
+            positions = {}
+            for i, (u, v, _) in enumerate(self.edges):
+                positions.setdefault((u, v), []).append(i)
+            self._edge_positions = positions
+        return self._edge_positions
+    
+    def neighbors(self, u: int) -> Iterable[Tuple[int, float]]:
+        return self.adj_list.get(u, ())
+    
+    def cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        # Memoize data derived from the current edge set
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+    
+    def reversed(self) -> 'Graph':
+        # Graph with every edge flipped (the reverse adjacency index), cached
+        if not self.directed:
+            return self
+        return self.cached('reversed', self._build_reversed)
+    
+    def _build_reversed(self) -> 'Graph':
+        reverse = Graph(self.num_vertices, directed=True)
+        for u, v, weight in self.edges:
+            reverse.add_edge(v, u, weight)
+        return reverse
+    
+    def freeze(self) -> 'CompactGraph':
+        sources = [u for u, _, _ in self.edges]
+        targets = [v for _, v, _ in self.edges]
+        weights = [w for _, _, w in self.edges]
+        return CompactGraph.from_edges(self.num_vertices, sources, targets, weights, self.directed)
+    
     def get_adjacency_matrix(self) -> List[List[float]]:
         matrix = [[INF] * (self.num_vertices + 1) for _ in range(self.num_vertices + 1)]
         
@@ -65,21 +202,14 @@ class Graph:
         return len(visited) == self.num_vertices
     
     def has_negative_cycle(self) -> bool:
-        dist = [INF] * (self.num_vertices + 1)
-        dist[1] = 0
-        
-        # Relax edges num_vertices - 1 times
-        for _ in range(self.num_vertices - 1):
-            for u, v, weight in self.edges:
-                if dist[u] != INF and dist[u] + weight < dist[v]:
-                    dist[v] = dist[u] + weight
-        
-        # Check for negative cycle
-        for u, v, weight in self.edges:
-            if dist[u] != INF and dist[u] + weight < dist[v]:
-                return True
+        return self.negative_cycle() is not None
+    
+    def negative_cycle(self) -> Optional[List[int]]:
+        # Vertices of some negative cycle anywhere in the graph, or None
+        from src.algorithms.bellman_ford import find_negative_cycle
         
-        return False
+        cycle = self.cached('negative_cycle', lambda: find_negative_cycle(self))
+        return None if cycle is None else list(cycle)
     
     def print_graph(self) -> None:
         print(f"\nGraph ({self.num_vertices} vertices, {len(self.edges)} edges)")
@@ -113,31 +243,355 @@ class Graph:
         print()
 
 
-def read_graph_from_file(filename: str) -> Graph:
-    try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
+class CompactGraph:
+    """
+    Frozen CSR (compressed sparse row) form of a Graph.
+    
+    The out-edges of vertex u are targets[offsets[u]:offsets[u + 1]] with the
+    matching entries of weights. Offsets has num_vertices + 2 entries so that
+    vertex numbering stays 1-based like Graph. The three arrays may be any
+    indexable buffers (array.array, memoryview, NumPy arrays).
+    """
+    
+    def __init__(self, num_vertices: int, offsets: Sequence[int], targets: Sequence[int],
+                 weights: Sequence[float], directed: bool = True):
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.vertices = range(1, num_vertices + 1)
+        self.adj_list = _CSRAdjacency(self)
+        self.edges = _CSREdges(self)
+        self._cache = {}
+        self.version = next(_versions)  # never changes: CompactGraph is immutable
+    
+    @classmethod
+    def from_edges(cls, num_vertices: int, sources: Sequence[int], targets: Sequence[int],
+                   weights: Sequence[float], directed: bool = True) -> 'CompactGraph':
+        if not len(sources) == len(targets) == len(weights):
+            raise ValueError("sources, targets and weights must have the same length")
         
-        # Parse first line
-        parts = lines[0].strip().split()
-        num_vertices = int(parts[0])
-        num_edges = int(parts[1])
+        # Integer weights stay integers so results match the Graph version
+        weight_type = 'q' if all(isinstance(w, int) for w in weights) else 'd'
         
-        graph = Graph(num_vertices, directed=True)
+        # Counting sort by source vertex; keeps per-vertex insertion order
+        offsets = array('q', [0]) * (num_vertices + 2)
+        for u in sources:
+            if u < 1 or u > num_vertices:
+                raise ValueError(f"vertex {u} out of range 1..{num_vertices}")
+            offsets[u + 1] += 1
+        for u in range(1, num_vertices + 2):
+            offsets[u] += offsets[u - 1]
         
-        # Parse edges
-        for i in range(1, num_edges + 1):
-            parts = lines[i].strip().split()
-            u = int(parts[0])
-            v = int(parts[1])
-            weight = float(parts[2])
-            graph.add_edge(u, v, weight)
+        csr_targets = array('q', [0]) * len(targets)
+        csr_weights = array(weight_type, [0]) * len(weights)
+        position = array('q', offsets)
+        for u, v, w in zip(sources, targets, weights):
+            if v < 1 or v > num_vertices:
+                raise ValueError(f"vertex {v} out of range 1..{num_vertices}")
+            p = position[u]
+            csr_targets[p] = v
+            csr_weights[p] = w
+            position[u] = p + 1
         
-        return graph
+        return cls(num_vertices, offsets, csr_targets, csr_weights, directed)
     
-    except Exception as e:
-        print(f"Error reading graph from file: {e}")
-        return None
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+    
+    def neighbors(self, u: int) -> Iterable[Tuple[int, float]]:
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+    
+    def freeze(self) -> 'CompactGraph':
+        return self
+    
+    # Frozen graphs never change, so derived data is cached for good
+    cached = Graph.cached
+    
+    def reversed(self) -> 'CompactGraph':
+        # Transposed CSR (the reverse adjacency index), cached
+        if not self.directed:
+            return self
+        return self.cached('reversed', self._build_reversed)
+    
+    def _build_reversed(self) -> 'CompactGraph':
+        offsets = self.offsets
+        sources = [u for u in range(self.num_vertices + 1) for _ in range(offsets[u], offsets[u + 1])]
+        return CompactGraph.from_edges(self.num_vertices, self.targets, sources, self.weights, True)
+    
+    def get_adjacency_matrix(self) -> List[List[float]]:
+        n = self.num_vertices
+        matrix = [[INF] * (n + 1) for _ in range(n + 1)]
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        
+        for u in range(n + 1):
+            row = matrix[u]
+            row[u] = 0
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if row[v] > weights[i]:  # Keep minimum if duplicate edges
+                    row[v] = weights[i]
+        
+        return matrix
+    
+    def get_adjacency_list(self) -> Dict[int, List[Tuple[int, float]]]:
+        return dict(self.adj_list)
+    
+    # Validation and printing only go through adj_list/edges, which the
+    # views below provide, so the Graph implementations apply unchanged.
+    is_valid = Graph.is_valid
+    is_connected = Graph.is_connected
+    has_negative_cycle = Graph.has_negative_cycle
+    negative_cycle = Graph.negative_cycle
+    print_graph = Graph.print_graph
+    print_matrix = Graph.print_matrix
+
+
+class _CSRAdjacency:
+    """Read-only mapping view of a CompactGraph shaped like Graph.adj_list."""
+    
+    def __init__(self, graph: CompactGraph):
+        self._graph = graph
+    
+    def __contains__(self, u) -> bool:
+        offsets = self._graph.offsets
+        return 0 <= u <= self._graph.num_vertices and offsets[u] != offsets[u + 1]
+    
+    def __getitem__(self, u: int) -> List[Tuple[int, float]]:
+        if u not in self:
+            return []
+        return list(self._graph.neighbors(u))
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self) -> int:
+        return len(self.keys())
+    
+    def keys(self) -> List[int]:
+        return [u for u in self._graph.vertices if u in self]
+    
+    def items(self):
+        return [(u, self[u]) for u in self.keys()]
+
+
+class _CSREdges:
+    """Read-only view of a CompactGraph shaped like Graph.edges."""
+    
+    def __init__(self, graph: CompactGraph):
+        self._graph = graph
+    
+    def __len__(self) -> int:
+        return len(self._graph.targets)
+    
+    def __iter__(self):
+        offsets, targets, weights = self._graph.offsets, self._graph.targets, self._graph.weights
+        for u in self._graph.vertices:
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], weights[i]
+    
+    def copy(self) -> List[Tuple[int, int, float]]:
+        return list(self)
+
+
+def edge_arrays(graph) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    # (src, dst, weight) NumPy arrays for a Graph or CompactGraph, int64 for
+    # vertices and float64 for weights; cached on the graph.
+    if np is None:
+        raise ImportError("NumPy is required for edge arrays")
+    return graph.cached('edge_arrays', lambda: _build_edge_arrays(graph))
+
+
+def _build_edge_arrays(graph) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    if isinstance(graph, CompactGraph):
+        offsets = np.asarray(graph.offsets, dtype=np.int64)
+        src = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+        dst = np.asarray(graph.targets, dtype=np.int64)
+        weights = np.asarray(graph.weights, dtype=np.float64)
+    else:
+        edges = np.array(graph.edges, dtype=np.float64).reshape(-1, 3)
+        src = edges[:, 0].astype(np.int64)
+        dst = edges[:, 1].astype(np.int64)
+        weights = edges[:, 2].copy()
+    return src, dst, weights
+
+
+def read_graph_from_file(filename: str, compact: bool = False,
+                         chunk_size: int = GRAPH_CHUNK_SIZE) -> Union[Graph, 'CompactGraph']:
+    """
+    Parse a "V E" header followed by E "u v weight" lines.
+    
+    The text is streamed in chunk_size blocks that are parsed in bulk (with
+    NumPy when available), so memory stays proportional to the graph rather
+    than the file. filename may be "-" for stdin; gzip input is detected
+    automatically. With compact=True the CSR CompactGraph is built directly
+    instead of a Graph. Raises ValueError for malformed input, vertices
+    outside 1..V or an edge count that does not match the header.
+    """
+    with _open_graph_source(filename) as f:
+        blocks = _line_blocks(f, chunk_size)
+        header = next(blocks, b'').split(None, 2)
+        if len(header) < 2:
+            raise ValueError(f"{filename}: missing 'V E' header")
+        num_vertices, num_edges = int(header[0]), int(header[1])
+        first = header[2] if len(header) > 2 else b''
+        
+        graph = Graph(num_vertices, directed=True)
+        parts = []
+        count = 0
+        for block in _chain_block(first, blocks):
+            sources, targets, weights = _parse_edge_block(block)
+            if not len(sources):
+                continue
+            count += len(sources)
+            if count > num_edges:
+                raise ValueError(f"{filename}: more than the {num_edges} edges in the header")
+            _check_vertex_range(sources, targets, num_vertices, count - len(sources))
+            if compact:
+                parts.append((sources, targets, weights))
+            else:
+                graph.add_edges(zip(_as_list(sources), _as_list(targets), _as_list(weights)))
+    
+    if count != num_edges:
+        raise ValueError(f"{filename}: header promises {num_edges} edges, found {count}")
+    if compact:
+        return _compact_from_parts(num_vertices, parts)
+    return graph
+
+
+@contextmanager
+def _open_graph_source(filename: str):
+    # Binary stream for a path or "-" (stdin), gunzipped if it starts with the gzip magic
+    if filename == '-':
+        raw, owned = sys.stdin.buffer, False
+    else:
+        raw, owned = open(filename, 'rb'), True
+    try:
+        if raw.peek(2)[:2] == b'\x1f\x8b':
+            with gzip.GzipFile(fileobj=raw) as f:
+                yield f
+        else:
+            yield raw
+    finally:
+        if owned:
+            raw.close()
+
+
+def _line_blocks(f, chunk_size: int):
+    # Yield chunks of about chunk_size bytes that end on a line boundary
+    pending = b''
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            if pending:
+                yield pending
+            return
+        pending += data
+        cut = pending.rfind(b'\n')
+        if cut >= 0:
+            yield pending[:cut + 1]
+            pending = pending[cut + 1:]
+
+
+def _chain_block(first: bytes, blocks):
+    # The header's block minus the header line, then the remaining blocks
+    yield first
+    yield from blocks
+
+
+def _parse_edge_block(block: bytes):
+    # (sources, targets, weights) for the complete lines in block. NumPy
+    # parses the block in one call; when it rejects the block, the line
+    # parser reports what is wrong so both paths raise the same error.
+    if np is None:
+        return _parse_edge_lines(block)
+    if not block.strip():
+        return (), (), ()
+    try:
+        values = np.loadtxt(io.BytesIO(block), dtype=_EDGE_DTYPE, comments=None, ndmin=1)
+    except ValueError:
+        _parse_edge_lines(block)
+        raise
+    return np.ascontiguousarray(values['u']), np.ascontiguousarray(values['v']), np.ascontiguousarray(values['w'])
+
+
+def _parse_edge_lines(block: bytes):
+    sources, targets, weights = array('q'), array('q'), array('d')
+    for line in block.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) != 3:
+            raise ValueError(f"edge lines must have 3 fields 'u v weight', found {len(fields)}")
+        u, v, weight = fields
+        sources.append(_vertex_id(u))
+        targets.append(_vertex_id(v))
+        try:
+            weights.append(float(weight))
+        except ValueError:
+            raise ValueError(f"edge weight {weight.decode(errors='replace')!r} is not a number") from None
+    return sources, targets, weights
+
+
+def _vertex_id(token: bytes) -> int:
+    # Optional sign and decimal digits only, as NumPy's int64 parser accepts
+    digits = token[1:] if token[:1] in (b'+', b'-') else token
+    if not digits.isdigit():
+        raise ValueError(f"vertex id {token.decode(errors='replace')!r} is not an integer")
+    return int(token)
+
+
+def _check_vertex_range(sources, targets, num_vertices: int, first_edge: int) -> None:
+    for vertices in (sources, targets):
+        if np is not None:
+            bad = np.flatnonzero((vertices < 1) | (vertices > num_vertices))
+            if len(bad):
+                raise ValueError(f"edge {first_edge + bad[0] + 1}: vertex {vertices[bad[0]]} "
+                                 f"out of range 1..{num_vertices}")
+        elif min(vertices) < 1 or max(vertices) > num_vertices:
+            bad = next(i for i, u in enumerate(vertices) if u < 1 or u > num_vertices)
+            raise ValueError(f"edge {first_edge + bad + 1}: vertex {vertices[bad]} "
+                             f"out of range 1..{num_vertices}")
+
+
+def _as_list(values) -> list:
+    return values.tolist() if np is not None and isinstance(values, np.ndarray) else list(values)
+
+
+def _compact_from_parts(num_vertices: int, parts) -> 'CompactGraph':
+    if np is None:
+        sources, targets, weights = array('q'), array('q'), array('d')
+        for s, t, w in parts:
+            sources.extend(s)
+            targets.extend(t)
+            weights.extend(w)
+        return CompactGraph.from_edges(num_vertices, sources, targets, weights)
+    
+    if not parts:
+        parts = [(np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0))]
+    sources, targets, weights = (np.concatenate(column) for column in zip(*parts))
+    parts.clear()
+    # Stable order by source: sort the unique keys (source, position) with
+    # the faster unstable sort when they fit in int64
+    m = len(sources)
+    if (num_vertices + 1) * max(m, 1) < 2 ** 63:
+        order = np.argsort(sources * m + np.arange(m))
+    else:
+        order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(num_vertices + 2, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_vertices + 1), out=offsets[1:])
+    return CompactGraph(num_vertices, _to_array(offsets, 'q'), _to_array(targets[order], 'q'),
+                        _to_array(weights[order], 'd'))
+
+
+def _to_array(values, typecode: str) -> array:
+    result = array(typecode)
+    contiguous = np.ascontiguousarray(values, dtype=np.int64 if typecode == 'q' else np.float64)
+    result.frombytes(memoryview(contiguous).cast('B'))
+    return result
 
 
 def write_graph_to_file(graph: Graph, filename: str) -> None:
@@ -150,6 +604,81 @@ def write_graph_to_file(graph: Graph, filename: str) -> None:
         print(f"Error writing graph to file: {e}")
 
 
+def write_graph_binary(graph, filename: str) -> None:
+    """
+    Save graph in the binary CSR format read by read_graph_binary.
+    
+    A Graph is frozen first; a CompactGraph's arrays are written as they are.
+    """
+    compact = graph.freeze()
+    weight_type = _weight_typecode(compact.weights)
+    flags = 0
+    if compact.directed:
+        flags |= _FLAG_DIRECTED
+    if weight_type == 'd':
+        flags |= _FLAG_FLOAT_WEIGHTS
+    if sys.byteorder == 'big':
+        flags |= _FLAG_BIG_ENDIAN
+    
+    with open(filename, 'wb') as f:
+        f.write(_BINARY_HEADER.pack(BINARY_MAGIC, compact.num_vertices, compact.num_edges, flags))
+        f.write(_binary_block(compact.offsets, 'q'))
+        f.write(_binary_block(compact.targets, 'q'))
+        f.write(_binary_block(compact.weights, weight_type))
+
+
+def read_graph_binary(filename: str) -> CompactGraph:
+    """
+    Open a file written by write_graph_binary as a CompactGraph.
+    
+    The file is memory-mapped read-only and the CSR arrays are memoryviews
+    into the mapping, so opening costs nothing up front, pages are loaded on
+    first touch and processes opening the same file share physical memory.
+    """
+    with open(filename, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    buffer = memoryview(mapping)
+    if len(buffer) < _BINARY_HEADER.size:
+        raise ValueError(f"{filename}: too short for a binary graph header")
+    magic, n, m, flags = _BINARY_HEADER.unpack_from(buffer)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{filename}: not a binary graph file")
+    if bool(flags & _FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+        raise ValueError(f"{filename}: written with a different byte order")
+    expected = _BINARY_HEADER.size + 8 * ((n + 2) + 2 * m)
+    if len(buffer) != expected:
+        raise ValueError(f"{filename}: expected {expected} bytes, found {len(buffer)}")
+    
+    start = _BINARY_HEADER.size
+    offsets = buffer[start:start + 8 * (n + 2)].cast('q')
+    start += 8 * (n + 2)
+    targets = buffer[start:start + 8 * m].cast('q')
+    start += 8 * m
+    weights = buffer[start:start + 8 * m].cast('d' if flags & _FLAG_FLOAT_WEIGHTS else 'q')
+    
+    return CompactGraph(n, offsets, targets, weights, bool(flags & _FLAG_DIRECTED))
+
+
+def _weight_typecode(weights) -> str:
+    # 'q' for integer weight buffers, 'd' otherwise
+    code = getattr(weights, 'typecode', None) or getattr(weights, 'format', None)
+    if code is None and np is not None and isinstance(weights, np.ndarray):
+        code = 'q' if weights.dtype.kind in 'iub' else 'd'
+    return 'q' if code in ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q') else 'd'
+
+
+def _binary_block(values, typecode: str):
+    # values as a buffer of 8-byte typecode items, copying only if needed
+    if isinstance(values, (array, memoryview)):
+        code = values.typecode if isinstance(values, array) else values.format
+        if code == typecode:
+            return values
+    if np is not None and isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values, dtype=np.int64 if typecode == 'q' else np.float64)
+    return array(typecode, values)
+
+
 def create_sample_graphs() -> Dict[str, Graph]:
     graphs = {}
     
@@ -31,16 +31,20 @@ def load_and_process_graph():
         print(f"File not found: {filepath}")
         return None
     
-    graph = read_graph_from_file(filepath)
-    if graph is None:
+    try:
+        graph = read_graph_from_file(filepath)
+    except (OSError, ValueError) as e:
+        print(f"Error reading graph from file: {e}")
         return None
     
     print(f"\nGraph loaded successfully!")
     print(f"Vertices: {graph.num_vertices}")
     print(f"Edges: {len(graph.edges)}")
     
-    if graph.has_negative_cycle():
+    cycle = graph.negative_cycle()
+    if cycle is not None:
         print(" WARNING: Graph contains negative cycles!")
+        print(f" Cycle: {' -> '.join(map(str, cycle + cycle[:1]))}")
     
     graph.print_graph()
     return graph
@@ -126,8 +130,8 @@ def run_full_suite():
     print("This may take a few minutes...")
     print("="*60)
     
-    mode = input("Select mode: [q]uick (default) or [l]arge (adds 100/200 dense)? ").strip().lower()
-    mode = "large" if mode in ["l", "large"] else "quick"
+    mode = input("Select mode: [q]uick (default), [l]arge (adds 100/200 dense) or [s]caling sweep? ").strip().lower()
+    mode = {"l": "large", "large": "large", "s": "scaling", "scaling": "scaling"}.get(mode, "quick")
     
     comparison = run_full_comparison(mode=mode)
     comparison.save_report("results/result.txt")
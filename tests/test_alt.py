@@ -0,0 +1,87 @@
+import os
+import random
+import tempfile
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.dijkstra import dijkstra, shortest_path
+from src.algorithms.alt import preprocess_landmarks, alt_query, save_landmarks, load_landmarks
+from src.analysis.graph_generator import generate_grid_graph
+
+INF = float('inf')
+
+
+class TestALT(unittest.TestCase):
+    def setUp(self):
+        random.seed(2)
+        self.grid = generate_grid_graph(12)
+        
+        # Directed graph with an unreachable part
+        self.graph = Graph(6)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            self.graph.add_edge(u, v, w)
+    
+    def test_matches_dijkstra(self):
+        
+        for selection in ("farthest", "avoid"):
+            table = preprocess_landmarks(self.grid, k=4, selection=selection, seed=1)
+            for s in (1, 20, 77, 144):
+                expected, _ = dijkstra(self.grid, s)
+                for t in range(1, 145, 11):
+                    distance, _, _ = alt_query(self.grid, table, s, t)
+                    self.assertEqual(distance, expected[t])
+    
+    def test_landmark_count(self):
+        
+        table = preprocess_landmarks(self.grid, k=5, seed=3)
+        
+        self.assertEqual(len(table.landmarks), 5)
+        self.assertEqual(len(set(table.landmarks)), 5)
+        self.assertEqual(len(table.forward[0]), 145)
+    
+    def test_path_is_valid(self):
+        
+        table = preprocess_landmarks(self.graph, k=2, seed=0)
+        distance, path, _ = alt_query(self.graph, table, 1, 4)
+        
+        self.assertEqual(distance, 8)
+        self.assertEqual(path, [1, 2, 3, 5, 4])
+    
+    def test_unreachable_target(self):
+        
+        table = preprocess_landmarks(self.graph, k=2, seed=0)
+        
+        self.assertEqual(alt_query(self.graph, table, 4, 1)[:2], (INF, []))
+        self.assertEqual(alt_query(self.graph, table, 1, 6)[:2], (INF, []))
+    
+    def test_settles_fewer_vertices_than_dijkstra(self):
+        
+        table = preprocess_landmarks(self.grid, k=4, seed=1)
+        _, _, plain = shortest_path(self.grid, 1, 144)
+        _, _, guided = alt_query(self.grid, table, 1, 144)
+        
+        self.assertLess(guided, plain)
+    
+    def test_save_and_load(self):
+        
+        table = preprocess_landmarks(self.grid, k=3, seed=4)
+        fd, filename = tempfile.mkstemp(suffix=".alt")
+        os.close(fd)
+        try:
+            save_landmarks(table, filename)
+            loaded = load_landmarks(filename)
+        finally:
+            os.remove(filename)
+        
+        self.assertEqual(loaded.landmarks, table.landmarks)
+        self.assertEqual(list(loaded.forward[1]), list(table.forward[1]))
+        self.assertEqual(list(loaded.backward[2]), list(table.backward[2]))
+        self.assertEqual(alt_query(self.grid, loaded, 5, 140), alt_query(self.grid, table, 5, 140))
+    
+    def test_unknown_selection(self):
+        
+        with self.assertRaises(ValueError):
+            preprocess_landmarks(self.grid, selection="random")
+
+
+if __name__ == '__main__':
+    unittest.main()
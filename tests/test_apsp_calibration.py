@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.johnson import johnson
+from src.analysis.apsp_calibration import (
+    DEFAULT_CROSSOVER, PROFILE_VERSION, all_pairs_shortest_paths, calibrate_apsp, choose_apsp_algorithm,
+    crossover_density, crossover_surface, floyd_warshall_engines, graph_density, load_profile, save_profile
+)
+
+
+def complete_graph(n: int) -> Graph:
+    graph = Graph(n)
+    for u in range(1, n + 1):
+        for v in range(1, n + 1):
+            if u != v:
+                graph.add_edge(u, v, (u * v) % 7 + 1)
+    return graph
+
+
+def path_graph(n: int) -> Graph:
+    graph = Graph(n)
+    for u in range(1, n):
+        graph.add_edge(u, u + 1, 2)
+    return graph
+
+
+class TestCrossover(unittest.TestCase):
+    
+    def test_crossover_density(self):
+        self.assertIsNone(crossover_density([(0.01, 3.0), (0.1, 2.0), (1.0, 1.5)]))
+        self.assertEqual(crossover_density([(0.01, 0.5), (0.1, 0.2)]), 0.0)
+        # Ratio 2 -> 0.5 between 0.01 and 0.04: log midpoint
+        self.assertAlmostEqual(crossover_density([(0.01, 2.0), (0.04, 0.5), (0.2, 0.1)]), 0.02)
+        # A single win below a loss does not count
+        self.assertAlmostEqual(crossover_density([(0.01, 0.9), (0.04, 2.0), (0.16, 0.5)]), 0.08)
+    
+    def test_crossover_surface(self):
+        def m(v, d, algorithm, engine, t):
+            return {"vertices": v, "density": d, "edges": 0, "algorithm": algorithm, "engine": engine, "time": t}
+        measurements = [
+            m(64, 0.01, "johnson", None, 1.0), m(64, 0.01, "floyd_warshall", "python", 5.0),
+            m(64, 0.01, "floyd_warshall", "numpy", 2.0),
+            m(64, 0.04, "johnson", None, 2.0), m(64, 0.04, "floyd_warshall", "python", 5.0),
+            m(64, 0.04, "floyd_warshall", "numpy", 1.0),
+            # No Johnson time at this size, so no entry
+            m(128, 0.01, "floyd_warshall", "numpy", 1.0),
+        ]
+        surface = crossover_surface(measurements)
+        self.assertEqual(len(surface), 1)
+        self.assertEqual(surface[0]["vertices"], 64)
+        self.assertEqual(surface[0]["fw_engine"], "numpy")
+        self.assertAlmostEqual(surface[0]["density"], 0.02)
+
+
+class TestChooseAPSP(unittest.TestCase):
+    
+    def profile(self, density, engine="python"):
+        return {"version": PROFILE_VERSION,
+                "crossover": [{"vertices": 10, "fw_engine": engine, "density": density},
+                              {"vertices": 1000, "fw_engine": engine, "density": None}]}
+    
+    def test_uses_nearest_profile_entry(self):
+        profile = self.profile(0.5)
+        self.assertEqual(choose_apsp_algorithm(complete_graph(8), profile), ("floyd_warshall", {"engine": "python"}))
+        self.assertEqual(choose_apsp_algorithm(path_graph(8), profile), ("johnson", {}))
+        # Nearest entry (1000 vertices) says Johnson always wins
+        self.assertEqual(choose_apsp_algorithm(complete_graph(200), profile), ("johnson", {}))
+    
+    def test_always_and_unavailable_engine(self):
+        self.assertEqual(choose_apsp_algorithm(path_graph(8), self.profile(0.0))[0], "floyd_warshall")
+        # An engine this host cannot run falls back to the defaults
+        algorithm, options = choose_apsp_algorithm(complete_graph(8), self.profile(0.0, engine="gpu"))
+        self.assertIn(options.get("engine", "python"), floyd_warshall_engines())
+    
+    def test_defaults_without_profile(self):
+        engine = "numpy" if "numpy" in floyd_warshall_engines() else "python"
+        expected = "johnson" if DEFAULT_CROSSOVER[engine] is None else "floyd_warshall"
+        self.assertEqual(choose_apsp_algorithm(complete_graph(8))[0], expected)
+        self.assertEqual(choose_apsp_algorithm(path_graph(400))[0], "johnson")
+    
+    def test_dispatch_matches_johnson(self):
+        graph = complete_graph(6)
+        graph.add_edge(1, 2, -1)
+        expected, _, _ = johnson(graph)
+        for density in (0.0, None):
+            dist, _, has_cycle = all_pairs_shortest_paths(graph, self.profile(density))
+            self.assertFalse(has_cycle)
+            for i in graph.vertices:
+                for j in graph.vertices:
+                    self.assertEqual(dist[i][j], expected[i][j])
+    
+    def test_graph_density(self):
+        self.assertEqual(graph_density(complete_graph(5)), 1.0)
+        self.assertAlmostEqual(graph_density(path_graph(5)), 4 / 20)
+        self.assertEqual(graph_density(Graph(1)), 1.0)
+
+
+class TestCalibration(unittest.TestCase):
+    
+    def test_small_calibration_round_trip(self):
+        profile = calibrate_apsp(sizes=(8, 16), densities=(0.2, 1.0), time_budget=5.0, repeats=1, verbose=False)
+        algorithms = {(m["algorithm"], m["engine"]) for m in profile["measurements"]}
+        self.assertIn(("johnson", None), algorithms)
+        self.assertIn(("floyd_warshall", "python"), algorithms)
+        self.assertEqual([e["vertices"] for e in profile["crossover"]], [8, 16])
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "profiles", "apsp.json")
+            save_profile(profile, filename)
+            loaded = load_profile(filename)
+            self.assertEqual(loaded["crossover"], json.loads(json.dumps(profile["crossover"])))
+            
+            loaded["version"] = PROFILE_VERSION + 1
+            save_profile(loaded, filename)
+            with self.assertRaises(ValueError):
+                load_profile(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,15 @@
+import random
 import unittest
 from src.graph_utils import Graph
-from src.algorithms.bellman_ford import bellman_ford
+from src.algorithms.bellman_ford import bellman_ford, find_negative_cycle, STRATEGIES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 INF = float('inf')
+AVAILABLE_STRATEGIES = [s for s in STRATEGIES if s != "numpy" or np is not None]
 
 
 class TestBellmanFord(unittest.TestCase):
@@ -75,6 +82,95 @@ class TestBellmanFord(unittest.TestCase):
         # Shortest path 2->3->5->4 has cost 1+3+2 = 6
         self.assertEqual(distances[4], 6)
     
+    def test_compact_graph(self):
+        
+        for graph in (self.graph1, self.graph2):
+            expected, _, _ = bellman_ford(graph, 1)
+            distances, _, has_cycle = bellman_ford(graph.freeze(), 1)
+            
+            self.assertFalse(has_cycle)
+            self.assertEqual(distances, expected)
+        
+        _, _, has_cycle = bellman_ford(self.graph3.freeze(), 1)
+        self.assertTrue(has_cycle)
+    
+    def test_queue_strategies_match_classic(self):
+       
+        random.seed(3)
+        graphs = [self.graph1, self.graph2, self.graph4]
+        for _ in range(50):
+            n = random.randint(1, 10)
+            graph = Graph(n)
+            for _ in range(random.randint(0, 25)):
+                graph.add_edge(random.randint(1, n), random.randint(1, n), random.randint(-3, 10))
+            graphs.append(graph)
+        
+        for graph in graphs:
+            expected, _, expected_cycle = bellman_ford(graph, 1)
+            for strategy in AVAILABLE_STRATEGIES:
+                distances, _, has_cycle = bellman_ford(graph, 1, strategy=strategy)
+                self.assertEqual(has_cycle, expected_cycle)
+                if not expected_cycle:
+                    self.assertEqual(distances, expected)
+    
+    def test_queue_strategies_detect_negative_cycle(self):
+        
+        for strategy in ("spfa", "yen"):
+            _, _, has_cycle = bellman_ford(self.graph3, 1, strategy=strategy)
+            self.assertTrue(has_cycle)
+            _, _, has_cycle = bellman_ford(self.graph3.freeze(), 1, strategy=strategy)
+            self.assertTrue(has_cycle)
+    
+    def test_negative_self_loop(self):
+        
+        graph = Graph(2)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 2, -1)
+        
+        for strategy in AVAILABLE_STRATEGIES:
+            _, _, has_cycle = bellman_ford(graph, 1, strategy=strategy)
+            self.assertTrue(has_cycle)
+    
+    def test_spfa_relaxes_less_than_classic(self):
+        
+        # Chain listed back to front: classic needs every pass, SPFA one sweep
+        graph = Graph(6)
+        for u in range(5, 0, -1):
+            graph.add_edge(u, u + 1, 1)
+        
+        classic, classic_relax, _ = bellman_ford(graph, 1)
+        distances, relaxations, _ = bellman_ford(graph, 1, strategy="spfa")
+        
+        self.assertEqual(distances, classic)
+        self.assertEqual(relaxations, 5)
+        self.assertEqual(classic_relax, 5)
+    
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_numpy_strategy(self):
+       
+        distances, relaxations, has_cycle = bellman_ford(self.graph2.freeze(), 1, strategy="numpy")
+        
+        self.assertFalse(has_cycle)
+        self.assertEqual(distances, {1: 0, 2: -1, 3: 2, 4: -3})
+        self.assertGreater(relaxations, 0)
+        
+        _, _, has_cycle = bellman_ford(self.graph3, 1, strategy="numpy")
+        self.assertTrue(has_cycle)
+    
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_numpy_strategy_edgeless_graph(self):
+       
+        distances, relaxations, has_cycle = bellman_ford(self.graph4, 1, strategy="numpy")
+        
+        self.assertEqual(distances, {1: 0})
+        self.assertEqual(relaxations, 0)
+        self.assertFalse(has_cycle)
+    
+    def test_unknown_strategy(self):
+        
+        with self.assertRaises(ValueError):
+            bellman_ford(self.graph1, 1, strategy="dijkstra")
+    
     def test_relaxations_count(self):
        
         _, relaxations, _ = bellman_ford(self.graph1, 1)
@@ -90,5 +186,68 @@ class TestBellmanFord(unittest.TestCase):
         self.assertLess(distances[4], distances[3] + 5)
 
 
+class TestFindNegativeCycle(unittest.TestCase):
+    
+    def assertNegativeCycle(self, graph, cycle):
+        self.assertIsNotNone(cycle)
+        self.assertEqual(len(set(cycle)), len(cycle))
+        total = sum(graph.edge_weight(cycle[i], cycle[(i + 1) % len(cycle)]) for i in range(len(cycle)))
+        self.assertLess(total, 0)
+    
+    def test_no_cycle(self):
+        graph = Graph(4)
+        graph.add_edge(1, 2, 4)
+        graph.add_edge(2, 3, -3)
+        graph.add_edge(3, 4, 2)
+        graph.add_edge(1, 4, -1)
+        self.assertIsNone(find_negative_cycle(graph))
+    
+    def test_cycle_unreachable_from_vertex_1(self):
+        graph = Graph(5)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(3, 4, 2)
+        graph.add_edge(4, 5, -4)
+        graph.add_edge(5, 3, 1)
+        cycle = find_negative_cycle(graph)
+        self.assertNegativeCycle(graph, cycle)
+        self.assertEqual(sorted(cycle), [3, 4, 5])
+        self.assertTrue(graph.has_negative_cycle())
+        self.assertEqual(sorted(graph.negative_cycle()), [3, 4, 5])
+    
+    def test_negative_self_loop(self):
+        graph = Graph(3)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(3, 3, -1)
+        self.assertEqual(find_negative_cycle(graph), [3])
+    
+    def test_undirected_negative_edge(self):
+        graph = Graph(3, directed=False)
+        graph.add_edge(1, 2, 5)
+        graph.add_edge(2, 3, -2)
+        self.assertEqual(sorted(find_negative_cycle(graph)), [2, 3])
+    
+    def test_compact_graph(self):
+        graph = Graph(3)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 3, -3)
+        graph.add_edge(3, 2, 1)
+        compact = graph.freeze()
+        self.assertNegativeCycle(graph, find_negative_cycle(compact))
+    
+    def test_matches_queue_strategy_on_random_graphs(self):
+        rng = random.Random(22)
+        for _ in range(200):
+            n = rng.randint(1, 8)
+            graph = Graph(n)
+            for _ in range(rng.randint(0, 16)):
+                graph.add_edge(rng.randint(1, n), rng.randint(1, n), rng.randint(-3, 8))
+            # Whole-graph reference: every vertex as a source
+            expected = any(bellman_ford(graph, s, strategy="spfa")[2] for s in graph.vertices)
+            cycle = find_negative_cycle(graph)
+            self.assertEqual(cycle is not None, expected)
+            if cycle is not None:
+                self.assertNegativeCycle(graph, cycle)
+
+
 if __name__ == '__main__':
     unittest.main()
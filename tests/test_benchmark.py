@@ -0,0 +1,113 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from src.graph_utils import Graph
+from src.analysis.benchmark import (
+    BenchmarkResult, benchmark_algorithm, benchmark_all, compare_to_baseline, create_comparison_table,
+    resource, results_from_json, results_to_json, run_benchmark_suite
+)
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = Graph(4)
+        self.graph.add_edge(1, 2, 1)
+        self.graph.add_edge(2, 3, 2)
+        self.graph.add_edge(1, 3, 5)
+        self.graph.add_edge(3, 4, 1)
+    
+    def test_repeats_and_statistics(self):
+        result = benchmark_algorithm('dijkstra', self.graph, repeats=4, warmup=1)
+        self.assertTrue(result.success)
+        self.assertEqual(len(result.times), 4)
+        self.assertEqual(result.min_time, min(result.times))
+        self.assertLessEqual(result.min_time, result.execution_time)
+        self.assertGreaterEqual(result.iqr, 0)
+        self.assertGreater(result.relaxations, 0)
+        self.assertGreater(result.memory_usage, 0)
+        self.assertIsNone(result.peak_rss)
+    
+    def test_single_repeat(self):
+        result = benchmark_algorithm('johnson', self.graph, repeats=1, warmup=0)
+        self.assertEqual(result.execution_time, result.times[0])
+        self.assertEqual(result.iqr, 0)
+    
+    def test_skip_memory_run(self):
+        results = benchmark_all(self.graph, "Tiny", repeats=1, warmup=0, memory=False, verbose=False)
+        for result in results.values():
+            self.assertTrue(result.success)
+            self.assertIsNone(result.memory_usage)
+        report = results_to_json({"Tiny": results})
+        self.assertEqual(compare_to_baseline(report, report), [])
+        table = io.StringIO()
+        with redirect_stdout(table):
+            create_comparison_table({"Tiny": results})
+        self.assertNotIn("Memory", table.getvalue())
+        with redirect_stdout(table):
+            create_comparison_table({"Tiny": benchmark_all(self.graph, "Tiny", repeats=1, warmup=0, verbose=False)})
+        self.assertIn("Memory (KB)", table.getvalue())
+    
+    def test_negative_cycle_fails(self):
+        self.graph.add_edge(4, 3, -2)
+        result = benchmark_algorithm('bellman_ford', self.graph, repeats=1)
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_message, "Negative cycle detected")
+    
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            benchmark_algorithm('bfs', self.graph)
+    
+    def test_json_round_trip(self):
+        results = {"Tiny": benchmark_all(self.graph, "Tiny", repeats=2, warmup=0, verbose=False)}
+        report = json.loads(json.dumps(results_to_json(results, seed=7)))
+        self.assertEqual(report["meta"]["seed"], 7)
+        self.assertEqual(set(report["results"]["Tiny"]), {'dijkstra', 'bellman_ford', 'floyd_warshall', 'johnson'})
+        restored = results_from_json(report)["Tiny"]["johnson"]
+        original = results["Tiny"]["johnson"]
+        self.assertEqual(restored.times, original.times)
+        self.assertEqual(restored.execution_time, original.execution_time)
+        self.assertEqual(restored.relaxations, original.relaxations)
+    
+    def test_compare_to_baseline(self):
+        def report(times, memory=10.0, success=True):
+            result = BenchmarkResult("Dijkstra's Algorithm")
+            result.times = times
+            result.execution_time = sorted(times)[len(times) // 2]
+            result.memory_usage = memory
+            result.success = success
+            return results_to_json({"T": {"dijkstra": result}})
+        
+        baseline = report([1.0, 1.1, 0.9, 1.0, 1.05])
+        self.assertEqual(compare_to_baseline(baseline, baseline), [])
+        # Slower median but overlapping spread is noise
+        self.assertEqual(compare_to_baseline(report([0.9, 1.2, 1.3, 1.0, 1.25]), baseline), [])
+        
+        slower = compare_to_baseline(report([1.5, 1.6, 1.55, 1.5, 1.6]), baseline)
+        self.assertEqual([r["metric"] for r in slower], ["median"])
+        self.assertGreater(slower[0]["ratio"], 1.4)
+        
+        bigger = compare_to_baseline(report([1.0, 1.1, 0.9, 1.0, 1.05], memory=20.0), baseline)
+        self.assertEqual([r["metric"] for r in bigger], ["memory_kb"])
+        
+        failing = compare_to_baseline(report([1.0], success=False), baseline)
+        self.assertEqual([r["metric"] for r in failing], ["success"])
+    
+    def test_suite_graphs_are_seeded(self):
+        first = run_benchmark_suite(sizes=(8,), seed=3, repeats=1, warmup=0, verbose=False)
+        second = run_benchmark_suite(sizes=(8,), seed=3, repeats=1, warmup=0, verbose=False)
+        self.assertEqual(set(first), {"Sparse_8V", "Dense_8V", "Mixed_8V"})
+        for test_name in first:
+            for algo in first[test_name]:
+                self.assertEqual(first[test_name][algo].relaxations, second[test_name][algo].relaxations)
+    
+    @unittest.skipIf(resource is None, "resource module not available")
+    def test_peak_rss_subprocess(self):
+        result = benchmark_algorithm('floyd_warshall', self.graph, repeats=1, warmup=0, rss=True)
+        self.assertTrue(result.success)
+        self.assertGreater(result.peak_rss, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
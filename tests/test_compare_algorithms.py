@@ -0,0 +1,77 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from src.analysis.compare_algorithms import (
+    AlgorithmComparison, COMPLEXITY, fit_loglog_plane, fit_loglog_slope
+)
+
+
+class TestScalingFits(unittest.TestCase):
+    
+    def test_slope_of_power_law(self):
+        xs = [10, 20, 40, 80]
+        self.assertAlmostEqual(fit_loglog_slope(xs, [3 * x ** 2.5 for x in xs]), 2.5)
+        self.assertIsNone(fit_loglog_slope([10, 10], [1.0, 2.0]))
+    
+    def test_plane_separates_v_and_e(self):
+        points = [(v, v * d) for v in (100, 200, 400) for d in (2, 8, 32)]
+        xs = [v for v, _ in points]
+        zs = [e for _, e in points]
+        ys = [1e-6 * v ** 2 * e ** 0.5 for v, e in points]
+        a, b = fit_loglog_plane(xs, zs, ys)
+        self.assertAlmostEqual(a, 2)
+        self.assertAlmostEqual(b, 0.5)
+    
+    def test_plane_needs_independent_points(self):
+        # A single fixed-degree series cannot tell V from E
+        xs = [100, 200, 400]
+        self.assertIsNone(fit_loglog_plane(xs, [4 * x for x in xs], [x ** 2 for x in xs]))
+        self.assertIsNone(fit_loglog_plane([1, 2], [1, 2], [1, 2]))
+
+
+class TestScalingSweep(unittest.TestCase):
+    
+    def test_small_sweep(self):
+        comparison = AlgorithmComparison()
+        comparison.compare_scaling(time_budget=2.0, max_run_time=0.05, degrees=(2, 4), start=8,
+                                   algorithms=('dijkstra', 'johnson'))
+        self.assertEqual(set(comparison.scaling), {'dijkstra', 'johnson'})
+        for points in comparison.scaling.values():
+            self.assertTrue(points)
+            self.assertTrue(all(p["time"] > 0 and p["edges"] <= p["degree"] * p["vertices"] for p in points))
+            # The degree-4 series starts once the graph can be sparse
+            self.assertGreater(min(p["vertices"] for p in points if p["degree"] == 4), 8)
+        
+        fit = comparison.scaling_fit('dijkstra')
+        self.assertEqual(fit["max_vertices"], max(p["vertices"] for p in comparison.scaling['dijkstra']))
+        report = comparison.generate_analysis_report()
+        self.assertIn("EMPIRICAL SCALING", report)
+        self.assertIn("Measured:", report)
+    
+    def test_report_without_sweep(self):
+        report = AlgorithmComparison().generate_analysis_report()
+        self.assertNotIn("EMPIRICAL SCALING", report)
+        self.assertNotIn("Measured:", report)
+    
+    def test_complexity_covers_benchmarked_algorithms(self):
+        self.assertEqual(set(COMPLEXITY), {'dijkstra', 'bellman_ford', 'floyd_warshall', 'johnson'})
+
+
+
+class TestComparisonModes(unittest.TestCase):
+    
+    def test_one_run_per_algorithm(self):
+        # The quick and large modes time each algorithm once, without the
+        # harness's warmup or repeats, and still fill the Memory column
+        comparison = AlgorithmComparison()
+        with redirect_stdout(io.StringIO()):
+            comparison.compare_sparse_graphs()
+        self.assertEqual(set(comparison.results), {"Sparse_10V", "Sparse_25V", "Sparse_50V"})
+        for results in comparison.results.values():
+            for result in results.values():
+                self.assertEqual(len(result.times), 1)
+                self.assertGreater(result.memory_usage, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.dijkstra import dijkstra, shortest_path
+from src.algorithms.contraction_hierarchies import build_contraction_hierarchy, ch_query
+from src.analysis.graph_generator import generate_grid_graph, generate_sparse_graph
+
+INF = float('inf')
+
+
+class TestContractionHierarchies(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph(6)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            self.graph.add_edge(u, v, w)
+        self.hierarchy = build_contraction_hierarchy(self.graph)
+    
+    def test_every_vertex_ranked(self):
+        
+        ranks = self.hierarchy.rank[1:]
+        self.assertEqual(sorted(ranks), list(range(1, 7)))
+    
+    def test_matches_dijkstra(self):
+        
+        for s in self.graph.vertices:
+            expected, _ = dijkstra(self.graph, s)
+            for t in self.graph.vertices:
+                distance, _, _ = ch_query(self.hierarchy, s, t)
+                self.assertEqual(distance, expected[t])
+    
+    def test_unpacked_path(self):
+        
+        distance, path, _ = ch_query(self.hierarchy, 1, 4)
+        
+        self.assertEqual(distance, 8)
+        self.assertEqual(path, [1, 2, 3, 5, 4])
+    
+    def test_unreachable(self):
+        
+        self.assertEqual(ch_query(self.hierarchy, 4, 1)[:2], (INF, []))
+        self.assertEqual(ch_query(self.hierarchy, 1, 6)[:2], (INF, []))
+    
+    def test_random_graphs_with_small_witness_limit(self):
+        
+        random.seed(9)
+        for _ in range(5):
+            graph = generate_sparse_graph(30)
+            hierarchy = build_contraction_hierarchy(graph, witness_settle_limit=3)
+            for s in range(1, 31, 7):
+                expected, _ = dijkstra(graph, s)
+                for t in graph.vertices:
+                    distance, path, _ = ch_query(hierarchy, s, t)
+                    self.assertEqual(distance, expected[t])
+                    if path:
+                        self.assertEqual((path[0], path[-1]), (s, t))
+    
+    def test_grid_settles_fewer_vertices(self):
+        
+        random.seed(4)
+        grid = generate_grid_graph(15)
+        hierarchy = build_contraction_hierarchy(grid)
+        
+        expected, _, plain = shortest_path(grid, 1, 225, bidirectional=True)
+        distance, path, settled = ch_query(hierarchy, 1, 225)
+        
+        self.assertEqual(distance, expected)
+        self.assertEqual((path[0], path[-1]), (1, 225))
+        self.assertLess(settled, plain)
+    
+    def test_negative_weights_rejected(self):
+        
+        graph = Graph(2)
+        graph.add_edge(1, 2, -1)
+        with self.assertRaises(ValueError):
+            build_contraction_hierarchy(graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.dijkstra import dijkstra
+from src.algorithms.delta_stepping import delta_stepping, choose_delta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INF = float('inf')
+
+
+class TestDeltaStepping(unittest.TestCase):
+    def random_graph(self, n, m, max_weight, seed):
+        rng = random.Random(seed)
+        graph = Graph(n)
+        for _ in range(m):
+            graph.add_edge(rng.randint(1, n), rng.randint(1, n), rng.randint(0, max_weight))
+        return graph
+    
+    def engines(self):
+        return ["python"] + (["numpy"] if np is not None else [])
+    
+    def test_simple_graph(self):
+        
+        graph = Graph(5)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            graph.add_edge(u, v, w)
+        for engine in self.engines():
+            distances, _ = delta_stepping(graph, 1, engine=engine)
+            
+            self.assertEqual(distances, {1: 0, 2: 2, 3: 3, 4: 8, 5: 6})
+    
+    def test_matches_dijkstra(self):
+        
+        for seed in range(10):
+            graph = self.random_graph(60, 250, 30, seed)
+            expected, _ = dijkstra(graph, 1)
+            for engine in self.engines():
+                for delta in (None, 1, 5, 100):
+                    distances, _ = delta_stepping(graph, 1, delta=delta, engine=engine)
+                    
+                    self.assertEqual(distances, expected)
+    
+    def test_compact_graph_and_float_weights(self):
+        
+        rng = random.Random(3)
+        graph = Graph(40)
+        for _ in range(150):
+            graph.add_edge(rng.randint(1, 40), rng.randint(1, 40), rng.random() * 10)
+        expected, _ = dijkstra(graph, 5)
+        for engine in self.engines():
+            distances, _ = delta_stepping(graph.freeze(), 5, delta=0.7, engine=engine)
+            
+            self.assertEqual(distances, expected)
+    
+    def test_unreachable_vertices(self):
+        
+        graph = Graph(4)
+        graph.add_edge(1, 2, 5)
+        graph.add_edge(3, 4, 3)
+        for engine in self.engines():
+            distances, _ = delta_stepping(graph, 1, engine=engine)
+            
+            self.assertEqual(distances[2], 5)
+            self.assertEqual(distances[3], INF)
+            self.assertEqual(distances[4], INF)
+    
+    def test_choose_delta(self):
+        
+        graph = self.random_graph(50, 200, 40, 7)
+        delta = choose_delta(graph)
+        
+        self.assertGreater(delta, 0)
+        self.assertLessEqual(delta, 40)
+    
+    def test_rejects_negative_weights_and_bad_arguments(self):
+        
+        graph = Graph(2)
+        graph.add_edge(1, 2, -1)
+        for engine in self.engines():
+            with self.assertRaises(ValueError):
+                delta_stepping(graph, 1, engine=engine)
+        with self.assertRaises(ValueError):
+            delta_stepping(graph, 1, delta=0)
+        with self.assertRaises(ValueError):
+            delta_stepping(graph, 1, engine="gpu")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import random
+import time
 import unittest
 from src.graph_utils import Graph
-from src.algorithms.dijkstra import dijkstra
+from src.algorithms.dijkstra import dijkstra, shortest_path, small_integer_weight_bound, DIAL_MAX_WEIGHT
+from src.algorithms.priority_queues import IndexedDaryHeap
 
 INF = float('inf')
 
@@ -74,6 +77,106 @@ class TestDijkstra(unittest.TestCase):
         for v, d in distances.items():
             self.assertTrue(d >= 0 or d == INF)
     
+    def test_compact_graph(self):
+        
+        expected, _ = dijkstra(self.graph1, 1)
+        distances, _ = dijkstra(self.graph1.freeze(), 1)
+        
+        self.assertEqual(distances, expected)
+    
+    def test_shortest_path_query(self):
+        
+        for bidirectional in (False, True):
+            distance, path, _ = shortest_path(self.graph1, 1, 4, bidirectional=bidirectional)
+            
+            self.assertEqual(distance, 8)
+            self.assertEqual(path, [1, 2, 3, 5, 4])
+    
+    def test_shortest_path_stops_at_target(self):
+        
+        # 2 is settled right after the source, before 3, 4 and 5
+        _, path, settled = shortest_path(self.graph1, 1, 2)
+        
+        self.assertEqual(path, [1, 2])
+        self.assertEqual(settled, 2)
+    
+    def test_shortest_path_unreachable(self):
+        
+        for bidirectional in (False, True):
+            distance, path, _ = shortest_path(self.graph3, 1, 4, bidirectional=bidirectional)
+            
+            self.assertEqual(distance, INF)
+            self.assertEqual(path, [])
+    
+    def test_shortest_path_same_vertex(self):
+        
+        self.assertEqual(shortest_path(self.graph1, 3, 3), (0, [3], 0))
+    
+    def test_bidirectional_matches_dijkstra(self):
+        
+        compact = self.graph1.freeze()
+        for s in range(1, 6):
+            expected, _ = dijkstra(self.graph1, s)
+            for t in range(1, 6):
+                distance, _, _ = shortest_path(compact, s, t, bidirectional=True)
+                self.assertEqual(distance, expected[t])
+    
+    def test_pluggable_queue(self):
+        
+        expected, _ = dijkstra(self.graph1, 1)
+        heap = IndexedDaryHeap(self.graph1.num_vertices + 1)
+        
+        for queue in ("heapq", "dary", heap):
+            distances, _ = dijkstra(self.graph1, 1, queue=queue)
+            self.assertEqual(distances, expected)
+        self.assertEqual(heap.pops, 5)
+        self.assertEqual(heap.stale_pops, 0)
+    
+    def test_integer_weight_detection(self):
+        
+        self.assertEqual(small_integer_weight_bound(self.graph1), 7)
+        self.assertEqual(small_integer_weight_bound(self.graph1.freeze()), 7)
+        self.assertIsNone(small_integer_weight_bound(self.graph2))
+        
+        # Cached value is dropped when the graph changes
+        self.graph3.add_edge(2, 3, 2.0)
+        self.assertEqual(small_integer_weight_bound(self.graph3), 5)
+        self.graph3.add_edge(2, 4, 0.5)
+        self.assertIsNone(small_integer_weight_bound(self.graph3))
+        self.graph1.add_edge(1, 5, DIAL_MAX_WEIGHT + 1)
+        self.assertIsNone(small_integer_weight_bound(self.graph1))
+    
+    def test_bucket_queue_matches_heap(self):
+        
+        random.seed(6)
+        graph = Graph(60)
+        for _ in range(300):
+            graph.add_edge(random.randint(1, 60), random.randint(1, 60), random.randint(0, 10))
+        
+        for source in (1, 17, 42):
+            expected, _ = dijkstra(graph, source, queue="heapq")
+            distances, _ = dijkstra(graph, source)
+            self.assertEqual(distances, expected)
+    
+    def test_bucket_queue_long_heavy_path(self):
+        # Dial must skip empty buckets instead of stepping through every distance
+        n = 20000
+        graph = Graph(n)
+        for u in range(1, n):
+            graph.add_edge(u, u + 1, DIAL_MAX_WEIGHT)
+        self.assertEqual(small_integer_weight_bound(graph), DIAL_MAX_WEIGHT)
+        
+        start = time.perf_counter()
+        distances, _ = dijkstra(graph, 1)
+        dial_time = time.perf_counter() - start
+        start = time.perf_counter()
+        expected, _ = dijkstra(graph, 1, queue="heapq")
+        heap_time = time.perf_counter() - start
+        
+        self.assertEqual(distances, expected)
+        self.assertEqual(distances[n], (n - 1) * DIAL_MAX_WEIGHT)
+        self.assertLess(dial_time, 10 * heap_time + 0.05)
+    
     def test_relaxations_count(self):
        
         _, relaxations = dijkstra(self.graph1, 1)
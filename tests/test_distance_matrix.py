@@ -0,0 +1,208 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from src.graph_utils import Graph
+from src.distance_matrix import DistanceMatrix, choose_typecode, write_rows_csv, write_rows_binary
+from src.algorithms.floyd_warshall import floyd_warshall, print_distance_matrix
+from src.algorithms.johnson import johnson, johnson_rows
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INF = float('inf')
+
+
+class TestDistanceMatrix(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph(5)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            self.graph.add_edge(u, v, w)
+        self.expected, _, _ = floyd_warshall(self.graph)
+    
+    def assertSameDistances(self, matrix, expected, n):
+        for i in range(1, n + 1):
+            for j in range(1, n + 1):
+                self.assertEqual(matrix[i][j], expected[i][j])
+    
+    def test_indexing_and_inf_sentinel(self):
+        
+        for typecode in ('i', 'q', 'f', 'd'):
+            matrix = DistanceMatrix(3, typecode)
+            matrix[1][2] = 5
+            
+            self.assertEqual(matrix[1][2], 5)
+            self.assertEqual(matrix[2][1], INF)
+            self.assertEqual(matrix.row(1), [INF, 5, INF])
+            self.assertEqual(matrix.nbytes, 9 * matrix.buffer.itemsize)
+        with self.assertRaises(IndexError):
+            matrix[0]
+        with self.assertRaises(IndexError):
+            matrix[1][4]
+    
+    def test_choose_typecode(self):
+        
+        self.assertEqual(choose_typecode(self.graph), 'i')
+        graph = Graph(2)
+        graph.add_edge(1, 2, 2 ** 40)
+        self.assertEqual(choose_typecode(graph), 'q')
+        graph.add_edge(2, 1, 0.5)
+        self.assertEqual(choose_typecode(graph), 'd')
+    
+    def test_compact_results_match_lists(self):
+        
+        fw, fw_relax, _ = floyd_warshall(self.graph, compact=True)
+        jo, _, _ = johnson(self.graph, compact=True)
+        
+        self.assertIsInstance(fw, DistanceMatrix)
+        self.assertEqual(fw.typecode, 'i')
+        self.assertEqual(fw_relax, floyd_warshall(self.graph)[1])
+        self.assertSameDistances(fw, self.expected, 5)
+        self.assertSameDistances(jo, self.expected, 5)
+        self.assertEqual(fw.to_list()[1:], [[INF] + row[1:] for row in self.expected[1:]])
+    
+    def test_parallel_johnson_and_float_weights(self):
+        
+        rng = random.Random(5)
+        graph = Graph(12)
+        for _ in range(40):
+            graph.add_edge(rng.randint(1, 12), rng.randint(1, 12), rng.random() * 10)
+        expected, _, _ = johnson(graph)
+        for workers in (1, 2):
+            matrix, _, _ = johnson(graph, workers=workers, compact=True)
+            
+            self.assertEqual(matrix.typecode, 'd')
+            self.assertSameDistances(matrix, expected, 12)
+        matrix, _, _ = johnson(self.graph, workers=2, compact=True)
+        self.assertSameDistances(matrix, self.expected, 5)
+    
+    def test_spill_to_file(self):
+        
+        fd, filename = tempfile.mkstemp(suffix=".dist")
+        os.close(fd)
+        try:
+            matrix, _, _ = johnson(self.graph, filename=filename)
+            self.assertSameDistances(matrix, self.expected, 5)
+            matrix.close()
+            self.assertEqual(os.path.getsize(filename), 25 * 4)
+        finally:
+            os.remove(filename)
+    
+    def test_print_helpers_unchanged(self):
+        
+        matrix, _, _ = floyd_warshall(self.graph, compact=True)
+        printed, expected = io.StringIO(), io.StringIO()
+        with redirect_stdout(printed):
+            print_distance_matrix(matrix, 5)
+        with redirect_stdout(expected):
+            print_distance_matrix(self.expected, 5)
+        
+        self.assertEqual(printed.getvalue(), expected.getvalue())
+    
+    def test_write_rows_csv(self):
+        
+        graph = Graph(3)
+        graph.add_edge(1, 2, 4)
+        graph.add_edge(2, 3, 1.5)
+        fd, filename = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        try:
+            count = write_rows_csv(johnson_rows(graph), filename, 3)
+            with open(filename) as f:
+                lines = f.read().splitlines()
+        finally:
+            os.remove(filename)
+        
+        self.assertEqual(count, 3)
+        self.assertEqual(lines, ["source,1,2,3", "1,0,4,5.5", "2,INF,0,1.5", "3,INF,INF,0"])
+    
+    def test_write_rows_binary(self):
+        
+        fd, filename = tempfile.mkstemp(suffix=".dist")
+        os.close(fd)
+        try:
+            for typecode in ('i', 'd'):
+                count = write_rows_binary(johnson_rows(self.graph), filename, 5, typecode)
+                matrix = DistanceMatrix.open(filename, 5, typecode)
+                
+                self.assertEqual(count, 5)
+                self.assertSameDistances(matrix, self.expected, 5)
+                matrix.close()
+            with self.assertRaises(ValueError):
+                DistanceMatrix.open(filename, 4, 'd')
+        finally:
+            os.remove(filename)
+    
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_numpy_engine(self):
+        
+        matrix, _, _ = floyd_warshall(self.graph, engine="numpy", compact=True)
+        
+        self.assertSameDistances(matrix, self.expected, 5)
+        self.assertEqual(matrix.to_numpy().shape, (5, 5))
+    
+    def test_floyd_warshall_in_place(self):
+        
+        rng = random.Random(9)
+        graphs = [self.graph]
+        for weight in (lambda: rng.randint(-2, 9), lambda: rng.randint(1, 2 ** 40), lambda: rng.random() * 10):
+            graph = Graph(15)
+            for _ in range(50):
+                # u < v keeps the negative weights free of cycles
+                u = rng.randint(1, 14)
+                graph.add_edge(u, rng.randint(u + 1, 15), weight())
+            graphs.append(graph)
+        cycle = Graph(3)
+        for u, v, w in [(1, 2, 1), (2, 3, -3), (3, 1, 1)]:
+            cycle.add_edge(u, v, w)
+        engines = ("python", "numpy", "blocked") if np is not None else ("python",)
+        fd, filename = tempfile.mkstemp(suffix=".dist")
+        os.close(fd)
+        try:
+            for graph in graphs:
+                expected, relaxations, has_cycle = floyd_warshall(graph)
+                for engine in engines:
+                    for spill in (None, filename):
+                        matrix, matrix_relax, matrix_cycle = floyd_warshall(graph, engine, True, spill)
+                        
+                        self.assertEqual(matrix.typecode, choose_typecode(graph))
+                        self.assertEqual(matrix_cycle, has_cycle)
+                        if not has_cycle:
+                            self.assertSameDistances(matrix, expected, graph.num_vertices)
+                            if engine != "blocked":
+                                self.assertEqual(matrix_relax, relaxations)
+                        matrix.close()
+            for engine in engines:
+                self.assertTrue(floyd_warshall(cycle, engine, compact=True)[2])
+        finally:
+            os.remove(filename)
+    
+    def test_floyd_warshall_negative_cycle_int32(self):
+        
+        # Distances keep falling around the cycle; int32 cells must neither
+        # overflow nor wrap around
+        rng = random.Random(0)
+        graph = Graph(64)
+        for _ in range(320):
+            graph.add_edge(rng.randint(1, 64), rng.randint(1, 64), rng.randint(1, 10))
+        graph.add_edge(2, 1, -50)
+        engines = ("python", "numpy", "blocked") if np is not None else ("python",)
+        
+        self.assertTrue(floyd_warshall(graph)[2])
+        for engine in engines:
+            matrix, _, has_cycle = floyd_warshall(graph, engine, compact=True)
+            
+            self.assertEqual(matrix.typecode, 'i')
+            self.assertTrue(has_cycle)
+            cells = [d for i in range(1, 65) for d in matrix.row(i)]
+            self.assertGreater(min(cells), -2 ** 31)
+            self.assertTrue(any(matrix[i][i] < 0 for i in range(1, 65)))
+            self.assertTrue(all(d == INF or d <= 10 * 63 for d in cells))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.dijkstra import dijkstra
+from src.algorithms.dynamic_sssp import DynamicSSSP
+
+INF = float('inf')
+
+
+class TestDynamicSSSP(unittest.TestCase):
+    def setUp(self):
+        # 1->2(2), 1->3(4), 2->3(1), 2->4(7), 3->5(3), 4->5(1), 5->4(2)
+        self.graph = Graph(5)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            self.graph.add_edge(u, v, w)
+        self.sssp = DynamicSSSP(self.graph, 1)
+    
+    def test_initial_tree(self):
+        
+        self.assertEqual(self.sssp.distances(), dijkstra(self.graph, 1)[0])
+        self.assertEqual(self.sssp.parent[1:], [None, 1, 2, 5, 3])
+    
+    def test_decrease_propagates(self):
+        
+        changed = self.sssp.update_edge(1, 3, 1)
+        
+        self.assertEqual(changed, 3)
+        self.assertEqual(self.sssp.distances(), {1: 0, 2: 2, 3: 1, 4: 6, 5: 4})
+        self.assertEqual(self.sssp.parent[3], 1)
+    
+    def test_increase_uses_alternative_path(self):
+        
+        self.assertEqual(self.sssp.add_edge(1, 3, 3), 0)
+        changed = self.sssp.update_edge(2, 3, 5)
+        
+        self.assertEqual(changed, 0)
+        self.assertEqual(self.sssp.parent[3], 1)
+        self.assertEqual(self.sssp.distances(), dijkstra(self.graph, 1)[0])
+    
+    def test_remove_tree_edge(self):
+        
+        changed = self.sssp.remove_edge(3, 5)
+        
+        self.assertEqual(changed, 2)
+        self.assertEqual(self.sssp.distances(), {1: 0, 2: 2, 3: 3, 4: 9, 5: 10})
+        self.sssp.remove_edge(2, 4)
+        self.assertEqual(self.sssp.dist[4], INF)
+        self.assertIsNone(self.sssp.parent[5])
+    
+    def test_random_updates_match_dijkstra(self):
+        
+        for seed in range(20):
+            rng = random.Random(seed)
+            graph = Graph(10, directed=seed % 3 != 0)
+            for _ in range(20):
+                graph.add_edge(rng.randint(1, 10), rng.randint(1, 10), rng.randint(0, 5))
+            sssp = DynamicSSSP(graph, 1)
+            for _ in range(30):
+                u, v, r = rng.randint(1, 10), rng.randint(1, 10), rng.random()
+                before = list(sssp.dist)
+                try:
+                    if r < 0.35:
+                        changed = sssp.remove_edge(u, v)
+                    elif r < 0.7:
+                        changed = sssp.update_edge(u, v, rng.randint(0, 5))
+                    else:
+                        changed = sssp.add_edge(u, v, rng.randint(0, 5))
+                except ValueError:
+                    continue
+                
+                self.assertEqual(sssp.distances(), dijkstra(graph, 1)[0])
+                self.assertEqual(changed, sum(1 for a, b in zip(before, sssp.dist) if a != b))
+    
+    def test_rejects_negative_weights(self):
+        
+        with self.assertRaises(ValueError):
+            self.sssp.add_edge(1, 2, -1)
+        graph = Graph(2)
+        graph.add_edge(1, 2, -1)
+        with self.assertRaises(ValueError):
+            DynamicSSSP(graph, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,16 @@
 Unit tests for Floyd-Warshall Algorithm
 """
 
+import random
 import unittest
 from src.graph_utils import Graph
-from src.algorithms.floyd_warshall import floyd_warshall
+from src.algorithms.floyd_warshall import floyd_warshall, floyd_warshall_rows, blocked_floyd_warshall
+from src.analysis.graph_generator import generate_dense_graph, generate_mixed_graph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 INF = float('inf')
 
@@ -99,11 +106,127 @@ class TestFloydWarshall(unittest.TestCase):
         self.assertEqual(dist[1][2], dist[2][1])
         self.assertEqual(dist[2][3], dist[3][2])
     
+    def test_compact_graph(self):
+        """Test that a frozen graph gives the same matrix."""
+        expected, _, _ = floyd_warshall(self.graph2)
+        dist, _, has_cycle = floyd_warshall(self.graph2.freeze())
+        
+        self.assertFalse(has_cycle)
+        self.assertEqual(dist, expected)
+    
     def test_relaxations_count(self):
         """Test that relaxations are counted."""
         _, relaxations, _ = floyd_warshall(self.graph1)
         
         self.assertGreater(relaxations, 0)
+    
+    def test_rows_generator(self):
+        """Test that rows are yielded in source order."""
+        dist, _, _ = floyd_warshall(self.graph1)
+        engines = ("python", "numpy") if np is not None else ("python",)
+        for engine in engines:
+            rows = list(floyd_warshall_rows(self.graph1, engine))
+            
+            self.assertEqual(rows, [(i, dist[i]) for i in range(1, 6)])
+        with self.assertRaises(ValueError):
+            next(floyd_warshall_rows(self.graph3))
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestFloydWarshallNumpy(unittest.TestCase):
+    """Test cases for the vectorized NumPy engine."""
+    
+    def assertSameResult(self, graph):
+        expected, expected_relax, expected_cycle = floyd_warshall(graph)
+        dist, relaxations, has_cycle = floyd_warshall(graph, engine="numpy")
+        
+        self.assertEqual(has_cycle, expected_cycle)
+        self.assertEqual(relaxations, expected_relax)
+        self.assertTrue((dist == np.array(expected)).all())
+    
+    def test_matches_python_engine(self):
+        """Test that both engines agree on distances and relaxations."""
+        random.seed(7)
+        self.assertSameResult(generate_dense_graph(30))
+        self.assertSameResult(generate_mixed_graph(30, include_negatives=False))
+    
+    def test_negative_weights(self):
+        """Test negative edges without a negative cycle."""
+        graph = Graph(4)
+        for u, v, w in [(1, 2, -1), (1, 3, 4), (2, 3, 3), (2, 4, 2), (3, 4, -5)]:
+            graph.add_edge(u, v, w)
+        self.assertSameResult(graph)
+    
+    def test_negative_cycle_detection(self):
+        """Test negative cycle detection."""
+        graph = Graph(3)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 3, -3)
+        graph.add_edge(3, 1, 1)
+        
+        _, _, has_cycle = floyd_warshall(graph, engine="numpy")
+        self.assertTrue(has_cycle)
+    
+    def test_compact_graph(self):
+        """Test that the engine reads CSR arrays directly."""
+        random.seed(11)
+        self.assertSameResult(generate_dense_graph(20).freeze())
+    
+    def test_unknown_engine(self):
+        """Test that an unknown engine name is rejected."""
+        with self.assertRaises(ValueError):
+            floyd_warshall(Graph(2), engine="fortran")
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestBlockedFloydWarshall(unittest.TestCase):
+    """Test cases for the tiled multi-process variant."""
+    
+    def setUp(self):
+        random.seed(5)
+        self.graph = generate_dense_graph(40)
+        self.expected, _, _ = floyd_warshall(self.graph)
+    
+    def test_single_process_matches(self):
+        """Test in-process tiling with a block size that does not divide V."""
+        dist, _, has_cycle = blocked_floyd_warshall(self.graph, block_size=7, workers=1)
+        
+        self.assertFalse(has_cycle)
+        self.assertTrue((dist == np.array(self.expected)).all())
+    
+    def test_worker_pool_matches(self):
+        """Test the shared-memory process pool path."""
+        dist, relaxations, has_cycle = blocked_floyd_warshall(self.graph, block_size=8, workers=2)
+        
+        self.assertFalse(has_cycle)
+        self.assertGreater(relaxations, 0)
+        self.assertTrue((dist == np.array(self.expected)).all())
+    
+    def test_negative_weights(self):
+        """Test negative edges through the blocked engine."""
+        graph = Graph(4)
+        for u, v, w in [(1, 2, -1), (1, 3, 4), (2, 3, 3), (2, 4, 2), (3, 4, -5)]:
+            graph.add_edge(u, v, w)
+        expected, _, _ = floyd_warshall(graph)
+        dist, _, has_cycle = blocked_floyd_warshall(graph, block_size=2, workers=2)
+        
+        self.assertFalse(has_cycle)
+        self.assertTrue((dist == np.array(expected)).all())
+    
+    def test_negative_cycle_detection(self):
+        """Test negative cycle detection."""
+        graph = Graph(3)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 3, -3)
+        graph.add_edge(3, 1, 1)
+        
+        _, _, has_cycle = blocked_floyd_warshall(graph, block_size=1, workers=2)
+        self.assertTrue(has_cycle)
+    
+    def test_invalid_block_size(self):
+        """Test that a non-positive tile size is rejected."""
+        with self.assertRaises(ValueError):
+            blocked_floyd_warshall(self.graph, block_size=0)
 
 
 if __name__ == '__main__':
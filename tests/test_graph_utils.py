@@ -0,0 +1,286 @@
+import gzip
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from src import graph_utils
+from src.graph_utils import (Graph, CompactGraph, write_graph_binary, read_graph_binary,
+                             read_graph_from_file, write_graph_to_file)
+from src.algorithms.dijkstra import dijkstra
+
+INF = float('inf')
+
+
+class TestCompactGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph(5)
+        edges = [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]
+        for u, v, w in edges:
+            self.graph.add_edge(u, v, w)
+        self.compact = self.graph.freeze()
+    
+    def test_freeze_returns_compact_graph(self):
+        self.assertIsInstance(self.compact, CompactGraph)
+        self.assertEqual(self.compact.num_vertices, 5)
+        self.assertEqual(self.compact.num_edges, 7)
+        self.assertEqual(len(self.compact.edges), len(self.graph.edges))
+    
+    def test_neighbors_match_adjacency_list(self):
+        for u in self.graph.vertices:
+            self.assertEqual(list(self.compact.neighbors(u)), list(self.graph.neighbors(u)))
+    
+    def test_offsets_layout(self):
+        self.assertEqual(list(self.compact.offsets), [0, 0, 2, 4, 5, 6, 7])
+        self.assertEqual(list(self.compact.targets), [2, 3, 3, 4, 5, 5, 4])
+    
+    def test_same_adjacency_matrix(self):
+        self.assertEqual(self.compact.get_adjacency_matrix(), self.graph.get_adjacency_matrix())
+    
+    def test_undirected_edges_stored_both_ways(self):
+        graph = Graph(3, directed=False)
+        graph.add_edge(1, 2, 5)
+        graph.add_edge(2, 3, 1.5)
+        compact = graph.freeze()
+        
+        self.assertFalse(compact.directed)
+        self.assertEqual(compact.num_edges, 4)
+        self.assertEqual(sorted(compact.neighbors(2)), [(1, 5.0), (3, 1.5)])
+    
+    def test_integer_weights_stay_integral(self):
+        self.assertEqual(self.compact.weights.typecode, 'q')
+    
+    def test_out_of_range_vertex_rejected(self):
+        with self.assertRaises(ValueError):
+            CompactGraph.from_edges(2, [1], [3], [1])
+    
+    def test_adjacency_view(self):
+        graph = Graph(4)
+        graph.add_edge(1, 2, 5)
+        compact = graph.freeze()
+        
+        self.assertIn(1, compact.adj_list)
+        self.assertNotIn(3, compact.adj_list)
+        self.assertEqual(compact.get_adjacency_list(), graph.get_adjacency_list())
+
+
+class TestBinaryGraphFile(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".csr")
+        os.close(fd)
+    
+    def tearDown(self):
+        os.remove(self.filename)
+    
+    def test_round_trip(self):
+        
+        graph = Graph(5)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            graph.add_edge(u, v, w)
+        write_graph_binary(graph, self.filename)
+        loaded = read_graph_binary(self.filename)
+        
+        self.assertIsInstance(loaded, CompactGraph)
+        self.assertEqual(loaded.num_vertices, 5)
+        self.assertEqual(loaded.num_edges, 7)
+        self.assertTrue(loaded.directed)
+        self.assertEqual(sorted(loaded.edges), sorted(graph.edges))
+        self.assertEqual(loaded.weights.format, 'q')
+        self.assertEqual(dijkstra(loaded, 1)[0], dijkstra(graph, 1)[0])
+    
+    def test_float_weights_and_undirected(self):
+        
+        graph = Graph(3, directed=False)
+        graph.add_edge(1, 2, 0.5)
+        graph.add_edge(2, 3, 1.25)
+        write_graph_binary(graph.freeze(), self.filename)
+        loaded = read_graph_binary(self.filename)
+        
+        self.assertFalse(loaded.directed)
+        self.assertEqual(loaded.weights.format, 'd')
+        self.assertEqual(sorted(loaded.neighbors(2)), [(1, 0.5), (3, 1.25)])
+    
+    def test_rejects_other_files(self):
+        
+        with open(self.filename, 'w') as f:
+            f.write("5 7\n1 2 2\n")
+        with self.assertRaises(ValueError):
+            read_graph_binary(self.filename)
+
+
+class TestReadGraphFromFile(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        rng = random.Random(2)
+        self.graph = Graph(30)
+        for _ in range(200):
+            self.graph.add_edge(rng.randint(1, 30), rng.randint(1, 30), float(rng.randint(-5, 20)))
+    
+    def tearDown(self):
+        os.remove(self.filename)
+    
+    def write_text(self, text):
+        with open(self.filename, 'w') as f:
+            f.write(text)
+    
+    def test_round_trip_in_small_chunks(self):
+        
+        write_graph_to_file(self.graph, self.filename)
+        for chunk_size in (7, 64, 1 << 20):
+            loaded = read_graph_from_file(self.filename, chunk_size=chunk_size)
+            
+            self.assertEqual(loaded.num_vertices, 30)
+            self.assertEqual(loaded.edges, self.graph.edges)
+    
+    def test_compact(self):
+        
+        write_graph_to_file(self.graph, self.filename)
+        loaded = read_graph_from_file(self.filename, compact=True, chunk_size=100)
+        expected = self.graph.freeze()
+        
+        self.assertIsInstance(loaded, CompactGraph)
+        self.assertEqual(list(loaded.offsets), list(expected.offsets))
+        self.assertEqual(list(loaded.targets), list(expected.targets))
+        self.assertEqual(list(loaded.weights), list(expected.weights))
+    
+    def test_gzip_and_stdin(self):
+        
+        write_graph_to_file(self.graph, self.filename)
+        with open(self.filename, 'rb') as f:
+            text = f.read()
+        with open(self.filename, 'wb') as f:
+            f.write(gzip.compress(text))
+        
+        self.assertEqual(read_graph_from_file(self.filename).edges, self.graph.edges)
+        stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(text)))
+        with mock.patch('sys.stdin', stdin):
+            self.assertEqual(read_graph_from_file('-').edges, self.graph.edges)
+    
+    def test_edge_count_mismatch(self):
+        
+        self.write_text("3 2\n1 2 1\n")
+        with self.assertRaises(ValueError):
+            read_graph_from_file(self.filename)
+        self.write_text("3 1\n1 2 1\n2 3 1\n")
+        with self.assertRaises(ValueError):
+            read_graph_from_file(self.filename)
+    
+    def test_malformed_input(self):
+        
+        for text in ("", "3 1\n1 4 1\n", "3 1\n0 2 1\n", "3 1\n1 2\n", "3 1\n1.5 2 1\n"):
+            self.write_text(text)
+            with self.assertRaises(ValueError):
+                read_graph_from_file(self.filename)
+            with self.assertRaises(ValueError):
+                read_graph_from_file(self.filename, compact=True)
+    
+    def test_parsers_agree(self):
+        
+        # The NumPy and pure-Python parsers accept and reject the same lines
+        parsers = [mock.patch('src.graph_utils.np', None)]
+        if graph_utils.np is not None:
+            parsers.append(mock.patch('src.graph_utils.np', graph_utils.np))
+        cases = ["3 2\n1 2 1.5\n+2 3 -4\n", "3 1\n1.0 2 1\n", "3 1\n1 2e0 1\n", "3 1\n1 2\n",
+                 "3 2\n1 2 1\n2 3 4 5\n", "3 1\n1 2 x\n", "3 1\na 2 1\n"]
+        results = []
+        for text in cases:
+            self.write_text(text)
+            outcomes = []
+            for parser in parsers:
+                with parser:
+                    try:
+                        outcomes.append(read_graph_from_file(self.filename).edges)
+                    except ValueError as e:
+                        outcomes.append(str(e))
+            
+            self.assertEqual(outcomes, [outcomes[0]] * len(parsers), text)
+            results.append(outcomes[0])
+        self.assertEqual(results[0], [(1, 2, 1.5), (2, 3, -4.0)])
+        self.assertEqual(results[1], "vertex id '1.0' is not an integer")
+        self.assertEqual(results[3], "edge lines must have 3 fields 'u v weight', found 2")
+
+    def test_missing_file(self):
+        with self.assertRaises(OSError):
+            read_graph_from_file(self.filename + ".missing")
+
+
+class TestGraph(unittest.TestCase):
+    def test_update_edge(self):
+        graph = Graph(3)
+        graph.add_edge(1, 2, 5)
+        graph.add_edge(2, 3, 1)
+        graph.add_edge(1, 2, 7)
+        version = graph.version
+        graph.update_edge(1, 2, 3)
+        
+        self.assertGreater(graph.version, version)
+        self.assertEqual(graph.edges, [(1, 2, 3), (2, 3, 1), (1, 2, 3)])
+        self.assertEqual(graph.adj_list[1], [(2, 3), (2, 3)])
+        self.assertEqual(graph.edge_weight(1, 2), 3)
+        self.assertEqual(graph.edge_weight(2, 1), INF)
+        with self.assertRaises(ValueError):
+            graph.update_edge(2, 1, 1)
+        
+        graph.add_edge(3, 1, 4)
+        graph.update_edge(3, 1, 2)
+        self.assertEqual(graph.edges[-1], (3, 1, 2))
+    
+    def test_remove_edge(self):
+        graph = Graph(3)
+        for u, v, w in [(1, 2, 5), (2, 3, 1), (1, 2, 7), (3, 1, 2)]:
+            graph.add_edge(u, v, w)
+        version = graph.version
+        graph.remove_edge(1, 2)
+        
+        self.assertGreater(graph.version, version)
+        self.assertEqual(sorted(graph.edges), [(2, 3, 1), (3, 1, 2)])
+        self.assertEqual(graph.adj_list[1], [])
+        self.assertEqual(graph.edge_weight(1, 2), INF)
+        graph.update_edge(3, 1, 4)
+        self.assertEqual(sorted(graph.edges), [(2, 3, 1), (3, 1, 4)])
+        with self.assertRaises(ValueError):
+            graph.remove_edge(1, 2)
+        
+        undirected = Graph(2, directed=False)
+        undirected.add_edge(1, 2, 5)
+        undirected.remove_edge(2, 1)
+        self.assertEqual(undirected.edges, [])
+    
+    def test_update_undirected_edge(self):
+        graph = Graph(2, directed=False)
+        graph.add_edge(1, 2, 5)
+        graph.update_edge(2, 1, 1)
+        
+        self.assertEqual(sorted(graph.edges), [(1, 2, 1), (2, 1, 1)])
+        self.assertEqual(graph.adj_list[1], [(2, 1)])
+    
+    def test_has_negative_cycle(self):
+        graph = Graph(3)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 3, -3)
+        self.assertFalse(graph.has_negative_cycle())
+        
+        graph.add_edge(3, 1, 1)
+        self.assertTrue(graph.has_negative_cycle())
+        self.assertTrue(graph.freeze().has_negative_cycle())
+    
+    def test_reversed(self):
+        graph = Graph(3)
+        graph.add_edge(1, 2, 4)
+        graph.add_edge(1, 3, 1)
+        
+        self.assertEqual(list(graph.reversed().neighbors(2)), [(1, 4)])
+        self.assertEqual(list(graph.freeze().reversed().neighbors(3)), [(1, 1)])
+        self.assertIs(graph.reversed(), graph.reversed())
+        
+        graph.add_edge(3, 2, 2)
+        self.assertEqual(sorted(graph.reversed().neighbors(2)), [(1, 4), (3, 2)])
+    
+    def test_empty_graph_has_no_negative_cycle(self):
+        self.assertFalse(Graph(0).has_negative_cycle())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.floyd_warshall import floyd_warshall
+from src.algorithms.incremental_apsp import IncrementalAPSP
+
+INF = float('inf')
+
+
+class TestIncrementalAPSP(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph(5)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            self.graph.add_edge(u, v, w)
+    
+    def assertMatchesRecompute(self, apsp):
+        expected, _, _ = floyd_warshall(apsp.graph)
+        n = apsp.graph.num_vertices
+        for i in range(1, n + 1):
+            self.assertEqual(apsp.dist[i][1:], expected[i][1:])
+    
+    def test_add_edge(self):
+        
+        apsp = IncrementalAPSP(self.graph)
+        updated = apsp.add_edge(1, 4, 3)
+        
+        self.assertEqual(apsp.dist[1][4], 3)
+        self.assertEqual(apsp.dist[1][5], 4)
+        self.assertEqual(updated, 2)
+        self.assertMatchesRecompute(apsp)
+        self.assertEqual(apsp.add_edge(1, 4, 10), 0)
+    
+    def test_decrease_edge(self):
+        
+        apsp = IncrementalAPSP(self.graph, engine="floyd_warshall")
+        apsp.decrease_edge(2, 4, 1)
+        
+        self.assertEqual(self.graph.edge_weight(2, 4), 1)
+        self.assertEqual(apsp.dist[1][4], 3)
+        self.assertMatchesRecompute(apsp)
+        with self.assertRaises(ValueError):
+            apsp.decrease_edge(2, 4, 5)
+        with self.assertRaises(ValueError):
+            apsp.decrease_edge(4, 1, 1)
+    
+    def test_negative_cycle_rejected(self):
+        
+        apsp = IncrementalAPSP(self.graph)
+        version = self.graph.version
+        with self.assertRaises(ValueError):
+            apsp.add_edge(5, 1, -7)
+        
+        self.assertEqual(self.graph.version, version)
+        self.assertEqual(len(self.graph.edges), 7)
+        apsp.add_edge(5, 1, -5)
+        self.assertMatchesRecompute(apsp)
+    
+    def test_random_update_stream(self):
+        
+        for seed in range(6):
+            rng = random.Random(seed)
+            directed = seed % 2 == 0
+            graph = Graph(12, directed=directed)
+            for _ in range(20):
+                graph.add_edge(rng.randint(1, 12), rng.randint(1, 12), rng.randint(1, 20))
+            apsp = IncrementalAPSP(graph)
+            for _ in range(25):
+                u, v, w = rng.randint(1, 12), rng.randint(1, 12), rng.randint(-2 if directed else 0, 15)
+                try:
+                    apsp.add_edge(u, v, w)
+                except ValueError:
+                    pass
+                self.assertMatchesRecompute(apsp)
+    
+    def test_initial_negative_cycle(self):
+        
+        graph = Graph(2)
+        graph.add_edge(1, 2, 1)
+        graph.add_edge(2, 1, -2)
+        with self.assertRaises(ValueError):
+            IncrementalAPSP(graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from src.graph_utils import Graph
-from src.algorithms.johnson import johnson
+from src.algorithms.johnson import (johnson, johnson_rows, compute_potentials, dijkstra_johnson,
+                                    LazyDistanceMatrix)
 
 INF = float('inf')
 
@@ -85,12 +86,160 @@ class TestJohnson(unittest.TestCase):
             for i in range(1, 6):
                 self.assertEqual(dist[i][i], 0)
     
+    def test_compact_graph(self):
+        
+        expected, _, _ = johnson(self.graph2)
+        dist, _, has_cycle = johnson(self.graph2.freeze())
+        
+        self.assertFalse(has_cycle)
+        self.assertEqual(dist, expected)
+        
+        dist, _, has_cycle = johnson(self.graph3.freeze())
+        self.assertTrue(has_cycle)
+        self.assertIsNone(dist)
+    
+    def test_graph_not_mutated(self):
+        
+        edges = list(self.graph2.edges)
+        johnson(self.graph2)
+        
+        self.assertEqual(self.graph2.num_vertices, 4)
+        self.assertEqual(self.graph2.edges, edges)
+        self.assertNotIn(0, self.graph2.adj_list)
+    
+    def test_parallel_workers(self):
+        
+        for graph in (self.graph1, self.graph2, self.graph4):
+            expected = johnson(graph)
+            self.assertEqual(johnson(graph, workers=2), expected)
+            self.assertEqual(johnson(graph.freeze(), workers=2), expected)
+    
+    def test_parallel_keeps_cell_types(self):
+        
+        float_graph = Graph(3)
+        float_graph.add_edge(1, 2, 1.5)
+        float_graph.add_edge(2, 3, 2.0)
+        for graph in (self.graph1, self.graph2, float_graph):
+            serial, _, _ = johnson(graph)
+            parallel, _, _ = johnson(graph, workers=2)
+            self.assertEqual(parallel, serial)
+            for serial_row, parallel_row in zip(serial, parallel):
+                self.assertEqual([type(d) for d in parallel_row], [type(d) for d in serial_row])
+    
+    def test_parallel_negative_cycle(self):
+        
+        dist, _, has_cycle = johnson(self.graph3, workers=2)
+        
+        self.assertTrue(has_cycle)
+        self.assertIsNone(dist)
+    
+    def test_potentials_skip_bellman_ford_without_negative_edges(self):
+        
+        h, has_cycle = compute_potentials(self.graph1)
+        
+        self.assertFalse(has_cycle)
+        self.assertEqual(h, [0] * 6)
+    
+    def test_potentials_make_weights_non_negative(self):
+        
+        h, has_cycle = compute_potentials(self.graph2)
+        
+        self.assertFalse(has_cycle)
+        for u, v, w in self.graph2.edges:
+            self.assertGreaterEqual(w + h[u] - h[v], 0)
+        self.assertEqual(self.graph2.num_vertices, 4)
+        self.assertNotIn(0, self.graph2.adj_list)
+    
+    def test_potentials_cached_until_add_edge(self):
+        
+        h, _ = compute_potentials(self.graph2)
+        self.assertIs(compute_potentials(self.graph2)[0], h)
+        
+        self.graph2.add_edge(4, 1, -10)
+        h2, has_cycle = compute_potentials(self.graph2)
+        
+        self.assertIsNot(h2, h)
+        self.assertTrue(has_cycle)
+    
+    def test_reweighted_dijkstra_with_potentials(self):
+        
+        h, _ = compute_potentials(self.graph2)
+        reweighted, _ = dijkstra_johnson(self.graph2, 1, h)
+        
+        # d(1, 4) = 1->2->3->4 = -3
+        self.assertEqual(reweighted[4] + h[4] - h[1], -3)
+    
+    def test_dijkstra_johnson_queue(self):
+        
+        h, _ = compute_potentials(self.graph2)
+        expected = dijkstra_johnson(self.graph2, 1, h)
+        
+        self.assertEqual(dijkstra_johnson(self.graph2, 1, h, queue="dary"), expected)
+    
     def test_relaxations_count(self):
        
         _, relaxations, _ = johnson(self.graph1)
         
         self.assertGreater(relaxations, 0)
     
+    def test_rows_generator(self):
+        
+        for graph in (self.graph1, self.graph2, self.graph4):
+            dist, _, _ = johnson(graph)
+            rows = johnson_rows(graph)
+            
+            self.assertEqual(next(rows), (1, dist[1]))
+            self.assertEqual(list(rows), [(s, dist[s]) for s in range(2, graph.num_vertices + 1)])
+    
+    def test_rows_generator_negative_cycle(self):
+        
+        with self.assertRaises(ValueError):
+            next(johnson_rows(self.graph3))
+    
+    def test_lazy_matrix(self):
+        
+        for graph in (self.graph1, self.graph2, self.graph4):
+            dist, _, _ = johnson(graph)
+            lazy = LazyDistanceMatrix(graph)
+            n = graph.num_vertices
+            
+            self.assertEqual(len(lazy), 0)
+            for s in range(1, n + 1):
+                for t in range(1, n + 1):
+                    self.assertEqual(lazy[s][t], dist[s][t])
+            self.assertEqual(lazy.stats()["misses"], n)
+            self.assertEqual(lazy.stats()["hits"], n * n - n)
+    
+    def test_lazy_matrix_lru_budget(self):
+        
+        lazy = LazyDistanceMatrix(self.graph1, memory_budget=2 * 6 * 8)
+        for s in (1, 2, 1, 3):
+            lazy[s]
+        
+        self.assertEqual(lazy.capacity, 2)
+        self.assertIn(1, lazy)
+        self.assertIn(3, lazy)
+        self.assertNotIn(2, lazy)
+        self.assertEqual(lazy.stats()["evictions"], 1)
+        with self.assertRaises(IndexError):
+            lazy[6]
+    
+    def test_lazy_matrix_prefetch(self):
+        
+        dist, _, _ = johnson(self.graph2)
+        for workers in (1, 2):
+            lazy = LazyDistanceMatrix(self.graph2)
+            lazy.prefetch([1, 3, 3, 4], workers=workers)
+            
+            self.assertEqual(len(lazy), 3)
+            self.assertEqual(list(lazy[3])[1:], dist[3][1:])
+            self.assertEqual(lazy.stats()["misses"], 3)
+    
+    def test_lazy_matrix_negative_cycle(self):
+        
+        with self.assertRaises(ValueError):
+            LazyDistanceMatrix(self.graph3)
+    
     def test_vs_floyd_warshall(self):
         
         from src.algorithms.floyd_warshall import floyd_warshall
@@ -0,0 +1,63 @@
+import random
+import unittest
+from src.algorithms.priority_queues import HeapqQueue, IndexedDaryHeap, make_queue
+
+
+class TestPriorityQueues(unittest.TestCase):
+    def drain(self, queue):
+        popped = []
+        while len(queue):
+            popped.append(queue.pop())
+        return popped
+    
+    def test_pops_in_key_order(self):
+        
+        random.seed(1)
+        keys = [random.randint(0, 50) for _ in range(100)]
+        for queue in (HeapqQueue(), IndexedDaryHeap(100), IndexedDaryHeap(100, d=2)):
+            for item, key in enumerate(keys):
+                queue.push(key, item)
+            popped = self.drain(queue)
+            
+            self.assertEqual([k for k, _ in popped], sorted(keys))
+            self.assertEqual(sorted(item for _, item in popped), list(range(100)))
+    
+    def test_decrease_key(self):
+        
+        for queue in (HeapqQueue(), IndexedDaryHeap(4)):
+            queue.push(10, 1)
+            queue.push(5, 2)
+            queue.push(3, 1)
+            queue.push(7, 1)  # larger key is ignored
+            
+            self.assertEqual(len(queue), 2)
+            self.assertEqual(self.drain(queue), [(3, 1), (5, 2)])
+            self.assertEqual(queue.decrease_keys, 1)
+    
+    def test_indexed_heap_has_no_stale_entries(self):
+        
+        dary = IndexedDaryHeap(10)
+        lazy = HeapqQueue()
+        for queue in (dary, lazy):
+            for key in range(10, 0, -1):
+                queue.push(key, 3)
+            queue.push(20, 4)
+            self.drain(queue)
+        
+        self.assertEqual(dary.stats()["max_size"], 2)
+        self.assertEqual(dary.stale_pops, 0)
+        self.assertEqual(lazy.stale_pops, 9)
+        self.assertEqual(lazy.pushes, 11)
+        self.assertEqual(dary.pushes, 2)
+    
+    def test_make_queue(self):
+        
+        self.assertIsInstance(make_queue("dary", 5), IndexedDaryHeap)
+        queue = HeapqQueue()
+        self.assertIs(make_queue(queue, 5), queue)
+        with self.assertRaises(ValueError):
+            make_queue("fibonacci", 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from src.graph_utils import Graph
+from src.algorithms.dijkstra import dijkstra
+from src.algorithms.johnson import johnson
+from src.algorithms.priority_queues import HeapqQueue
+from src.algorithms.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph(5)
+        for u, v, w in [(1, 2, 2), (1, 3, 4), (2, 3, 1), (2, 4, 7), (3, 5, 3), (4, 5, 1), (5, 4, 2)]:
+            self.graph.add_edge(u, v, w)
+        self.cache = ResultCache(max_entries=3)
+    
+    def test_graph_version(self):
+        
+        version = self.graph.version
+        self.graph.add_edge(5, 1, 1)
+        
+        self.assertGreater(self.graph.version, version)
+        self.assertNotEqual(Graph(2).version, Graph(2).version)
+        compact = self.graph.freeze()
+        self.assertEqual(compact.version, compact.freeze().version)
+    
+    def test_repeat_query_hits(self):
+        
+        first = self.cache.query(self.graph, "dijkstra", 1)
+        second = self.cache.query(self.graph, "dijkstra", 1)
+        
+        self.assertIs(first, second)
+        self.assertEqual(first, dijkstra(self.graph, 1))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+    
+    def test_key_includes_source_and_options(self):
+        
+        self.cache.query(self.graph, "bellman_ford", 1)
+        self.cache.query(self.graph, "bellman_ford", 2)
+        self.cache.query(self.graph, "bellman_ford", 1, strategy="spfa")
+        
+        self.assertEqual(self.cache.stats()["misses"], 3)
+        self.assertEqual(self.cache.query(self.graph, "johnson"), johnson(self.graph))
+    
+    def test_mutation_invalidates(self):
+        
+        before, _ = self.cache.query(self.graph, "dijkstra", 1)
+        self.graph.add_edge(1, 5, 1)
+        after, _ = self.cache.query(self.graph, "dijkstra", 1)
+        
+        self.assertEqual(before[5], 6)
+        self.assertEqual(after[5], 1)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+    
+    def test_lru_eviction(self):
+        
+        for source in (1, 2, 3, 1, 4):
+            self.cache.query(self.graph, "dijkstra", source)
+        
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+        self.cache.query(self.graph, "dijkstra", 1)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+        self.cache.query(self.graph, "dijkstra", 2)
+        self.assertEqual(self.cache.stats()["misses"], 5)
+    
+    def test_bad_arguments(self):
+        
+        with self.assertRaises(ValueError):
+            self.cache.query(self.graph, "dijkstra")
+        with self.assertRaises(ValueError):
+            self.cache.query(self.graph, "a_star", 1)
+        with self.assertRaises(ValueError):
+            ResultCache(max_entries=0)
+    
+    def test_unhashable_option_rejected(self):
+        
+        with self.assertRaises(ValueError) as cm:
+            self.cache.query(self.graph, "delta_stepping", 1, delta=[1.0])
+        
+        self.assertIn("delta", str(cm.exception))
+        self.assertEqual(len(self.cache), 0)
+    
+    def test_object_option_rejected(self):
+        
+        with self.assertRaises(ValueError) as cm:
+            self.cache.query(self.graph, "dijkstra", 1, queue=HeapqQueue())
+        
+        self.assertIn("queue", str(cm.exception))
+        self.assertEqual(self.cache.stats()["misses"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()